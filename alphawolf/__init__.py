@@ -0,0 +1,6 @@
+"""
+🐺 ALPHAWOLF ENGINE
+
+Shared, vectorized building blocks for the scripts in `valuations/`.
+Each module is a self-contained weapon; import only what the hunt needs.
+"""
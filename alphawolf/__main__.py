@@ -0,0 +1,5 @@
+import sys
+
+from alphawolf.cli import main
+
+sys.exit(main())
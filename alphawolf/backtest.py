@@ -0,0 +1,110 @@
+"""
+🐺 ALPHAWOLF: SIGNAL BACKTEST (DID THE HUNT PAY?)
+
+The methodology's rule: "If P50 > Price + Margin of Safety, we hunt."
+This replays it. Inputs:
+
+    distributions: the dated snapshots in the reprice store
+                   (run --save on each valuation date)
+    prices:        a local CSV of historical closes, long format
+                   (date,name,price) or wide (date,<model>,<model>,...)
+
+On every price date, each ticker is judged with the latest snapshot dated
+on or before that day (no look-ahead). The whole grid is evaluated at once:
+
+    signal[d, t, k]  = P50[d, t] > price[d, t] * (1 + mos[k])
+    forward[d, t]    = price[d + horizon, t] / price[d, t] - 1
+
+and reduced to hit rate (forward > 0 when signalled), mean forward return
+and the unconditional baseline, per ticker x threshold. Tuning the margin
+of safety is one sweep over `mos`.
+"""
+import numpy as np
+import pandas as pd
+
+from alphawolf.reprice import load_distribution, stored_dates
+
+DEFAULT_MOS = (0.0, 0.10, 0.20, 0.30, 0.50)
+
+
+def load_price_history(path):
+    """Dates x tickers close matrix (wide DataFrame, DatetimeIndex, lower-case columns)."""
+    frame = pd.read_csv(path)
+    frame.columns = [c.lower() for c in frame.columns]
+    date_col = 'date' if 'date' in frame.columns else frame.columns[0]
+    frame[date_col] = pd.to_datetime(frame[date_col])
+    key = 'name' if 'name' in frame.columns else ('ticker' if 'ticker' in frame.columns else None)
+    if key is not None:
+        frame = frame.pivot_table(index=date_col, columns=key, values='price', aggfunc='last')
+        frame.columns = [str(c).lower() for c in frame.columns]
+    else:
+        frame = frame.set_index(date_col)
+    return frame.sort_index()
+
+
+def p50_history(names, dates):
+    """
+    (dates, tickers) P50 from the latest snapshot on or before each date
+    (NaN before a ticker's first snapshot).
+    """
+    day = np.asarray(dates, dtype='datetime64[D]')
+    out = np.full((len(day), len(names)), np.nan)
+    for j, name in enumerate(names):
+        snaps = stored_dates(name)
+        if not snaps:
+            continue
+        p50 = np.array([load_distribution(name, d).p50 for d in snaps])
+        idx = np.searchsorted(np.asarray(snaps, dtype='datetime64[D]'), day, side='right') - 1
+        out[:, j] = np.where(idx >= 0, p50[np.maximum(idx, 0)], np.nan)
+    return out
+
+
+def forward_returns(prices, dates, horizon_days):
+    """Return from each date to the first date at least horizon_days later (NaN past the end)."""
+    dates = np.asarray(dates, dtype='datetime64[ns]')
+    ahead = np.searchsorted(dates, dates + np.timedelta64(int(horizon_days), 'D'), side='left')
+    valid = ahead < len(dates)
+    fwd = np.full(prices.shape, np.nan)
+    fwd[valid] = prices[ahead[valid]] / prices[valid] - 1.0
+    return fwd
+
+
+def backtest(prices, p50, mos=DEFAULT_MOS, horizon_days=90, names=None):
+    """
+    Evaluate the hunt rule on the full (dates x tickers x thresholds) grid.
+
+    prices: wide DataFrame from load_price_history (or an array with names).
+    p50:    (dates, tickers) array aligned with prices (p50_history).
+    Returns one row per (ticker, mos) plus an 'ALL' row per mos.
+    """
+    if isinstance(prices, pd.DataFrame):
+        names = list(prices.columns) if names is None else names
+        dates, px = prices.index.to_numpy(), prices.to_numpy(dtype=np.float64)
+    else:
+        px = np.asarray(prices, dtype=np.float64)
+        dates = np.arange(px.shape[0]).astype('datetime64[D]')
+    mos = np.asarray(mos, dtype=np.float64)
+
+    fwd = forward_returns(px, dates, horizon_days)                       # (D, T)
+    usable = ~np.isnan(fwd) & ~np.isnan(p50) & ~np.isnan(px)             # (D, T)
+    signal = (p50[:, :, None] > px[:, :, None] * (1.0 + mos)) & usable[:, :, None]  # (D, T, K)
+    fwd0 = np.where(usable, fwd, 0.0)[:, :, None]
+
+    n_sig = signal.sum(axis=0)                                           # (T, K)
+    hits = (signal & (fwd0 > 0)).sum(axis=0)
+    ret_sum = (signal * fwd0).sum(axis=0)
+    base_n = usable.sum(axis=0)                                          # (T,)
+    base_ret = np.where(usable, fwd, 0.0).sum(axis=0)
+
+    def rows(label, n, h, r, bn, br):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return pd.DataFrame({
+                'name': label, 'mos': mos, 'signals': n, 'observations': bn,
+                'hit_rate': h / n, 'mean_forward': r / n, 'baseline_forward': br / bn,
+            })
+
+    frames = [rows(name, n_sig[j], hits[j], ret_sum[j], base_n[j], base_ret[j]) for j, name in enumerate(names)]
+    frames.append(rows('ALL', n_sig.sum(0), hits.sum(0), ret_sum.sum(0), base_n.sum(), base_ret.sum()))
+    out = pd.concat(frames, ignore_index=True)
+    out['edge'] = out['mean_forward'] - out['baseline_forward']
+    return out
@@ -0,0 +1,451 @@
+"""
+🐺 ALPHAWOLF: COMMAND LINE
+
+    python -m alphawolf list
+    python -m alphawolf run boxer --n 200000 --no-plot --json
+    python -m alphawolf run boxer --n 5000000 --shards 32 --workers 8 --json
+    python -m alphawolf lots export.csv --coin BTC --out lots.csv
+    python -m alphawolf reprice boxer --price 70 72.5 75
+    python -m alphawolf implied boxer wacc_dist --bounds 0.065 0.30
+    python -m alphawolf backtest prices.csv --mos 0 0.1 0.2 0.3 --horizon 90
+    python -m alphawolf audit export.csv --coin BTC --out BTC_Audit_Detailed.parquet
+    python -m alphawolf pnl exports/ --coins BTC ETH --spot BTC=1499166.14
+    python -m alphawolf golden check --export export.csv
+    python -m alphawolf screen universe.csv --n 20000 --top 25
+    python -m alphawolf greeks richemont
+
+Startup is kept lean on purpose: only the standard library is imported at
+module level. numpy is imported when a model actually runs, and
+matplotlib/seaborn only when a plot is requested (the scripts import them
+inside their `if PLOT:` block). Timings are reported so regressions show up.
+"""
+import argparse
+import json
+import sys
+import time
+
+
+def _cmd_list(args):
+    from alphawolf.models import MODELS
+
+    for name, spec in sorted(MODELS.items()):
+        print(f"{name:<10} {spec.currency:<4} {spec.script}")
+    return 0
+
+
+def _cmd_run(args):
+    start = time.perf_counter()
+    import numpy  # noqa: F401  (timed on purpose: the only heavy import of a stats run)
+    from alphawolf.models import run_model, summarize
+    import_seconds = time.perf_counter() - start
+
+    if args.shards:
+        from alphawolf.shard import run_sharded
+
+        run = run_sharded(args.model, simulations=args.n, shards=args.shards, workers=args.workers)
+    else:
+        run = run_model(args.model, simulations=args.n, plot=args.plot, quiet=args.json)
+    stats = summarize(run.values, run.price)
+    if args.save:
+        from alphawolf.reprice import save_distribution
+
+        save_distribution(run.name, run.values, run.currency, run.price)
+    timings = {
+        'import_seconds': round(import_seconds, 4),
+        'run_seconds': round(run.seconds, 4),
+        'total_seconds': round(time.perf_counter() - start, 4),
+    }
+
+    att = None
+    if args.attribution:
+        from alphawolf.attribution import sotp_attribution
+
+        att = sotp_attribution(run)
+
+    if args.json:
+        extra = {} if att is None else {'attribution': {
+            label: dict(zip(att.buckets, (float(x) for x in row))) for label, row in zip(att.labels, att.means)}}
+        print(json.dumps({'model': run.name, 'currency': run.currency, **stats, **timings, **extra}))
+    else:
+        if args.shards:  # Shards run quietly; print the merged report.
+            print(f"🐺 SIMULATION REPORT [N={stats['n']}, {args.shards} shards]")
+            print(f"Current Price: {stats['price']:,.2f} {run.currency}")
+            print("-" * 30)
+            print(f"Mean Fair Value:   {stats['mean']:,.2f}")
+            print(f"Median Fair Value: {stats['p50']:,.2f}")
+            print(f"P10 (Bear Case):   {stats['p10']:,.2f}")
+            print(f"P90 (Bull Case):   {stats['p90']:,.2f}")
+            print("-" * 30)
+            print(f"PROBABILITY OF PROFIT: {stats['prob_profit']:.1%}")
+            print(f"Expected Upside (Mean): {stats['upside_mean']:.1%}")
+        if att is not None:
+            from alphawolf.attribution import format_attribution
+
+            print()
+            print('\n'.join(format_attribution(att, run.currency)))
+        print(f"⏱  imports {timings['import_seconds']:.3f}s | model {timings['run_seconds']:.3f}s",
+              file=sys.stderr)
+    return 0
+
+
+def _read_exports(path, workers=None):
+    """One export file as-is; a directory or glob is merged and deduplicated."""
+    import os
+
+    if os.path.isdir(path) or any(c in path for c in '*?['):
+        from alphawolf.ledger.ingest import load_exports
+
+        return load_exports(path, workers=workers)
+    import pandas as pd
+
+    return pd.read_csv(path)
+
+
+def _cmd_reprice(args):
+    from alphawolf.models import MODELS
+    from alphawolf.reprice import FileQuoteSource, cached_distribution, reprice
+
+    source = FileQuoteSource(args.quotes) if args.quotes else None
+    names = args.models or (sorted(MODELS) if source is None else source.names())
+    print(f"{'model':<10} {'price':>12} {'P(profit)':>10} {'upside':>9} {'edge P50':>9}")
+    for name in names:
+        dist = cached_distribution(name, simulations=args.n, refresh=args.refresh)
+        if args.price:
+            prices = args.price
+        elif source is not None:
+            prices = source.history(name)
+        else:
+            prices = [dist.model_price]
+        start = time.perf_counter()
+        sig = reprice(dist, prices)
+        micros = (time.perf_counter() - start) * 1e6
+        for i in range(len(sig['price'])):
+            print(f"{name:<10} {sig['price'][i]:>12,.2f} {sig['prob_profit'][i]:>10.1%} "
+                  f"{sig['upside_mean'][i]:>9.1%} {sig['edge_p50'][i]:>9.1%}")
+        print(f"{'':<10} ({dist.currency}, {dist.sorted.size} paths as of {dist.as_of}, {micros:.0f}us)",
+              file=sys.stderr)
+    return 0
+
+
+def _cmd_implied(args):
+    import numpy as np
+    from alphawolf.implied import implied_input
+
+    try:
+        res = implied_input(args.model, args.variable, statistic=args.stat, bounds=args.bounds, mode=args.mode,
+                            price=args.price, simulations=args.n, per_path=not args.no_paths)
+    except (KeyError, ValueError) as exc:
+        raise SystemExit(f"implied: {exc.args[0]}")
+    print(f"🐺 IMPLIED {res.variable} [{res.model}, {res.statistic.upper()} = {res.price:,.2f}]")
+    print("-" * 30)
+    if np.isnan(res.value):
+        print(f"No root in bracket {res.bounds[0]:g} .. {res.bounds[1]:g} (widen --bounds).")
+    else:
+        extra = f" (shift {res.shift:+.6g})" if args.mode == 'shift' else ""
+        print(f"Implied {res.variable}: {res.value:.6g}{extra}")
+    if res.per_path is not None:
+        solved = ~np.isnan(res.per_path)
+        print(f"Per-path solved: {solved.mean():.1%} of {res.per_path.size} paths")
+        if solved.any():
+            p10, p50, p90 = np.percentile(res.per_path[solved], [10, 50, 90])
+            print(f"Per-path implied P10/P50/P90: {p10:.6g} / {p50:.6g} / {p90:.6g}")
+    print(f"Model runs: {res.runs}")
+    return 0
+
+
+def _cmd_backtest(args):
+    from alphawolf.backtest import backtest, load_price_history, p50_history
+
+    prices = load_price_history(args.prices)
+    if args.models:
+        prices = prices[[m.lower() for m in args.models]]
+    result = backtest(prices, p50_history(list(prices.columns), prices.index), mos=args.mos,
+                      horizon_days=args.horizon)
+    print(f"🐺 BACKTEST [P50 > Price x (1 + MoS), {args.horizon}d forward]")
+    print("-" * 30)
+    print(result.to_string(index=False, float_format=lambda x: f"{x:.3f}"))
+    if args.out:
+        result.to_csv(args.out, index=False)
+        print(f"Backtest saved to {args.out}")
+    return 0
+
+
+def _cmd_lots(args):
+    import numpy as np
+    from alphawolf.ledger.actions import DISPOSALS, prepare
+    from alphawolf.ledger.lots import METHODS, match_lots
+
+    ledger = prepare(_read_exports(args.export, args.workers), coin=args.coin)
+    if args.transfer_window:
+        from alphawolf.ledger.transfers import book_fees, match_transfers
+
+        transfers = match_transfers(ledger, window=args.transfer_window)
+        ledger = book_fees(ledger, transfers)
+        fees = transfers.pairs['gap'].clip(lower=0)
+        print(f"Transfers: {len(transfers.pairs)} matched ({int((fees > 0).sum())} fees, "
+              f"{fees.sum():.8f} {args.coin}) | {len(transfers.unmatched_out)} sends and "
+              f"{len(transfers.unmatched_in)} receives unmatched")
+    result = match_lots(ledger['Balance delta'], ledger['Value amount'], ledger['action'])
+
+    proceeds = ledger['Value amount'].to_numpy()
+    disposed = np.isin(ledger['action'].to_numpy(), DISPOSALS)
+    print(f"🐺 COST BASIS COMPARISON [{args.coin}, {len(ledger)} rows]")
+    print("-" * 30)
+    for method in METHODS:
+        basis = result.cost_basis[method]
+        gain = proceeds[disposed].sum() - basis[disposed].sum()
+        held = result.open_lots[method]
+        print(f"{method}: Cost Disposed R {basis.sum():,.2f} | Gain R {gain:,.2f} | "
+              f"Held {held['qty'].sum():.8f} @ R {(held['qty'] * held['unit_cost_zar']).sum():,.2f}")
+    if args.out:
+        matches = result.matches.assign(timestamp=ledger['Timestamp (UTC)'].to_numpy()[result.matches['disposal_row']])
+        matches.to_csv(args.out, index=False)
+        print(f"Matched lots saved to {args.out}")
+    return 0
+
+
+def _cmd_audit(args):
+    from alphawolf.ledger.actions import prepare
+    from alphawolf.ledger.audit import avco_audit, write_audit
+
+    ledger = prepare(_read_exports(args.export, args.workers), coin=args.coin)
+    start = time.perf_counter()
+    audit = avco_audit(ledger, coin=args.coin).to_frame(ledger, coin=args.coin)
+    scan_seconds = time.perf_counter() - start
+    write_audit(audit, args.out)
+    last = audit.iloc[-1] if len(audit) else None
+    print(f"🐺 AVCO AUDIT [{args.coin}, {len(audit)} rows]")
+    print("-" * 30)
+    if last is not None:
+        print(f"Exchange Bal: {last['Exchange_Bal']:.8f}")
+        print(f"External Bal (Hacked): {last['External_Bal']:.8f}")
+        print(f"Pool Avg Cost: {last['Pool_Avg_Cost']:.2f}")
+    print(f"Audit saved to {args.out} (scan {scan_seconds:.3f}s, write {time.perf_counter() - start - scan_seconds:.3f}s)")
+
+    if args.fixed:
+        from alphawolf.ledger.fixed import avco_audit_fixed, divergence_report
+
+        start = time.perf_counter()
+        exact = avco_audit_fixed(ledger, coin=args.coin).to_frame(ledger, coin=args.coin)
+        print(f"\n🐺 FIXED-POINT CHECK (sats/gwei + cents, scan {time.perf_counter() - start:.3f}s)")
+        print("-" * 30)
+        print(divergence_report(audit, exact, coin=args.coin).to_string(index=False))
+    return 0
+
+
+def _parse_spot(items):
+    spot = {}
+    for item in items or ():
+        coin, _, price = item.partition('=')
+        if not price:
+            raise SystemExit(f"--spot expects COIN=PRICE, got '{item}'")
+        spot[coin.upper()] = float(price)
+    return spot
+
+
+def _cmd_pnl(args):
+    import pandas as pd
+    from alphawolf.ledger.reporting import build_pnl, tax_year_report
+
+    spot = _parse_spot(args.spot)
+    export = _read_exports(args.export, args.workers)
+    realized, unrealized = build_pnl(export, coins=args.coins, spot_zar=spot,
+                                     transfer_window=args.transfer_window, price_dir=args.prices)
+    if args.timeline:
+        from alphawolf.ledger.actions import prepare
+        from alphawolf.ledger.prices import holdings_timeline, load_prices
+
+        frames = [holdings_timeline(prepare(export, coin=c), load_prices(c, args.prices)).assign(currency=c)
+                  for c in args.coins]
+        pd.concat(frames, ignore_index=True).to_csv(args.timeline, index=False)
+        print(f"Daily holdings timeline saved to {args.timeline}")
+    if realized.empty:
+        print("No disposals found.")
+        return 0
+
+    report = tax_year_report(realized)
+    cols = ['proceeds_zar', f'cost_{args.method}', f'pnl_{args.method}']
+    print(f"🐺 REALIZED PNL BY TAX YEAR [{args.method}]")
+    print("-" * 30)
+    for (year, coin), block in report.groupby(['tax_year', 'currency']):
+        proceeds, cost, pnl = block[cols].sum()
+        print(f"{year - 1}/{year} {coin}: Proceeds R {proceeds:,.2f} | Cost R {cost:,.2f} | PnL R {pnl:,.2f}")
+    if not unrealized.empty:
+        print(f"\n🐺 UNREALIZED PNL (MARK TO MARKET) [{args.method}]")
+        print("-" * 30)
+        for row in unrealized[unrealized['method'] == args.method].itertuples():
+            print(f"{row.currency}: Held {row.qty:.8f} | Cost R {row.cost_zar:,.2f} | "
+                  f"Value R {row.market_value_zar:,.2f} | PnL R {row.unrealized_zar:,.2f}")
+    if args.out:
+        realized.to_csv(args.out, index=False)
+        print(f"Realized disposals saved to {args.out}")
+    return 0
+
+
+def _cmd_golden(args):
+    from alphawolf import golden
+    from alphawolf.models import MODELS
+
+    names = args.models or sorted(MODELS)
+    export = _read_exports(args.export or golden.SAMPLE_EXPORT)
+    if args.action == 'capture':
+        for name in names:
+            record = golden.capture_model(name, simulations=args.n)
+            print(f"{name:<10} {record['n']:>9} paths  {record['sha256'][:12]}")
+        golden.capture_audit(export, coin=args.coin)
+        print(f"audit_{args.coin.lower():<4} captured")
+        print(f"Golden records written to {golden.GOLDEN_DIR}")
+        return 0
+
+    try:
+        checks = [golden.check_model(name, simulations=args.n, quantile_tol=args.tol, require_exact=args.exact)
+                  for name in names]
+        checks.append(golden.check_audit(export, coin=args.coin))
+    except FileNotFoundError as exc:
+        raise SystemExit(f"golden: {exc}")
+    print(f"{'name':<10} {'exact':>6} {'KS':>8} {'limit':>8} {'q-shift':>8}  result")
+    for c in checks:
+        print(f"{c.name:<10} {str(c.exact):>6} {c.ks:>8.4f} {c.ks_limit:>8.4f} {c.quantile_shift:>8.4f}  "
+              f"{'ok' if c.passed else 'FAIL'}")
+    return 0 if all(c.passed for c in checks) else 1
+
+
+def _cmd_screen(args):
+    from alphawolf.screen import screen
+
+    start = time.perf_counter()
+    ranked = screen(args.universe, simulations=args.n, seed=args.seed, chunk=args.chunk)
+    seconds = time.perf_counter() - start
+    print(f"🐺 SCREEN [{len(ranked)} tickers, N={args.n}]")
+    print("-" * 30)
+    print(ranked.head(args.top).to_string(index=False, float_format=lambda x: f"{x:,.3f}"))
+    if args.out:
+        ranked.to_csv(args.out, index=False)
+        print(f"Ranking saved to {args.out}")
+    print(f"⏱  screen {seconds:.3f}s", file=sys.stderr)
+    return 0
+
+
+def _cmd_greeks(args):
+    from alphawolf.sensitivity import sensitivities, summarize_grads
+
+    try:
+        sens = sensitivities(args.model, variables=args.variables or None, simulations=args.n)
+    except (KeyError, ValueError) as exc:
+        raise SystemExit(f"greeks: {exc.args[0]}")
+    print(f"🐺 PATHWISE SENSITIVITIES [{sens.model}, N={sens.values.size}, d fair value / d input]")
+    print("-" * 30)
+    print(f"{'input':<28} {'mean':>12} {'P10':>12} {'P50':>12} {'P90':>12}")
+    for var, row in summarize_grads(sens).items():
+        print(f"{var:<28} {row['mean']:>12.4g} {row['p10']:>12.4g} {row['p50']:>12.4g} {row['p90']:>12.4g}")
+    if sens.skipped:
+        print(f"Not differentiable pathwise: {', '.join(sens.skipped)}")
+    print(f"⏱  model {sens.seconds:.3f}s (differentiated run; {sens.runs} runs in total)", file=sys.stderr)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='alphawolf', description='🐺 AlphaWolf valuation runner')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    sub.add_parser('list', help='List registered models').set_defaults(func=_cmd_list)
+
+    run = sub.add_parser('run', help='Run a registered valuation model')
+    run.add_argument('model', help='Model name (see `list`)')
+    run.add_argument('--n', type=int, default=None, help='Override SIMULATIONS')
+    run.add_argument('--no-plot', dest='plot', action='store_false', help='Skip matplotlib/seaborn')
+    run.add_argument('--json', action='store_true', help='Print stats as one JSON line')
+    run.add_argument('--save', action='store_true', help='Store the distribution for reprice/backtest')
+    run.add_argument('--shards', type=int, default=None, help='Split SIMULATIONS into this many seeded shards')
+    run.add_argument('--workers', type=int, default=None, help='Processes for --shards (does not change results)')
+    run.add_argument('--no-attribution', dest='attribution', action='store_false',
+                     help='Skip the per-bucket SOTP segment table')
+    run.set_defaults(func=_cmd_run)
+
+    rep = sub.add_parser('reprice', help='Re-score stored distributions against new prices (no rerun)')
+    rep.add_argument('models', nargs='*', help='Models to reprice (default: all, or those in --quotes)')
+    rep.add_argument('--price', type=float, nargs='+', default=None, help='One or more prices to test')
+    rep.add_argument('--quotes', default=None, help='Quote file: CSV with name,price[,timestamp]')
+    rep.add_argument('--n', type=int, default=None, help='SIMULATIONS of the distribution (a stored one of another size is rebuilt)')
+    rep.add_argument('--refresh', action='store_true', help='Rerun the model and store a fresh distribution')
+    rep.set_defaults(func=_cmd_reprice)
+
+    imp = sub.add_parser('implied', help='Reverse DCF: the input value the price implies')
+    imp.add_argument('model', help='Model name (see `list`)')
+    imp.add_argument('variable', help='Script variable to solve for, e.g. wacc_dist')
+    imp.add_argument('--stat', default='p50', choices=['p50', 'mean'], help='Statistic matched to the price')
+    imp.add_argument('--bounds', type=float, nargs=2, default=None, help='Search bracket LO HI')
+    imp.add_argument('--mode', default='set', choices=['set', 'shift'], help='Replace the input, or shift its distribution')
+    imp.add_argument('--price', type=float, default=None, help='Target price (default: the script price)')
+    imp.add_argument('--n', type=int, default=None, help='Override SIMULATIONS')
+    imp.add_argument('--no-paths', action='store_true', help='Skip the per-path solve')
+    imp.set_defaults(func=_cmd_implied)
+
+    bt = sub.add_parser('backtest', help='Replay stored distributions against historical prices')
+    bt.add_argument('prices', help='Price history CSV: date,name,price (or date + one column per model)')
+    bt.add_argument('--models', nargs='+', default=None, help='Subset of tickers/models')
+    bt.add_argument('--mos', type=float, nargs='+', default=[0.0, 0.10, 0.20, 0.30, 0.50],
+                    help='Margin-of-safety thresholds to sweep')
+    bt.add_argument('--horizon', type=int, default=90, help='Forward-return horizon in calendar days')
+    bt.add_argument('--out', default=None, help='Write the results table to this CSV')
+    bt.set_defaults(func=_cmd_backtest)
+
+    lots = sub.add_parser('lots', help='Compare FIFO/LIFO/HIFO/AVCO cost basis for an exchange export')
+    lots.add_argument('export', help='Exchange export CSV, or a directory/glob of exports')
+    lots.add_argument('--workers', type=int, default=None, help='Parser processes for a directory of exports')
+    lots.add_argument('--coin', default='BTC', help='Coin to track (BTC, ETH)')
+    lots.add_argument('--out', default=None, help='Write matched lots to this CSV')
+    lots.add_argument('--transfer-window', default=None, help='Pair sends/receives within this window (e.g. 7D)')
+    lots.set_defaults(func=_cmd_lots)
+
+    audit = sub.add_parser('audit', help='bitcoin_avco.py audit trail, written as CSV/Parquet/Arrow')
+    audit.add_argument('export', help='Exchange export CSV, or a directory/glob of exports')
+    audit.add_argument('--coin', default='BTC', help='Coin to track (BTC, ETH)')
+    audit.add_argument('--out', default='BTC_Audit_Detailed.csv', help='.csv, .parquet or .arrow (pyarrow for the last two)')
+    audit.add_argument('--workers', type=int, default=None, help='Parser processes for a directory of exports')
+    audit.add_argument('--fixed', action='store_true', help='Re-run in exact integer units and report divergence')
+    audit.set_defaults(func=_cmd_audit)
+
+    pnl = sub.add_parser('pnl', help='Realized/unrealized PnL by SA tax year for an exchange export')
+    pnl.add_argument('export', help='Exchange export CSV, or a directory/glob of exports')
+    pnl.add_argument('--workers', type=int, default=None, help='Parser processes for a directory of exports')
+    pnl.add_argument('--coins', nargs='+', default=['BTC'], help='Coins to report (BTC ETH)')
+    pnl.add_argument('--spot', nargs='*', default=None, help='Spot prices in ZAR, e.g. BTC=1499166.14')
+    pnl.add_argument('--method', default='AVCO', choices=['FIFO', 'LIFO', 'HIFO', 'AVCO'],
+                     help='Cost-basis method for the printed summary')
+    pnl.add_argument('--out', default=None, help='Write every disposal (all methods) to this CSV')
+    pnl.add_argument('--transfer-window', default=None, help='Pair sends/receives within this window (e.g. 7D)')
+    pnl.add_argument('--prices', default=None, help='Local price store directory (<COIN>_ZAR.csv/.parquet)')
+    pnl.add_argument('--timeline', default=None, help='Write daily holdings value to this CSV (needs --prices)')
+    pnl.set_defaults(func=_cmd_pnl)
+
+    gold = sub.add_parser('golden', help='Capture or check golden distributions (regression harness)')
+    gold.add_argument('action', choices=['capture', 'check'])
+    gold.add_argument('models', nargs='*', help='Models (default: all registered)')
+    gold.add_argument('--n', type=int, default=None, help='SIMULATIONS (check default: the golden count)')
+    gold.add_argument('--export', default=None, help='Exchange export for the AVCO audit golden (default: golden/export_sample.csv)')
+    gold.add_argument('--coin', default='BTC', help='Coin for the audit golden')
+    gold.add_argument('--exact', action='store_true', help='Fail unless outputs are bit-identical')
+    gold.add_argument('--tol', type=float, default=0.05, help='P10/P50/P90 tolerance as a fraction of the IQR')
+    gold.set_defaults(func=_cmd_golden)
+
+    scr = sub.add_parser('screen', help='Template DCF across a universe file, ranked by P(profit) and P10 upside')
+    scr.add_argument('universe', help='CSV: ticker,price,shares,base_revenue,net_debt[,distribution params]')
+    scr.add_argument('--n', type=int, default=50000, help='SIMULATIONS per ticker')
+    scr.add_argument('--seed', type=int, default=42, help='Root seed (chunk seeds are spawned from it)')
+    scr.add_argument('--chunk', type=int, default=32, help='Tickers per vectorized block (bounds memory)')
+    scr.add_argument('--top', type=int, default=25, help='Rows to print')
+    scr.add_argument('--out', default=None, help='Write the full ranking to this CSV')
+    scr.set_defaults(func=_cmd_screen)
+
+    grk = sub.add_parser('greeks', help='Pathwise d(fair value)/d(input) for every input in one run')
+    grk.add_argument('model', help='Model name (see `list`)')
+    grk.add_argument('variables', nargs='*', default=None, help='Inputs (default: every top-level draw/constant)')
+    grk.add_argument('--n', type=int, default=None, help='Override SIMULATIONS')
+    grk.set_defaults(func=_cmd_greeks)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
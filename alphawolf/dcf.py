@@ -0,0 +1,153 @@
+"""
+🐺 ALPHAWOLF: STOCHASTIC MULTI-PERIOD DCF KERNEL
+
+val_boxer.py and val_cohr.py draw one growth rate and one margin per path
+and hold them for all five years. Here both follow a path of their own:
+
+    g_1 = growth draw
+    g_t = g_{t-1} + kappa_g * (g_target - g_{t-1}) + vol_g * z_t    (AR(1) fade)
+    m_t = m_{t-1} + kappa_m * (m_target - m_{t-1}) + vol_m * z'_t
+
+kappa = 0 and vol = 0 reproduces the static scripts exactly; kappa > 0 fades
+growth toward the terminal rate (the default target) so year 5 hands over
+to the Gordon model smoothly.
+
+Projection, reinvestment, discounting and terminal value are fused: each
+path carries (revenue, growth, margin, discount, PV) as scalars through the
+years, and nothing of shape (paths x years) is built except the shocks for
+one chunk of paths. With numba installed the per-path loop is compiled;
+without it the same arithmetic runs as a numpy year loop over (chunk,)
+vectors. Both backends consume the same shocks, so they agree to rounding.
+"""
+import numpy as np
+
+DEFAULT_CHUNK = 65_536
+
+_JIT = {}
+
+
+def _dcf_numpy(rev0, g0, m0, wacc, tg, g_target, m_target, s2c, reinv_rate, z_g, z_m,
+               tax, g_kappa, g_vol, m_kappa, m_vol, terminal_roic, use_s2c, out):
+    rev, g, m = rev0.copy(), g0.copy(), m0.copy()
+    one_plus_wacc = 1.0 + wacc
+    disc = np.ones_like(rev)
+    pv = np.zeros_like(rev)
+    nopat = np.zeros_like(rev)
+    for t in range(z_g.shape[0] + 1):
+        if t:
+            g = g + g_kappa * (g_target - g) + g_vol * z_g[t - 1]
+            m = m + m_kappa * (m_target - m) + m_vol * z_m[t - 1]
+        prev = rev
+        rev = rev * (1.0 + g)
+        nopat = rev * m * (1.0 - tax)
+        reinvestment = (rev - prev) / s2c if use_s2c else nopat * reinv_rate
+        disc = disc / one_plus_wacc
+        pv += (nopat - reinvestment) * disc
+    terminal_fcff = nopat * (1.0 - tg / terminal_roic) if terminal_roic > 0 else nopat * (1.0 - reinv_rate)
+    out[:] = pv + terminal_fcff / (wacc - tg) * disc
+
+
+def _dcf_loop(rev0, g0, m0, wacc, tg, g_target, m_target, s2c, reinv_rate, z_g, z_m,
+              tax, g_kappa, g_vol, m_kappa, m_vol, terminal_roic, use_s2c, out):
+    # Scalar per-path loop: the numba kernel (pure Python would be far too slow).
+    years = z_g.shape[0] + 1
+    for i in range(rev0.shape[0]):
+        rev, g, m, w = rev0[i], g0[i], m0[i], wacc[i]
+        disc, pv, nopat = 1.0, 0.0, 0.0
+        for t in range(years):
+            if t:
+                g += g_kappa * (g_target[i] - g) + g_vol * z_g[t - 1, i]
+                m += m_kappa * (m_target[i] - m) + m_vol * z_m[t - 1, i]
+            prev = rev
+            rev = rev * (1.0 + g)
+            nopat = rev * m * (1.0 - tax)
+            if use_s2c:
+                reinvestment = (rev - prev) / s2c[i]
+            else:
+                reinvestment = nopat * reinv_rate
+            disc /= 1.0 + w
+            pv += (nopat - reinvestment) * disc
+        if terminal_roic > 0:
+            terminal_fcff = nopat * (1.0 - tg[i] / terminal_roic)
+        else:
+            terminal_fcff = nopat * (1.0 - reinv_rate)
+        out[i] = pv + terminal_fcff / (w - tg[i]) * disc
+
+
+def numba_available():
+    try:
+        import numba  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _kernel(use_numba):
+    """The compiled loop when asked for (and installed), else the numpy kernel."""
+    if use_numba is None:
+        use_numba = numba_available()
+    if not use_numba:
+        return _dcf_numpy
+    if 'loop' not in _JIT:
+        import numba
+
+        _JIT['loop'] = numba.njit(cache=True, fastmath=False)(_dcf_loop)
+    return _JIT['loop']
+
+
+def stochastic_dcf(revenue, growth, margin, wacc, terminal_growth, years=5, tax_rate=0.27,
+                   sales_to_capital=None, reinvestment_rate=0.0, terminal_roic=None,
+                   growth_target=None, growth_kappa=0.0, growth_vol=0.0,
+                   margin_target=None, margin_kappa=0.0, margin_vol=0.0,
+                   paths=None, rng=None, chunk_size=DEFAULT_CHUNK, use_numba=None):
+    """
+    PV of explicit FCFF plus PV of terminal value (enterprise value) per path.
+
+    revenue, growth, margin, wacc, terminal_growth, sales_to_capital and the
+    targets may be scalars or (paths,) draws.
+    reinvestment:   (Rev_t - Rev_{t-1}) / sales_to_capital, or, without it,
+                    reinvestment_rate * NOPAT (val_cohr.py's 35%).
+    terminal value: val_boxer.py convention, TV = NOPAT_T (1 - g / ROIC) /
+                    (WACC - g); without terminal_roic the explicit
+                    reinvestment_rate is kept in the terminal year.
+    growth_target:  where growth fades to (default: terminal_growth).
+    margin_target:  where margins fade to (default: the margin draw itself,
+                    i.e. shocks around a stable margin).
+    use_numba:      None = use numba when installed; False = numpy kernel.
+
+    Shocks are drawn per chunk of paths as (years - 1, chunk) blocks, so the
+    result depends on chunk_size (keep the default for reproducible runs).
+    """
+    rng = np.random if rng is None else rng
+    if paths is None:
+        paths = np.broadcast(*(np.atleast_1d(x) for x in (revenue, growth, margin, wacc, terminal_growth))).shape[0]
+
+    def per_path(x):
+        return np.broadcast_to(np.asarray(x, dtype=np.float64), (paths,))
+
+    rev0, g0, m0 = per_path(revenue), per_path(growth), per_path(margin)
+    w, tg = per_path(wacc), per_path(terminal_growth)
+    g_target = tg if growth_target is None else per_path(growth_target)
+    m_target = m0 if margin_target is None else per_path(margin_target)
+    use_s2c = sales_to_capital is not None
+    s2c = per_path(sales_to_capital if use_s2c else 1.0)
+    roic = 0.0 if terminal_roic is None else float(terminal_roic)
+
+    kernel = _kernel(use_numba)
+    out = np.empty(paths)
+    stochastic = growth_vol or margin_vol
+    zeros = np.zeros((years - 1, min(chunk_size, paths)))
+
+    for start in range(0, paths, chunk_size):
+        stop = min(start + chunk_size, paths)
+        k = stop - start
+        if stochastic:
+            z_g = rng.normal(0.0, 1.0, (years - 1, k))
+            z_m = rng.normal(0.0, 1.0, (years - 1, k))
+        else:
+            z_g = z_m = zeros[:, :k]
+        sl = slice(start, stop)
+        kernel(rev0[sl], g0[sl], m0[sl], w[sl], tg[sl], g_target[sl], m_target[sl], s2c[sl],
+               float(reinvestment_rate), z_g, z_m, float(tax_rate), float(growth_kappa),
+               float(growth_vol), float(margin_kappa), float(margin_vol), roic, use_s2c, out[sl])
+    return out
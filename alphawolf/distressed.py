@@ -0,0 +1,121 @@
+"""
+🐺 ALPHAWOLF: LIQUIDITY RUNWAY ENGINE (THE PHOENIX CLOCK)
+
+A dying company is a race between the cash pile and the calendar. Instead of
+subtracting one lump of burn, we step every path month by month:
+
+    cash_t = cash_{t-1} - burn_t - maturity_t + raise_t
+
+burn_t fades toward breakeven (the turnaround) with a lognormal shock each
+month; debt maturities are paid from cash; when the runway drops below the
+trigger, the company taps the market (with probability p_raise per month)
+and dilutes. The first month cash goes negative is the first-passage time to
+insolvency.
+
+Memory stays flat: paths are processed in chunks and only the state vectors
+(cash, burn, shares, debt) are carried forward, so 1e6 paths x 120 months is
+a few vector operations per month per chunk.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+# default_month is -1 for paths that survive the whole horizon.
+RunwayResult = namedtuple('RunwayResult', ['default_month', 'survived', 'final_cash', 'shares', 'debt'])
+
+
+def _per_path(x, paths):
+    return np.broadcast_to(np.asarray(x, dtype=np.float64), (paths,))
+
+
+def simulate_runway(cash, burn, months=120, burn_fade=0.0, burn_vol=0.0, debt=0.0,
+                    maturities=None, shares=1.0, raise_amount=0.0, raise_price=1.0,
+                    raise_trigger=6.0, p_raise=1.0, chunk_size=250_000, rng=None):
+    """
+    Step monthly cash over (paths x months) and record first passage below zero.
+
+    cash, burn, debt, shares, raise_amount, raise_price may be per-path arrays.
+    burn:          monthly cash burn at month 1 (positive = cash out).
+    burn_fade:     monthly fractional decline in burn (turnaround speed).
+    burn_vol:      lognormal sigma of the monthly burn shock.
+    maturities:    {month: amount} debt repayments paid from cash; they draw
+                   down `debt` and may not add up to more than it.
+    raise_trigger: raise equity when runway (cash / burn) falls below this many months.
+    p_raise:       monthly probability the market is open for a raise.
+    """
+    rng = np.random if rng is None else rng
+    maturities = maturities or {}
+    per_path = (cash, burn, debt, shares, raise_amount, raise_price) + tuple(maturities.values())
+    paths = np.broadcast(*(np.atleast_1d(np.asarray(x, dtype=np.float64)) for x in per_path)).shape[0]
+    if maturities and np.any(sum(_per_path(m, paths) for m in maturities.values()) > _per_path(debt, paths)):
+        raise ValueError("Debt maturities add up to more than debt.")
+
+    default_month = np.full(paths, -1, dtype=np.int32)
+    final_cash = np.empty(paths)
+    final_shares = np.empty(paths)
+    final_debt = np.empty(paths)
+
+    inputs = [_per_path(x, paths) for x in (cash, burn, debt, shares, raise_amount, raise_price)]
+    fade = 1.0 - burn_fade
+
+    for start in range(0, paths, chunk_size):
+        sl = slice(start, min(start + chunk_size, paths))
+        c_cash, c_burn, c_debt, c_shares, c_raise, c_price = (x[sl].copy() for x in inputs)
+        c_default = default_month[sl]
+        alive = np.ones(c_cash.size, dtype=bool)
+        can_raise = np.any(c_raise > 0)
+
+        for month in range(1, months + 1):
+            # 1. BURN (fading, shocked)
+            month_burn = c_burn
+            if burn_vol:
+                month_burn = c_burn * rng.lognormal(-0.5 * burn_vol ** 2, burn_vol, c_cash.size)
+            c_cash -= month_burn * alive
+
+            # 2. DEBT WALL
+            due = maturities.get(month)
+            if due is not None:
+                due = _per_path(due, paths)[sl]
+                c_cash -= due * alive
+                c_debt -= due * alive
+
+            # 3. DILUTION (tap the market when the runway is short)
+            if can_raise:
+                runway = np.divide(c_cash, c_burn, out=np.full_like(c_cash, np.inf), where=c_burn > 0)
+                tap = alive & (runway < raise_trigger) & (c_raise > 0)
+                if p_raise < 1.0:
+                    tap &= rng.uniform(0.0, 1.0, c_cash.size) < p_raise
+                c_cash += c_raise * tap
+                c_shares += (c_raise / c_price) * tap
+
+            # 4. FIRST PASSAGE
+            dead = alive & (c_cash < 0)
+            c_default[dead] = month
+            alive &= ~dead
+
+            c_burn = c_burn * fade
+
+        final_cash[sl] = c_cash
+        final_shares[sl] = c_shares
+        final_debt[sl] = c_debt
+
+    return RunwayResult(default_month, default_month < 0, final_cash, final_shares, final_debt)
+
+
+def survival_curve(default_month, months):
+    """Fraction of paths still solvent at the end of each month 1..months."""
+    defaults = np.bincount(default_month[default_month > 0], minlength=months + 1)[1:months + 1]
+    return 1.0 - np.cumsum(defaults) / default_month.size
+
+
+def blend_distressed(result, going_concern, assets, recovery):
+    """
+    Per-path equity value per share: the Phoenix or the Carcass.
+
+    Survivors: going_concern (turnaround EV) + remaining cash - remaining debt.
+    Defaulted: max(assets * recovery - remaining debt, 0) (limited liability).
+    """
+    phoenix = going_concern + result.final_cash - result.debt
+    carcass = np.maximum(assets * recovery - result.debt, 0.0)
+    equity = np.where(result.survived, np.maximum(phoenix, 0.0), carcass)
+    return equity / result.shares
@@ -0,0 +1,132 @@
+"""
+🐺 ALPHAWOLF: FX SCENARIO SERVICE (THE RAND HEDGE)
+
+One set of currency paths for the whole run. Every model that touches the
+Rand reads the same correlated draws, so "path 17" is the same FX world for
+Glencore, Richemont and the USD names we convert to ZAR.
+
+Draws are generated once per batch (correlated normals via Cholesky),
+written to a .npy memmap under CACHE_DIR keyed by (pairs, corr, seed), and
+re-opened read-only by every later caller in the run (or the next run).
+Paths are drawn path-major, so the first n paths of a larger batch are the
+n-path batch: one master file per seed serves every path count, and a
+bigger request regrows it. Only the FX_CACHE_FILES most recently used
+batches are kept (sharded runs touch one seed per shard).
+ZAR is the pivot: any currency converts to any other via its XXXZAR path.
+"""
+import contextlib
+import glob
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from alphawolf.models import ROOT
+
+CACHE_DIR = os.path.abspath(os.environ.get('ALPHAWOLF_CACHE', os.path.join(ROOT, '.alphawolf_cache')))
+FX_CACHE_FILES = 16
+
+# Quote: units of ZAR per 1 unit of foreign currency. (mean, std) of a Normal.
+DEFAULT_PAIRS = {
+    'USDZAR': (17.25, 0.75),
+    'EURZAR': (20.50, 1.50),
+}
+# The Rand moves against both majors together.
+DEFAULT_CORR = [[1.00, 0.85],
+                [0.85, 1.00]]
+
+
+def _cache_path(pairs, corr, seed):
+    spec = json.dumps({'pairs': pairs, 'corr': corr, 'seed': seed}, sort_keys=True)
+    key = hashlib.sha1(spec.encode()).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f'fx_{key}.npy')
+
+
+def _evict(keep=FX_CACHE_FILES):
+    """Drop all but the `keep` most recently used FX batches."""
+    files = sorted(glob.glob(os.path.join(CACHE_DIR, 'fx_*.npy')), key=os.path.getmtime, reverse=True)
+    for stale in files[keep:]:
+        with contextlib.suppress(OSError):
+            os.remove(stale)
+
+
+def generate_fx(n, pairs=None, corr=None, seed=42):
+    """Correlated Normal FX draws as a (pairs, n) array, rows in `pairs` order."""
+    pairs = DEFAULT_PAIRS if pairs is None else pairs
+    corr = DEFAULT_CORR if corr is None else corr
+    names = list(pairs)
+    corr = np.asarray(corr, dtype=np.float64)
+    if corr.shape != (len(names), len(names)):
+        raise ValueError(f"Correlation matrix must be {len(names)}x{len(names)}.")
+
+    rng = np.random.default_rng(seed)
+    # Path-major draws: the first n paths do not depend on the batch size.
+    z = np.linalg.cholesky(corr) @ rng.standard_normal((n, len(names))).T
+    means = np.array([pairs[p][0] for p in names])[:, None]
+    stds = np.array([pairs[p][1] for p in names])[:, None]
+    return means + stds * z
+
+
+def fx_scenarios(n, pairs=None, corr=None, seed=42, use_cache=True):
+    """
+    {pair: (n,) array} of shared FX paths, memmapped from the run cache.
+
+    The first caller for a given (pairs, corr, seed) generates and writes
+    the batch; every later caller gets a read-only view of the same file
+    (its first n paths), regrowing it only when it holds fewer than n.
+    """
+    pairs = DEFAULT_PAIRS if pairs is None else pairs
+    corr = DEFAULT_CORR if corr is None else corr
+    corr = np.asarray(corr, dtype=np.float64).tolist()
+    names = list(pairs)
+
+    if not use_cache:
+        block = generate_fx(n, pairs, corr, seed)
+        return {name: block[i] for i, name in enumerate(names)}
+
+    path = _cache_path({k: list(v) for k, v in pairs.items()}, corr, seed)
+    block = np.load(path, mmap_mode='r') if os.path.exists(path) else None
+    if block is None or block.shape[1] < n:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f'{path}.{os.getpid()}.tmp'
+        out = np.lib.format.open_memmap(tmp, mode='w+', dtype=np.float64, shape=(len(names), n))
+        out[:] = generate_fx(n, pairs, corr, seed)
+        out.flush()
+        del out
+        os.replace(tmp, path)  # Atomic: concurrent models never see a half-written file.
+        _evict()
+        block = np.load(path, mmap_mode='r')
+    else:
+        with contextlib.suppress(OSError):
+            os.utime(path)  # Recently used: survives eviction.
+    return {name: block[i, :n] for i, name in enumerate(names)}
+
+
+def zar_rate(currency, scenarios, n=None):
+    """Per-path ZAR per 1 unit of `currency` (1.0 for ZAR), first n paths."""
+    if currency == 'ZAR':
+        return 1.0
+    pair = f'{currency}ZAR'
+    if pair not in scenarios:
+        raise KeyError(f"No FX scenario for {pair}; available: {sorted(scenarios)}.")
+    rate = scenarios[pair]
+    if n is not None:
+        if len(rate) < n:
+            raise ValueError(f"FX batch has {len(rate)} paths; {n} requested.")
+        rate = rate[:n]
+    return np.asarray(rate)
+
+
+def convert(values, from_ccy, to_ccy, scenarios):
+    """
+    Convert a per-path value distribution between currencies, path by path.
+
+    Path i is converted with FX path i, so every model in the run shares the
+    same FX world (a 10k-path model uses the first 10k FX paths).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if from_ccy == to_ccy:
+        return values
+    n = values.shape[-1]
+    return values * zar_rate(from_ccy, scenarios, n) / zar_rate(to_ccy, scenarios, n)
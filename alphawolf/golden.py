@@ -0,0 +1,160 @@
+"""
+🐺 ALPHAWOLF: GOLDEN DISTRIBUTIONS (REGRESSION HARNESS)
+
+Speed work must not move the numbers that feed trading calls. This module
+captures a golden record of every registered model (and of the AVCO audit
+trail) and checks new runs against it two ways:
+
+    exact:        same seed, same engine -> the same bytes (SHA-256 of the
+                  float64 output). Any refactor that claims "no change"
+                  must pass this.
+    statistical:  new sampler or engine -> the same distribution.
+                  KS distance against the golden CDF (stored as 1001
+                  quantiles, no SciPy) within the two-sample critical value,
+                  and P10/P50/P90 within a tolerance scaled by the IQR.
+
+Model goldens are small JSON files (hash + quantile grid), committed under
+golden/. Audit goldens keep the full audit CSV, compared column by column
+with an absolute tolerance; the committed one is built from SAMPLE_EXPORT,
+a small synthetic export that hits every action the classifier knows.
+"""
+import hashlib
+import json
+import os
+from collections import namedtuple
+
+import numpy as np
+
+from alphawolf.models import ROOT, run_model
+
+GOLDEN_DIR = os.environ.get('ALPHAWOLF_GOLDEN', os.path.join(ROOT, 'golden'))
+SAMPLE_EXPORT = os.path.join(ROOT, 'golden', 'export_sample.csv')
+GRID = np.linspace(0.0, 1.0, 1001)
+KS_ALPHA_C = 1.36   # c(alpha) for a 5% two-sample KS test
+QUANTILE_TOL = 0.05  # |shift| of P10/P50/P90 as a fraction of the golden IQR
+AUDIT_COLUMNS = ('Pool_Coins', 'Pool_Avg_Cost', 'Exchange_Bal', 'External_Bal')
+
+# exact: bytes identical. ks / ks_limit: KS distance and its critical value.
+# quantile_shift: worst |P10/P50/P90 move| / golden IQR.
+Check = namedtuple('Check', ['name', 'exact', 'ks', 'ks_limit', 'quantile_shift', 'passed'])
+
+
+def _digest(values):
+    return hashlib.sha256(np.ascontiguousarray(values, dtype=np.float64).tobytes()).hexdigest()
+
+
+def _model_path(name):
+    return os.path.join(GOLDEN_DIR, f'{name.lower()}.json')
+
+
+def _golden(path, name):
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"no golden for {name}; run `python -m alphawolf golden capture`.")
+    return path
+
+
+# --- 1. MODELS ---
+
+def capture_model(name, simulations=None):
+    """Run a model and write its golden record."""
+    run = run_model(name, simulations=simulations, quiet=True)
+    values = np.asarray(run.values, dtype=np.float64).ravel()
+    record = {
+        'model': run.name,
+        'simulations': simulations,
+        'n': int(values.size),
+        'sha256': _digest(values),
+        'mean': float(values.mean()),
+        'quantiles': np.quantile(values, GRID).tolist(),
+    }
+    os.makedirs(GOLDEN_DIR, exist_ok=True)
+    with open(_model_path(name), 'w', encoding='utf-8') as fh:
+        json.dump(record, fh)
+    return record
+
+
+def ks_distance(values, golden_quantiles):
+    """
+    Sup |F_new - F_golden|, with F_golden known at its 1001 quantiles.
+
+    Exact up to the grid step (0.001), which is far below any meaningful
+    critical value at the path counts we run.
+    """
+    values = np.sort(np.asarray(values, dtype=np.float64).ravel())
+    q = np.asarray(golden_quantiles)
+    f_new_right = np.searchsorted(values, q, side='right') / values.size
+    f_new_left = np.searchsorted(values, q, side='left') / values.size
+    return float(max(np.max(np.abs(f_new_right - GRID)), np.max(np.abs(f_new_left - GRID))))
+
+
+def compare(name, values, record, quantile_tol=QUANTILE_TOL, require_exact=False):
+    """Check one output distribution against its golden record."""
+    values = np.asarray(values, dtype=np.float64).ravel()
+    exact = values.size == record['n'] and _digest(values) == record['sha256']
+    ks = ks_distance(values, record['quantiles'])
+    n, m = values.size, record['n']
+    ks_limit = KS_ALPHA_C * np.sqrt((n + m) / (n * m)) + 1.0 / (len(GRID) - 1)
+
+    gold = np.asarray(record['quantiles'])
+    iqr = gold[750] - gold[250]
+    scale = iqr if iqr > 0 else max(abs(gold[500]), 1e-12)
+    new_q = np.quantile(values, [0.10, 0.50, 0.90])
+    shift = float(np.max(np.abs(new_q - gold[[100, 500, 900]])) / scale)
+
+    passed = bool(exact or (not require_exact and ks <= ks_limit and shift <= quantile_tol))
+    return Check(name.lower(), exact, ks, float(ks_limit), shift, passed)
+
+
+def check_model(name, simulations=None, quantile_tol=QUANTILE_TOL, require_exact=False):
+    """Rerun a model with its golden settings and compare."""
+    with open(_golden(_model_path(name), name.lower()), encoding='utf-8') as fh:
+        record = json.load(fh)
+    sims = record['simulations'] if simulations is None else simulations
+    run = run_model(name, simulations=sims, quiet=True)
+    return compare(name, run.values, record, quantile_tol, require_exact)
+
+
+# --- 2. AVCO AUDIT TRAIL ---
+
+def _audit_path(coin):
+    return os.path.join(GOLDEN_DIR, f'audit_{coin.upper()}.csv')
+
+
+def _audit(export, coin):
+    import pandas as pd
+
+    from alphawolf.ledger.actions import prepare
+    from alphawolf.ledger.audit import avco_audit
+
+    ledger = prepare(pd.read_csv(export) if isinstance(export, str) else export, coin=coin)
+    return avco_audit(ledger, coin=coin).to_frame(ledger, coin=coin)
+
+
+def capture_audit(export, coin='BTC'):
+    """Write the golden audit trail (BTC_Audit_Detailed.csv layout) for an export."""
+    os.makedirs(GOLDEN_DIR, exist_ok=True)
+    frame = _audit(export, coin)
+    frame.to_csv(_audit_path(coin), index=False)
+    return frame
+
+
+def check_audit(export, coin='BTC', atol=1e-6):
+    """
+    Compare a fresh audit against the golden CSV. Actions must match row for
+    row; numeric columns within atol (exact=True when they are identical).
+    """
+    import pandas as pd
+
+    golden = pd.read_csv(_golden(_audit_path(coin), f'audit_{coin.lower()}'), keep_default_na=False,
+                         float_precision='round_trip')
+    fresh = _audit(export, coin)
+    if len(golden) != len(fresh):
+        return Check(f'audit_{coin.lower()}', False, np.inf, 0.0, np.inf, False)
+    actions_ok = bool((golden['Action'].to_numpy() == fresh['Action'].astype(str).to_numpy()).all())
+    worst, exact = 0.0, actions_ok
+    for col in AUDIT_COLUMNS:
+        diff = np.abs(golden[col].to_numpy(dtype=np.float64) - fresh[col].to_numpy(dtype=np.float64))
+        worst = max(worst, float(diff.max()) if diff.size else 0.0)
+    # CSV round-trips float64 exactly (repr), so "exact" means bit-identical columns.
+    exact = exact and worst == 0.0
+    return Check(f'audit_{coin.lower()}', exact, 0.0, 0.0, worst, actions_ok and worst <= atol)
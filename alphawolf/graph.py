@@ -0,0 +1,231 @@
+"""
+🐺 ALPHAWOLF: INCREMENTAL RECOMPUTATION (THE WHAT-IF GRAPH)
+
+Tweak one input (say watch_multiple in val_richemont.py) and only what
+depends on it is recomputed. The script itself is the graph: every
+top-level statement is a node, wired to the statements that last wrote
+the names it reads.
+
+    jewellery_ebitda, jewellery_multiple, watch_ebitda, ...   (draws)
+        -> ev_gross -> equity_value_eur -> fair_value_zar     (segments, bridge)
+            -> mean_val, p10, p50, p90, prob_profit           (outputs)
+
+The first build runs the script once (plots off) and keeps every node's
+outputs. An edit marks the node that first assigns the variable; dirtiness
+flows forward along the read edges, and only dirty nodes are re-executed.
+Everything else, including every untouched draw and segment array, is
+reused from the cache. A draw that must rerun (its own parameter changed)
+restores the RNG state it saw on the first run, so it redraws the same
+stream and the result is identical to a full rerun with the same edit
+(models.run_model overrides).
+
+Edits follow run_model's override convention: a function is applied to the
+script's value ({'watch_multiple': lambda m: m * 1.1}), anything else
+replaces it ({'other_value': 1500}). Only top-level variables can be
+edited; val_ssw.py and val_FCEL.py compute inside functions, so there the
+whole call is one node. SIMULATIONS and the seed change every draw: build
+a new graph for those.
+"""
+import ast
+import contextlib
+import io
+import os
+import sys
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from alphawolf.models import ROOT, _script_env, get_spec
+
+# index: position in the script | source: first line (for reports)
+# reads/writes: top-level names used / bound | draws: touches np.random
+Node = namedtuple('Node', ['index', 'source', 'code', 'reads', 'writes', 'draws'])
+
+# executed/skipped: node counts of the last (re)computation.
+Recompute = namedtuple('Recompute', ['values', 'executed', 'skipped', 'seconds'])
+
+_SCOPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda,
+           ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp)
+
+
+# --- 1. THE GRAPH (FROM THE SCRIPT'S AST) ---
+
+def _writes(stmt):
+    """Top-level names bound by a statement (not descending into nested scopes)."""
+    names = set()
+    if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return {stmt.name}
+    stack = [stmt]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Name) and isinstance(node.ctx, (ast.Store, ast.Del)):
+            names.add(node.id)
+        elif isinstance(node, (ast.Subscript, ast.Attribute)) and isinstance(node.ctx, ast.Store):
+            base = node.value
+            while isinstance(base, (ast.Subscript, ast.Attribute)):
+                base = base.value
+            if isinstance(base, ast.Name):
+                names.add(base.id)  # arr[mask] = x mutates arr
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            names.update((a.asname or a.name).split('.')[0] for a in node.names)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.add(node.name)
+        if node is stmt or not isinstance(node, _SCOPES):
+            stack.extend(ast.iter_child_nodes(node))
+    return names
+
+
+def _reads(stmt):
+    """Every name loaded anywhere in the statement (function bodies included)."""
+    reads = {n.id for n in ast.walk(stmt) if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Load)}
+    reads |= {n.target.id for n in ast.walk(stmt)
+              if isinstance(n, ast.AugAssign) and isinstance(n.target, ast.Name)}
+    return reads
+
+
+def build_nodes(path):
+    """One Node per top-level statement of a script."""
+    with open(path, encoding='utf-8') as fh:
+        source = fh.read()
+    tree = ast.parse(source, filename=path)
+    nodes = []
+    for i, stmt in enumerate(tree.body):
+        text = ast.get_source_segment(source, stmt) or ''
+        code = compile(ast.Module(body=[stmt], type_ignores=[]), path, 'exec')
+        nodes.append(Node(i, text.splitlines()[0] if text else '', code, _reads(stmt), _writes(stmt),
+                          'random' in text))
+    return nodes
+
+
+def wire(nodes):
+    """For each node, the earlier nodes that last wrote each name it reads."""
+    last, parents = {}, []
+    for node in nodes:
+        parents.append(sorted({last[name] for name in node.reads if name in last}))
+        for name in node.writes:
+            last[name] = node.index
+    return parents
+
+
+# --- 2. THE CACHE ---
+
+class ModelGraph:
+    """
+    A registered model held in memory for what-if edits.
+
+        g = ModelGraph('richemont')
+        g.edit(watch_multiple=lambda m: m * 1.1)   # re-executes 17 of 41 nodes
+        g.values                                   # fair_value_zar
+        g.reset('watch_multiple')
+    """
+
+    def __init__(self, name, simulations=None, seed=None, quiet=True):
+        self.spec = get_spec(name)
+        self.name = name.lower()
+        self.path = os.path.join(ROOT, self.spec.script)
+        self.nodes = build_nodes(self.path)
+        self.parents = wire(self.nodes)
+        self.quiet = quiet
+        self._edits = {}
+        self._base = [None] * len(self.nodes)     # outputs as the script computed them
+        self._out = [None] * len(self.nodes)      # outputs after edits
+        self._rng = [None] * len(self.nodes)      # np.random state seen by draw nodes
+        self._first_writer = {}
+        for node in self.nodes:
+            for name_ in node.writes:
+                self._first_writer.setdefault(name_, node.index)
+        with _script_env(simulations, plot=False, seed=seed):
+            self.last = self._compute(range(len(self.nodes)))
+
+    def _env(self, node):
+        """Namespace a node sees: the latest outputs of its parents."""
+        env = {'__name__': '__main__', '__file__': self.path, '__builtins__': __builtins__}
+        for parent in self.parents[node.index]:
+            env.update(self._out[parent])
+        for name_ in node.reads & node.writes:
+            # In-place updates (x[...] = ..., x *= ...) must not touch a cached parent.
+            if isinstance(env.get(name_), np.ndarray):
+                env[name_] = env[name_].copy()
+        return env
+
+    def _compute(self, dirty):
+        dirty = set(dirty)
+        executed = 0
+        start = time.perf_counter()
+        sink = io.TextIOWrapper(io.BytesIO(), encoding='utf-8') if self.quiet else None
+        stdout = sys.stdout
+        with (contextlib.redirect_stdout(sink) if self.quiet else contextlib.nullcontext()):
+            try:
+                for node in self.nodes:
+                    if node.index not in dirty and not dirty.intersection(self.parents[node.index]):
+                        continue
+                    dirty.add(node.index)
+                    env = self._env(node)
+                    if node.draws:
+                        if self._rng[node.index] is None:
+                            self._rng[node.index] = np.random.get_state()
+                        else:
+                            np.random.set_state(self._rng[node.index])
+                    exec(node.code, env)
+                    executed += 1
+                    self._base[node.index] = {k: env[k] for k in node.writes if k in env}
+                    self._out[node.index] = self._apply(node, dict(self._base[node.index]))
+            finally:
+                sys.stdout = stdout
+        return Recompute(self.values, executed, len(self.nodes) - executed, time.perf_counter() - start)
+
+    def _apply(self, node, outputs):
+        for name_, edit in self._edits.items():
+            if self._first_writer.get(name_) == node.index and name_ in outputs:
+                outputs[name_] = edit(outputs[name_]) if callable(edit) else edit
+        return outputs
+
+    # --- 3. EDITS ---
+
+    def edit(self, **edits):
+        """Apply (or replace) edits and recompute only the affected nodes."""
+        for name_ in edits:
+            if name_ == 'SIMULATIONS':
+                raise ValueError("SIMULATIONS changes every draw; build a new ModelGraph instead.")
+            if name_ not in self._first_writer:
+                raise KeyError(f"{os.path.basename(self.path)}: no top-level assignment to {name_!r}.")
+        self._edits.update(edits)
+        self.last = self._refresh(edits)
+        return self.last
+
+    def reset(self, *names):
+        """Drop edits (all of them when no names are given) and recompute."""
+        names = names or tuple(self._edits)
+        for name_ in names:
+            self._edits.pop(name_, None)
+        self.last = self._refresh(names)
+        return self.last
+
+    def _refresh(self, names):
+        # Edited nodes reuse their cached script outputs; only the edit is reapplied.
+        touched = {self._first_writer[n] for n in names}
+        for index in touched:
+            self._out[index] = self._apply(self.nodes[index], dict(self._base[index]))
+        downstream = {i for i, parents in enumerate(self.parents) if touched.intersection(parents)}
+        return self._compute(downstream)
+
+    # --- 4. READING THE CACHE ---
+
+    def __getitem__(self, name_):
+        for node in reversed(self.nodes):
+            if name_ in node.writes and self._out[node.index] is not None and name_ in self._out[node.index]:
+                return self._out[node.index][name_]
+        raise KeyError(name_)
+
+    @property
+    def values(self):
+        return self[self.spec.output]
+
+    @property
+    def price(self):
+        return float(self[self.spec.price])
+
+    @property
+    def edits(self):
+        return dict(self._edits)
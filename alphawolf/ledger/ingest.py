@@ -0,0 +1,77 @@
+"""
+🐺 ALPHAWOLF: EXPORT INGESTION
+
+The avco scripts read one hard-coded export file. Exchanges hand out one
+CSV per wallet/period, re-downloads overlap, and the same row turns up in
+several files. This stage:
+
+    1. globs a directory of exports
+    2. parses them in a process pool (CSV parsing + timestamp parsing is
+       the expensive part, and it is per-file independent)
+    3. concatenates once
+    4. drops rows repeated across files, keyed by a stable row hash of
+       (timestamp, currency, balance delta, description) plus the row's
+       occurrence count within its own file: two identical rows inside one
+       export are two real events (say, two equal fills in the same second)
+       and both survive; an overlapping re-download adds nothing
+    5. sorts once by time (stable, so same-second rows keep file order)
+"""
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from alphawolf.ledger.actions import COL_CURRENCY, COL_DELTA, COL_DESC, COL_TIME
+
+HASH_COLUMNS = (COL_TIME, COL_CURRENCY, COL_DELTA, COL_DESC)
+
+
+def read_export(path):
+    """Parse one export CSV (timestamps parsed, source file recorded)."""
+    frame = pd.read_csv(path)
+    frame[COL_TIME] = pd.to_datetime(frame[COL_TIME])
+    frame['source'] = os.path.basename(path)
+    return frame
+
+
+def row_hash(frame, columns=HASH_COLUMNS):
+    """
+    uint64 hash per row over the identifying columns.
+
+    pandas' hash_pandas_object uses a fixed key, so the same row hashes the
+    same in every file, process and run.
+    """
+    return pd.util.hash_pandas_object(frame[list(columns)], index=False).to_numpy(np.uint64)
+
+
+def find_exports(path, pattern='*.csv'):
+    """A directory (globbed with `pattern`), a glob string, or a single file."""
+    if os.path.isdir(path):
+        return sorted(glob.glob(os.path.join(path, pattern)))
+    return sorted(glob.glob(path)) if any(c in path for c in '*?[') else [path]
+
+
+def load_exports(path, pattern='*.csv', workers=None):
+    """
+    Every export under `path` as one deduplicated, time-sorted frame.
+
+    workers: process count (None = os.cpu_count(), 1 = parse in-process).
+    """
+    files = find_exports(path, pattern)
+    if not files:
+        raise FileNotFoundError(f"No exports matching {pattern!r} under {path}.")
+
+    if workers == 1 or len(files) == 1:
+        frames = [read_export(f) for f in files]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, len(files))) as pool:
+            frames = list(pool.map(read_export, files))
+
+    merged = pd.concat(frames, ignore_index=True)
+    merged['row_hash'] = row_hash(merged)
+    file_id = np.repeat(np.arange(len(frames)), [len(f) for f in frames])
+    occurrence = merged.groupby([file_id, merged['row_hash']], sort=False).cumcount().to_numpy()
+    keep = ~pd.DataFrame({'hash': merged['row_hash'].to_numpy(), 'occurrence': occurrence}).duplicated().to_numpy()
+    return merged[keep].sort_values(COL_TIME, kind='stable').reset_index(drop=True)
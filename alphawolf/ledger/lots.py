@@ -0,0 +1,245 @@
+"""
+🐺 ALPHAWOLF: LOT ENGINE (FIFO / LIFO / HIFO / AVCO)
+
+One pass over the ledger, four cost-basis methods at once.
+
+Lots live in flat typed arrays (array.array), not per-lot objects: a shared
+per-unit cost and source row per lot, plus one remaining-quantity array per
+method. Each method only keeps an index structure over those arrays:
+
+    FIFO  head pointer into the lot list        (amortized O(1) per lot)
+    LIFO  stack of lot indices                  (amortized O(1) per lot)
+    HIFO  binary max-heap keyed by unit cost    (O(log lots) per lot)
+    AVCO  pooled coins and cost (bitcoin_avco.py rules)
+
+Every disposal emits its matched lots (disposal row, method, lot row,
+quantity, cost), so tax outcomes can be compared method by method. Transfer
+handling mirrors bitcoin_avco.py: sends park coins "externally" (still
+owned), receives first draw that balance back down, and any excess is a
+phantom deposit booked at the row's implied price (or, given deposit_price,
+at the historical price from the local price store).
+"""
+from array import array
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from alphawolf.ledger.actions import ACQUISITIONS, DISPOSALS, RECEIVE, TRANSFERS_OUT
+
+METHODS = ('FIFO', 'LIFO', 'HIFO', 'AVCO')
+AVCO_EPSILON = 1e-9  # Pool reset threshold, as in bitcoin_avco.py
+LOT_EPSILON = 1e-12  # Float dust left on a lot after matching
+
+# matches: one row per (disposal, method, lot) slice.
+# cost_basis: {method: (n,) cost of coins disposed on each ledger row}.
+# open_lots: {method: DataFrame of lots still held at the end}.
+LotResult = namedtuple('LotResult', ['matches', 'cost_basis', 'open_lots', 'phantom_qty'])
+
+
+class _Matches:
+    """Growable columnar buffer for matched-lot records."""
+
+    def __init__(self):
+        self.row = array('q')
+        self.method = array('b')
+        self.lot_row = array('q')
+        self.qty = array('d')
+        self.cost = array('d')
+
+    def add(self, row, method, lot_row, qty, cost):
+        self.row.append(row)
+        self.method.append(method)
+        self.lot_row.append(lot_row)
+        self.qty.append(qty)
+        self.cost.append(cost)
+
+    def to_frame(self):
+        return pd.DataFrame({
+            'disposal_row': np.frombuffer(self.row, dtype=np.int64),
+            'method': pd.Categorical.from_codes(np.frombuffer(self.method, dtype=np.int8), METHODS),
+            'lot_row': np.frombuffer(self.lot_row, dtype=np.int64),
+            'qty': np.frombuffer(self.qty, dtype=np.float64),
+            'cost_zar': np.frombuffer(self.cost, dtype=np.float64),
+        })
+
+
+# --- HIFO HEAP (array-backed, keyed by lot unit cost) ---
+
+def _heap_push(heap, price, lot):
+    heap.append(lot)
+    i = len(heap) - 1
+    while i:
+        parent = (i - 1) >> 1
+        if price[heap[parent]] >= price[lot]:
+            break
+        heap[i] = heap[parent]
+        i = parent
+    heap[i] = lot
+
+
+def _heap_pop(heap, price):
+    top = heap[0]
+    last = heap.pop()
+    n = len(heap)
+    if n:
+        key = price[last]
+        i = 0
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and price[heap[child + 1]] > price[heap[child]]:
+                child += 1
+            if price[heap[child]] <= key:
+                break
+            heap[i] = heap[child]
+            i = child
+        heap[i] = last
+    return top
+
+
+def match_lots(delta, value, action, methods=METHODS, deposit_price=None):
+    """
+    Single scan over a classified, time-sorted ledger.
+
+    delta: signed coin change per row. value: ZAR value per row.
+    action: codes from alphawolf.ledger.actions.classify().
+    deposit_price: optional per-row ZAR price (prices.price_at) used to cost
+    phantom deposits; rows where it is NaN fall back to the implied price.
+    """
+    deltas = np.asarray(delta, dtype=np.float64).tolist()
+    values = np.asarray(value, dtype=np.float64).tolist()
+    unit_prices = None if deposit_price is None else np.asarray(deposit_price, dtype=np.float64).tolist()
+    actions = np.asarray(action).tolist()
+    n = len(deltas)
+    use = {m: m in methods for m in METHODS}
+    fifo_id, lifo_id, hifo_id, avco_id = range(4)
+
+    # Shared lot columns + per-method remaining quantity.
+    lot_price, lot_row = array('d'), array('q')
+    remaining = {m: array('d') for m in ('FIFO', 'LIFO', 'HIFO')}
+    fifo_head = 0
+    lifo_stack, hifo_heap = array('q'), array('q')
+    pool_coins = pool_cost = 0.0
+
+    cost_basis = {m: np.zeros(n) for m in METHODS if use[m]}
+    phantom = np.zeros(n)
+    matches = _Matches()
+    external_balance = 0.0
+
+    def consume(rem, lot, qty, row, method_id):
+        take = rem[lot] if rem[lot] < qty else qty
+        rem[lot] -= take
+        cost = take * lot_price[lot]
+        matches.add(row, method_id, lot_row[lot], take, cost)
+        return take, cost
+
+    for i in range(n):
+        code = actions[i]
+        qty = abs(deltas[i])
+        acquired = 0.0
+
+        # 1. CLASSIFY THE FLOW
+        if code in ACQUISITIONS:
+            acquired, acq_value = qty, values[i]
+        elif code == RECEIVE:
+            if external_balance >= qty:
+                external_balance -= qty
+            else:
+                acquired = qty - max(0.0, external_balance)
+                external_balance = 0.0
+                if unit_prices is not None and unit_prices[i] == unit_prices[i]:  # not NaN
+                    acq_value = acquired * unit_prices[i]
+                else:
+                    acq_value = acquired * (values[i] / qty if qty > 0 else 0.0)
+                phantom[i] = acquired
+        elif code in TRANSFERS_OUT:
+            external_balance += qty
+            continue
+
+        # 2. ACQUISITION: open a lot for every lot method, grow the AVCO pool
+        if acquired > 0:
+            lot = len(lot_price)
+            lot_price.append(acq_value / acquired)
+            lot_row.append(i)
+            for rem in remaining.values():
+                rem.append(acquired)
+            if use['LIFO']:
+                lifo_stack.append(lot)
+            if use['HIFO']:
+                _heap_push(hifo_heap, lot_price, lot)
+            pool_coins += acquired
+            pool_cost += acq_value
+            if pool_coins <= AVCO_EPSILON:
+                pool_cost = 0.0
+            continue
+
+        if code not in DISPOSALS or qty <= 0:
+            continue
+
+        # 3. DISPOSAL: match lots per method
+        if use['FIFO']:
+            rem, left, total = remaining['FIFO'], qty, 0.0
+            while left > LOT_EPSILON and fifo_head < len(rem):
+                take, cost = consume(rem, fifo_head, left, i, fifo_id)
+                left -= take
+                total += cost
+                if rem[fifo_head] <= LOT_EPSILON:
+                    fifo_head += 1
+            cost_basis['FIFO'][i] = total
+            if left > LOT_EPSILON:
+                matches.add(i, fifo_id, -1, left, 0.0)
+
+        if use['LIFO']:
+            rem, left, total = remaining['LIFO'], qty, 0.0
+            while left > LOT_EPSILON and lifo_stack:
+                lot = lifo_stack[-1]
+                take, cost = consume(rem, lot, left, i, lifo_id)
+                left -= take
+                total += cost
+                if rem[lot] <= LOT_EPSILON:
+                    lifo_stack.pop()
+            cost_basis['LIFO'][i] = total
+            if left > LOT_EPSILON:
+                matches.add(i, lifo_id, -1, left, 0.0)
+
+        if use['HIFO']:
+            rem, left, total = remaining['HIFO'], qty, 0.0
+            while left > LOT_EPSILON and hifo_heap:
+                lot = hifo_heap[0]
+                take, cost = consume(rem, lot, left, i, hifo_id)
+                left -= take
+                total += cost
+                if rem[lot] <= LOT_EPSILON:
+                    _heap_pop(hifo_heap, lot_price)
+            cost_basis['HIFO'][i] = total
+            if left > LOT_EPSILON:
+                matches.add(i, hifo_id, -1, left, 0.0)
+
+        if use['AVCO']:
+            if pool_coins > 0:
+                avg = pool_cost / pool_coins if pool_coins > AVCO_EPSILON else 0.0
+                cost = qty * avg
+                pool_cost -= cost
+                pool_coins -= qty
+                cost_basis['AVCO'][i] = cost
+                matches.add(i, avco_id, -1, qty, cost)
+            if pool_coins <= AVCO_EPSILON:
+                pool_cost = 0.0
+
+    # --- OPEN LOTS ---
+    prices = np.frombuffer(lot_price, dtype=np.float64)
+    rows = np.frombuffer(lot_row, dtype=np.int64)
+    open_lots = {}
+    for m in ('FIFO', 'LIFO', 'HIFO'):
+        if use[m]:
+            rem = np.frombuffer(remaining[m], dtype=np.float64)
+            held = rem > LOT_EPSILON
+            open_lots[m] = pd.DataFrame({'lot_row': rows[held], 'qty': rem[held], 'unit_cost_zar': prices[held]})
+    if use['AVCO']:
+        open_lots['AVCO'] = pd.DataFrame({
+            'lot_row': [-1], 'qty': [pool_coins],
+            'unit_cost_zar': [pool_cost / pool_coins if pool_coins > 0 else 0.0]})
+
+    return LotResult(matches.to_frame(), cost_basis, open_lots, phantom)
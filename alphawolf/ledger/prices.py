@@ -0,0 +1,105 @@
+"""
+🐺 ALPHAWOLF: LOCAL PRICE STORE (ZAR)
+
+Historical coin prices from files on disk, never the network. One file per
+coin under PRICE_DIR, CSV or Parquet:
+
+    prices/BTC_ZAR.csv        Date,Close
+                              2024-03-01,1185000.00
+                              ...
+
+Prices are held as two sorted arrays (int64 ns timestamps, float64 ZAR) and
+looked up with np.searchsorted: the price at time t is the last close at or
+before t. Marking a million ledger rows is one binary search per row, done
+in C. This replaces the per-row value_zar / abs_delta guess for phantom
+deposits and the single hard-coded CURRENT_BTC_PRICE_ZAR.
+"""
+import os
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from alphawolf.ledger.actions import COL_DELTA, COL_TIME
+
+PRICE_DIR = os.environ.get('ALPHAWOLF_PRICES', 'prices')
+TIME_COLUMNS = ('timestamp', 'date', 'time')
+PRICE_COLUMNS = ('close_zar', 'price_zar', 'close', 'price')
+
+PriceSeries = namedtuple('PriceSeries', ['coin', 'times', 'prices'])
+
+
+def _pick(columns, wanted, path):
+    lower = {c.lower(): c for c in columns}
+    for name in wanted:
+        if name in lower:
+            return lower[name]
+    raise ValueError(f"{path}: expected one of {wanted} in columns {list(columns)}.")
+
+
+def load_price_file(path, coin=None):
+    """Read one CSV/Parquet price file into a sorted PriceSeries."""
+    frame = pd.read_parquet(path) if path.endswith('.parquet') else pd.read_csv(path)
+    times = pd.to_datetime(frame[_pick(frame.columns, TIME_COLUMNS, path)]).to_numpy('datetime64[ns]')
+    prices = frame[_pick(frame.columns, PRICE_COLUMNS, path)].to_numpy(dtype=np.float64)
+    order = np.argsort(times, kind='stable')
+    coin = coin or os.path.basename(path).split('_')[0].split('.')[0].upper()
+    return PriceSeries(coin, times[order].view(np.int64), prices[order])
+
+
+def load_prices(coin, directory=None):
+    """Find <COIN>_ZAR.parquet or <COIN>_ZAR.csv under the price directory."""
+    directory = PRICE_DIR if directory is None else directory
+    for ext in ('.parquet', '.csv'):
+        path = os.path.join(directory, f'{coin.upper()}_ZAR{ext}')
+        if os.path.exists(path):
+            return load_price_file(path, coin.upper())
+    raise FileNotFoundError(f"No price file for {coin} in {directory} (expected {coin.upper()}_ZAR.csv).")
+
+
+def price_at(series, timestamps):
+    """Last known ZAR price at or before each timestamp (NaN before the first)."""
+    t = pd.DatetimeIndex(timestamps).to_numpy('datetime64[ns]').view(np.int64)
+    idx = np.searchsorted(series.times, t, side='right') - 1
+    return np.where(idx >= 0, series.prices[np.maximum(idx, 0)], np.nan)
+
+
+def spot(series):
+    """Latest price in the store."""
+    return float(series.prices[-1])
+
+
+def mark_to_market(ledger, series):
+    """
+    Add price_zar, holdings and holdings_value_zar to a prepared ledger.
+
+    holdings is the running balance of the export itself (the exchange-side
+    view: coins sent to other wallets leave it).
+    """
+    out = ledger.copy()
+    out['price_zar'] = price_at(series, out[COL_TIME])
+    out['holdings'] = np.cumsum(out[COL_DELTA].to_numpy(dtype=np.float64))
+    out['holdings_value_zar'] = out['holdings'] * out['price_zar']
+    return out
+
+
+def holdings_timeline(ledger, series, freq='D', end=None):
+    """
+    End-of-period holdings and ZAR value, one row per day (or per `freq` period).
+
+    Balances come from a searchsorted into the ledger's cumulative deltas;
+    prices from the store. No per-day loop.
+    """
+    times = ledger[COL_TIME].to_numpy('datetime64[ns]')
+    if not len(times):
+        return pd.DataFrame(columns=['date', 'holdings', 'price_zar', 'value_zar'])
+    balance = np.cumsum(ledger[COL_DELTA].to_numpy(dtype=np.float64))
+    end = pd.Timestamp(end) if end is not None else pd.Timestamp(times[-1])
+    dates = pd.date_range(pd.Timestamp(times[0]).normalize(), end.normalize(), freq=freq)
+    close = (dates + pd.tseries.frequencies.to_offset(freq)).to_numpy('datetime64[ns]')  # period end
+
+    idx = np.searchsorted(times, close, side='left') - 1
+    holdings = np.where(idx >= 0, balance[np.maximum(idx, 0)], 0.0)
+    price = price_at(series, close - np.timedelta64(1, 'ns'))
+    return pd.DataFrame({'date': dates, 'holdings': holdings, 'price_zar': price,
+                         'value_zar': holdings * price})
@@ -0,0 +1,131 @@
+"""
+🐺 ALPHAWOLF: PNL & TAX-YEAR REPORTING
+
+Turns the lot engine's cost basis into the numbers SARS asks for.
+
+    realized:   proceeds - cost, per disposal, for every method at once
+                (fiat sells and crypto swaps realize the ZAR value received;
+                fees dispose coins for nothing, so they realize -cost)
+    tax year:   South African year of assessment, 1 March - end February,
+                labelled by the year it ends in (Mar 2024 - Feb 2025 = 2025),
+                on SA time (exports are UTC: 23:00 UTC on 28 Feb is 1 March)
+    unrealized: open lots marked to a spot price (CURRENT_BTC_PRICE_ZAR style)
+
+Everything is columnar: one frame with a cost/pnl column pair per method,
+then groupby/resample for the aggregates.
+"""
+import numpy as np
+import pandas as pd
+
+from alphawolf.ledger.actions import (ACTION_LABELS, COL_DELTA, COL_TIME, COL_VALUE, DISPOSALS,
+                                      FEE, SELL_SWAP, prepare)
+from alphawolf.ledger.lots import METHODS, match_lots
+from alphawolf.ledger.prices import load_prices, price_at
+from alphawolf.ledger.prices import spot as latest_price
+from alphawolf.ledger.transfers import book_fees, match_transfers
+
+TAX_YEAR_START_MONTH = 3  # SA year of assessment starts 1 March
+TAX_TZ = 'Africa/Johannesburg'
+
+
+def local_time(timestamps):
+    """Timestamps as SA wall-clock time (naive input is taken as UTC)."""
+    ts = pd.DatetimeIndex(timestamps)
+    ts = ts.tz_localize('UTC') if ts.tz is None else ts
+    return ts.tz_convert(TAX_TZ).tz_localize(None)
+
+
+def tax_year(timestamps):
+    """SA tax year label (the calendar year in which February closes it, SA time)."""
+    ts = local_time(timestamps)
+    return ts.year + (ts.month >= TAX_YEAR_START_MONTH).astype(int)
+
+
+def realized_pnl(ledger, lots, currency):
+    """
+    One row per disposal with proceeds and cost/PnL columns for every method.
+
+    ledger: output of actions.prepare(); lots: LotResult for the same ledger.
+    """
+    action = ledger['action'].to_numpy()
+    rows = np.flatnonzero(np.isin(action, DISPOSALS))
+    act = action[rows]
+    value = ledger[COL_VALUE].to_numpy(dtype=np.float64)[rows]
+
+    proceeds = np.where(act == FEE, 0.0, value)
+    kind = np.select([act == FEE, act == SELL_SWAP], ['fee', 'swap'], default='sell')
+    out = pd.DataFrame({
+        'timestamp': ledger[COL_TIME].to_numpy()[rows],
+        'currency': currency,
+        'action': ACTION_LABELS[act],
+        'kind': kind,
+        'qty': -ledger[COL_DELTA].to_numpy(dtype=np.float64)[rows],
+        'market_value_zar': value,
+        'proceeds_zar': proceeds,
+    })
+    for method, basis in lots.cost_basis.items():
+        out[f'cost_{method}'] = basis[rows]
+        out[f'pnl_{method}'] = proceeds - basis[rows]
+    out['tax_year'] = tax_year(out['timestamp'])
+    return out
+
+
+def unrealized_pnl(lots, spot_zar, currency):
+    """Mark open lots to spot: one row per method."""
+    records = []
+    for method, held in lots.open_lots.items():
+        qty = held['qty'].sum()
+        cost = (held['qty'] * held['unit_cost_zar']).sum()
+        market = qty * spot_zar
+        records.append({'currency': currency, 'method': method, 'qty': qty, 'cost_zar': cost,
+                        'market_value_zar': market, 'unrealized_zar': market - cost})
+    return pd.DataFrame(records)
+
+
+def build_pnl(export, coins=('BTC',), spot_zar=None, methods=METHODS, transfer_window=None,
+              price_dir=None):
+    """
+    Realized and unrealized PnL for several coins from one raw export.
+
+    spot_zar: {coin: current price in ZAR}; coins without a spot are skipped
+    in the unrealized table. transfer_window (e.g. '7D') pairs sends with
+    receives first (transfers.match_transfers). price_dir: local price store
+    (prices.py) used to cost phantom deposits at the historical price and as
+    the spot when spot_zar has none. Returns (realized, unrealized).
+    """
+    spot_zar = dict(spot_zar or {})
+    realized, unrealized = [], []
+    for coin in coins:
+        ledger = prepare(export, coin=coin)
+        if ledger.empty:
+            continue
+        if transfer_window is not None:
+            ledger = book_fees(ledger, match_transfers(ledger, window=transfer_window))
+        deposit_price = None
+        if price_dir is not None:
+            series = load_prices(coin, price_dir)
+            deposit_price = price_at(series, ledger[COL_TIME])
+            spot_zar.setdefault(coin, latest_price(series))
+        lots = match_lots(ledger[COL_DELTA], ledger[COL_VALUE], ledger['action'], methods, deposit_price)
+        realized.append(realized_pnl(ledger, lots, coin))
+        if coin in spot_zar:
+            unrealized.append(unrealized_pnl(lots, spot_zar[coin], coin))
+    return (pd.concat(realized, ignore_index=True) if realized else pd.DataFrame(),
+            pd.concat(unrealized, ignore_index=True) if unrealized else pd.DataFrame())
+
+
+def _money_columns(realized):
+    return ['proceeds_zar'] + [c for c in realized.columns if c.startswith(('cost_', 'pnl_'))]
+
+
+def tax_year_report(realized):
+    """Sum proceeds, cost and PnL per (tax_year, currency, kind)."""
+    return (realized.groupby(['tax_year', 'currency', 'kind'])[_money_columns(realized)]
+            .sum().reset_index())
+
+
+def monthly_report(realized):
+    """Month-by-month realized PnL per currency (resampled on the SA disposal date)."""
+    return (realized.set_index(local_time(realized['timestamp']))
+            .groupby('currency')[_money_columns(realized)]
+            .resample('MS').sum().reset_index())
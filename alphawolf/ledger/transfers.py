@@ -0,0 +1,177 @@
+"""
+🐺 ALPHAWOLF: TRANSFER MATCHING
+
+bitcoin_avco.py keeps one external_balance scalar: every send adds to it,
+every receive draws it down, and any shortfall becomes a phantom deposit.
+When transfers interleave (send A, send B, receive B, receive A) the wrong
+coins come back and cost basis leaks into phantom deposits.
+
+This stage pairs each outflow ("sent", "emptying") with a later inflow
+("received") of about the same size, inside a time window:
+
+    amount:  |received - sent| <= rel_tol * sent + abs_tol  (network fee slack)
+    time:    0 <= t_received - t_sent <= window
+
+Candidates come from a range join: every send in the receive's window,
+in the same log-amount bucket or a neighbouring one (so pairs straddling
+a bucket edge still meet). (bucket, time) is ranked into one sortable
+int64 key, so each receive's window is two np.searchsorted bounds over
+the sorted sends: O(n log n) plus one row per in-window candidate.
+Every in-window send is a candidate, so a near send that fails the amount
+test cannot hide an earlier one that passes. Conflicts (two receives
+claiming one send) keep the earliest receive; the loser takes its next
+best candidate in the following round.
+
+Matched legs get the SEND_MATCHED / RECEIVE_MATCHED codes, which the lot
+engine treats as non-events: the coins never left, so their lots (and cost
+basis) carry straight across the pair. What did not arrive (the pair's
+gap, the network fee) is booked by book_fees() as a FEE row right after
+the send, so it leaves the pool as a disposal. Unmatched legs keep their
+original codes and fall back to the external-balance rules.
+"""
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from alphawolf.ledger.actions import (COL_DELTA, COL_DESC, COL_TIME, COL_VALUE, FEE, RECEIVE,
+                                      RECEIVE_MATCHED, SEND_MATCHED, TRANSFERS_OUT)
+
+# pairs: one row per matched (send, receive) with amounts, gap (sent - received: the fee) and delay.
+# action: the ledger's action codes with matched legs re-coded.
+TransferMatch = namedtuple('TransferMatch', ['pairs', 'unmatched_out', 'unmatched_in', 'action'])
+
+
+def _legs(ledger, mask, rel_tol):
+    rows = np.flatnonzero(mask)
+    qty = np.abs(ledger[COL_DELTA].to_numpy(dtype=np.float64)[rows])
+    return pd.DataFrame({
+        'row': rows,
+        'time': ledger[COL_TIME].to_numpy()[rows],
+        'qty': qty,
+        'bucket': np.floor(np.log(np.maximum(qty, 1e-300)) / np.log1p(rel_tol)).astype(np.int64),
+    })
+
+
+def _window_candidates(ins, outs, window):
+    """
+    Every (receive, send) with the send in [t_in - window, t_in] and in the
+    receive's amount bucket or a neighbouring one.
+    """
+    t_out = pd.DatetimeIndex(outs['time']).as_unit('ns').asi8
+    t_in = pd.DatetimeIndex(ins['time']).as_unit('ns').asi8
+    b_in = ins['bucket'].to_numpy()
+    probe_b = np.concatenate([b_in + offset for offset in (-1, 0, 1)])
+    probe_hi = np.tile(t_in, 3)
+    probe_lo = probe_hi - window.value
+    probe_row = np.tile(np.arange(len(ins)), 3)
+
+    # Rank (bucket, time) into one int64 key so a window is two searchsorted bounds.
+    buckets, b_rank = np.unique(np.concatenate([outs['bucket'].to_numpy(), probe_b]), return_inverse=True)
+    times, t_rank = np.unique(np.concatenate([t_out, probe_lo, probe_hi]), return_inverse=True)
+    span = len(times) + 1
+    n_out, n_probe = len(outs), len(probe_b)
+    key_out = b_rank[:n_out] * span + t_rank[:n_out]
+    order = np.argsort(key_out, kind='stable')
+    key_out = key_out[order]
+    lo = np.searchsorted(key_out, b_rank[n_out:] * span + t_rank[n_out:n_out + n_probe], side='left')
+    hi = np.searchsorted(key_out, b_rank[n_out:] * span + t_rank[n_out + n_probe:], side='right')
+
+    counts = hi - lo
+    probe = np.repeat(np.arange(n_probe), counts)
+    step = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    picked = order[lo[probe] + step]
+    return pd.DataFrame({
+        'row_in': ins['row'].to_numpy()[probe_row[probe]],
+        'row_out': outs['row'].to_numpy()[picked],
+        'qty_in': ins['qty'].to_numpy()[probe_row[probe]],
+        'qty_out': outs['qty'].to_numpy()[picked],
+        'delay': probe_hi[probe] - t_out[picked],
+    })
+
+
+def match_transfers(ledger, window='7D', rel_tol=0.01, abs_tol=1e-8, max_rounds=None):
+    """
+    Pair sends with later receives of ~equal size within `window`.
+
+    ledger: output of actions.prepare() (time-sorted, 'action' column).
+    max_rounds: cap on conflict-resolution rounds (None = until no candidate
+    is left; every round matches at least one pair).
+    Returns a TransferMatch; pass it to book_fees() for the ledger to feed
+    match_lots() (matched legs re-coded, network fees booked).
+    """
+    if rel_tol <= 0:
+        raise ValueError("rel_tol must be positive (it sets the amount bucket width).")
+    window = pd.Timedelta(window)
+    action = ledger['action'].to_numpy().copy()
+
+    outs = _legs(ledger, np.isin(action, TRANSFERS_OUT), rel_tol)
+    ins = _legs(ledger, action == RECEIVE, rel_tol)
+    found = []
+
+    # 1. CANDIDATES: every send in the window, same or neighbouring bucket, within tolerance
+    cand = _window_candidates(ins, outs, window) if len(ins) and len(outs) else pd.DataFrame()
+    if not cand.empty:
+        cand = cand[np.abs(cand['qty_in'] - cand['qty_out']) <= rel_tol * cand['qty_out'] + abs_tol]
+        # Preference per receive: closest amount, then the most recent send.
+        cand = cand.assign(gap=np.abs(cand['qty_out'] - cand['qty_in']))
+        cand = cand.sort_values(['row_in', 'gap', 'delay', 'row_out'], kind='stable')
+
+    rounds = 0
+    while not cand.empty and (max_rounds is None or rounds < max_rounds):
+        rounds += 1
+        # 2. RESOLVE: best candidate per receive, then earliest receive per send
+        best = cand.drop_duplicates('row_in')
+        best = best.sort_values(['row_out', 'row_in'], kind='stable').drop_duplicates('row_out')
+        found.append(best[['row_out', 'row_in', 'qty_out', 'qty_in']])
+        cand = cand[~cand['row_out'].isin(best['row_out']) & ~cand['row_in'].isin(best['row_in'])]
+
+    times = ledger[COL_TIME].to_numpy()
+    if found:
+        pairs = pd.concat(found, ignore_index=True).sort_values('row_out', ignore_index=True)
+        outs = outs[~outs['row'].isin(pairs['row_out'])]
+        ins = ins[~ins['row'].isin(pairs['row_in'])]
+    else:
+        pairs = pd.DataFrame({'row_out': np.array([], dtype=np.int64), 'row_in': np.array([], dtype=np.int64),
+                              'qty_out': np.array([]), 'qty_in': np.array([])})
+    pairs['gap'] = pairs['qty_out'] - pairs['qty_in']
+    pairs['delay'] = times[pairs['row_in'].to_numpy()] - times[pairs['row_out'].to_numpy()]
+
+    action[pairs['row_out'].to_numpy()] = SEND_MATCHED
+    action[pairs['row_in'].to_numpy()] = RECEIVE_MATCHED
+    unmatched_out = outs.drop(columns='bucket').sort_values('row', ignore_index=True)
+    unmatched_in = ins.drop(columns='bucket').sort_values('row', ignore_index=True)
+    return TransferMatch(pairs, unmatched_out, unmatched_in, action)
+
+
+def book_fees(ledger, match, min_fee=0.0):
+    """
+    The ledger with matched legs re-coded and each pair's gap booked.
+
+    A pair that arrived short (gap = sent - received > min_fee) lost the
+    difference to the network. That is booked as a FEE row (a disposal)
+    right after the send: same timestamp, Balance delta -gap, Value amount
+    at the send's implied price (0 when the send carries no value). Rows
+    are renumbered, so use match.pairs only against the original ledger.
+    """
+    out = ledger.copy()
+    out['action'] = match.action
+    paid = match.pairs[match.pairs['gap'] > min_fee]
+    if paid.empty:
+        return out
+
+    sends = paid['row_out'].to_numpy()
+    fees = ledger.iloc[sends].copy()
+    gap = paid['gap'].to_numpy()
+    sent_value = np.abs(ledger[COL_VALUE].to_numpy(dtype=np.float64)[sends])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        price = np.where(paid['qty_out'].to_numpy() > 0, sent_value / paid['qty_out'].to_numpy(), 0.0)
+    fees[COL_DELTA] = -gap
+    fees[COL_VALUE] = np.nan_to_num(price * gap)
+    fees[COL_DESC] = 'Network fee (matched transfer)'
+    fees['action'] = np.asarray(FEE, dtype=out['action'].dtype)
+
+    # Slot each fee in right after its send; the time order is unchanged.
+    position = np.concatenate([np.arange(len(out), dtype=np.float64), sends + 0.5])
+    merged = pd.concat([out, fees], ignore_index=True)
+    return merged.iloc[np.argsort(position, kind='stable')].reset_index(drop=True)
@@ -0,0 +1,176 @@
+"""
+🐺 ALPHAWOLF: MODEL REGISTRY
+
+Every valuation script, by short name, with the variable that holds its
+fair-value distribution and the constant that holds the market price.
+
+Scripts are executed in-process with runpy, so the caller gets the script's
+full namespace back (the distribution, every input draw, every segment)
+without the script having to know it is being driven. Three environment
+switches are honoured by every script:
+
+    ALPHAWOLF_SIMULATIONS  override SIMULATIONS
+    ALPHAWOLF_PLOT=0       skip matplotlib/seaborn entirely (stats-only runs)
+    ALPHAWOLF_SEED         override the np.random.seed(42) (sharded runs)
+"""
+import ast
+import contextlib
+import io
+import os
+import re
+import runpy
+import sys
+import time
+from collections import namedtuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# script: path from the repo root | output: distribution variable
+# price: current price variable   | currency: unit of output and price
+ModelSpec = namedtuple('ModelSpec', ['script', 'output', 'price', 'currency'])
+ModelRun = namedtuple('ModelRun', ['name', 'values', 'price', 'currency', 'namespace', 'seconds'])
+
+MODELS = {
+    'araxi': ModelSpec('valuations/val_araxi.py', 'fair_value_per_share', 'CURRENT_PRICE', 'ZAc'),
+    'aspi': ModelSpec('valuations/val_aspi.py', 'fair_value_per_share', 'CURRENT_PRICE', 'USD'),
+    'boxer': ModelSpec('valuations/val_boxer.py', 'fair_value_per_share', 'CURRENT_PRICE', 'ZAR'),
+    'cohr': ModelSpec('valuations/val_cohr.py', 'price_per_share', 'CURRENT_PRICE', 'USD'),
+    'crispr': ModelSpec('valuations/val_crispr.py', 'fair_value_dist', 'current_price', 'USD'),
+    'fcel': ModelSpec('valuations/val_FCEL.py', 'fair_value_per_share', 'CURRENT_PRICE', 'USD'),
+    'glencore': ModelSpec('valuations/val_glencore.py', 'fair_value_zar', 'CURRENT_PRICE', 'ZAR'),
+    'google': ModelSpec('valuations/val_google.py', 'price_per_share', 'current_price', 'USD'),
+    'meta': ModelSpec('valuations/val_meta.py', 'fair_value_per_share', 'CURRENT_PRICE', 'USD'),
+    'picknpay': ModelSpec('valuations/val_picknpay.py', 'final_value', 'CURRENT_PRICE', 'ZAR'),
+    'richemont': ModelSpec('valuations/val_richemont.py', 'fair_value_zar', 'CURRENT_PRICE', 'ZAR'),
+    'ssw': ModelSpec('valuations/val_ssw.py', 'fair_value_per_share', 'CURRENT_PRICE', 'ZAR'),
+    'tesla': ModelSpec('valuations/val_tesla.py', 'fair_value_dist', 'current_price', 'USD'),
+    'template': ModelSpec('docs/template_valuation.py', 'fair_value_dist', 'CURRENT_PRICE', 'USD'),
+}
+
+
+def get_spec(name):
+    try:
+        return MODELS[name.lower()]
+    except KeyError:
+        raise KeyError(f"Unknown model '{name}'. Registered: {', '.join(sorted(MODELS))}.") from None
+
+
+def default_simulations(name):
+    """The SIMULATIONS default written in the script (without running it)."""
+    with open(os.path.join(ROOT, get_spec(name).script), encoding='utf-8') as fh:
+        match = re.search(r"ALPHAWOLF_SIMULATIONS',\s*([\d_]+)", fh.read())
+    if match is None:
+        raise ValueError(f"{name}: no ALPHAWOLF_SIMULATIONS default found in the script.")
+    return int(match.group(1))
+
+
+@contextlib.contextmanager
+def _script_env(simulations, plot, seed=None):
+    """Temporarily set the ALPHAWOLF_* switches the scripts read."""
+    saved = {k: os.environ.get(k) for k in ('ALPHAWOLF_SIMULATIONS', 'ALPHAWOLF_PLOT', 'ALPHAWOLF_SEED')}
+    if simulations is not None:
+        os.environ['ALPHAWOLF_SIMULATIONS'] = str(int(simulations))
+    os.environ['ALPHAWOLF_PLOT'] = '1' if plot else '0'
+    if seed is not None:
+        os.environ['ALPHAWOLF_SEED'] = str(int(seed))
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+class _Override(ast.NodeTransformer):
+    """After the first `name = ...` in any body, insert `name = __override__['name'](name)`."""
+
+    def __init__(self, names):
+        self.pending = set(names)
+
+    def _patch(self, body):
+        out = []
+        for stmt in body:
+            out.append(self.visit(stmt))
+            if isinstance(stmt, ast.Assign):
+                for target in stmt.targets:
+                    if isinstance(target, ast.Name) and target.id in self.pending:
+                        self.pending.discard(target.id)
+                        out.extend(ast.parse(f"{target.id} = __override__[{target.id!r}]({target.id})").body)
+        return out
+
+    def generic_visit(self, node):
+        for field in ('body', 'orelse', 'finalbody'):
+            if isinstance(getattr(node, field, None), list):
+                setattr(node, field, self._patch(getattr(node, field)))
+        for child in ast.iter_child_nodes(node):
+            if not isinstance(child, ast.stmt):
+                self.visit(child)
+        return node
+
+
+def _run_with_overrides(path, overrides):
+    """Execute a script with each overridden variable passed through its function."""
+    with open(path, encoding='utf-8') as fh:
+        tree = ast.parse(fh.read(), filename=path)
+    patcher = _Override(overrides)
+    tree = ast.fix_missing_locations(patcher.visit(tree))
+    if patcher.pending:
+        raise KeyError(f"{os.path.basename(path)}: no assignment to {sorted(patcher.pending)}.")
+    namespace = {'__name__': '__main__', '__file__': path, '__override__': overrides}
+    exec(compile(tree, path, 'exec'), namespace)
+    return namespace
+
+
+def run_model(name, simulations=None, plot=False, quiet=False, seed=None, overrides=None):
+    """
+    Execute a registered valuation script and return its distribution.
+
+    quiet=True swallows the script's own report (the caller will print its
+    own). seed replaces the script's np.random.seed(42). overrides maps a
+    variable name to a function applied right after the script first
+    assigns it ({'wacc_dist': lambda w: w + 0.01}); no random draws are
+    added, so every path keeps its stream. Returns a ModelRun with the
+    script's full namespace attached.
+    """
+    spec = get_spec(name)
+    path = os.path.join(ROOT, spec.script)
+    sink = io.TextIOWrapper(io.BytesIO(), encoding='utf-8') if quiet else None
+
+    start = time.perf_counter()
+    with _script_env(simulations, plot, seed), \
+            (contextlib.redirect_stdout(sink) if quiet else contextlib.nullcontext()):
+        # Scripts may rewrap sys.stdout on Windows; put the real one back after.
+        stdout = sys.stdout
+        try:
+            if overrides:
+                namespace = _run_with_overrides(path, overrides)
+            else:
+                namespace = runpy.run_path(path, run_name='__main__')
+        finally:
+            sys.stdout = stdout
+    seconds = time.perf_counter() - start
+
+    return ModelRun(name.lower(), namespace[spec.output], float(namespace[spec.price]),
+                    spec.currency, namespace, seconds)
+
+
+def summarize(values, price):
+    """The SIMULATION REPORT numbers for one distribution."""
+    import numpy as np
+
+    values = np.asarray(values, dtype=np.float64)
+    mean_val = float(np.mean(values))
+    p10, p50, p90 = (float(x) for x in np.percentile(values, [10, 50, 90]))
+    return {
+        'n': int(values.size),
+        'price': float(price),
+        'mean': mean_val,
+        'p10': p10,
+        'p50': p50,
+        'p90': p90,
+        'prob_profit': float(np.mean(values > price)),
+        'upside_mean': (mean_val - price) / price,
+        'edge_p50': (p50 - price) / price,
+    }
@@ -0,0 +1,98 @@
+"""
+🐺 ALPHAWOLF: NAV / RESOURCES ENGINE (THE LOCKER OF GOLD)
+
+Production_t x (Price_t - Cost_t), discounted year by year until the hole is
+empty. Instead of one static basket price per path, commodity prices follow
+a path per simulation:
+
+    GBM:            ln P_t = ln P_{t-1} + (mu - sigma^2 / 2) + sigma * z
+    Mean reversion: ln P_t = ln P_{t-1} + kappa * (ln P_bar - ln P_{t-1}) + sigma * z
+
+The engine streams over years: each step updates the (paths,) price and
+reserve state, adds the discounted cash flow, and throws the year away.
+Memory is O(paths), never O(paths x years), so 1e6 paths is fine.
+"""
+import numpy as np
+
+
+def _per_path(x, paths):
+    return np.broadcast_to(np.asarray(x, dtype=np.float64), (paths,))
+
+
+def discount_factors(rate, years):
+    """Precomputed (years,) factors 1 / (1 + r)^t for a scalar rate."""
+    return (1.0 + rate) ** -np.arange(1, years + 1)
+
+
+def simulate_nav(spot, sigma, years, production, cost, reserves=None, rate=0.10,
+                 drift=0.0, kappa=0.0, long_run=None, cost_inflation=0.0,
+                 tax_rate=0.0, rehab=0.0, net_debt=0.0, paths=None, rng=None, keep_paths=False):
+    """
+    Life-of-mine NAV for every path, streamed over years.
+
+    spot, sigma, production, cost, reserves, long_run, rehab and net_debt
+    may be per-path arrays (or scalars).
+    production: annual output (units/yr). cost: all-in cost per unit in year 1.
+    reserves:   total units in the ground; mining stops when they run out
+                (None = produce for all `years`).
+    kappa > 0 switches from GBM to log mean reversion toward long_run
+                (required then; ValueError without it).
+    rate:       scalar discount rate (factors are precomputed once).
+    rehab:      closure cost paid in the final year of mining.
+    paths:      number of paths when every input is a scalar.
+
+    Returns the (paths,) NAV, or (nav, prices) with keep_paths=True, where
+    prices is the (paths x years) price path matrix.
+    """
+    if kappa and long_run is None:
+        raise ValueError("kappa > 0 (mean reversion) needs a long_run price.")
+    rng = np.random if rng is None else rng
+    if paths is None:
+        per_path = [x for x in (spot, sigma, production, cost, reserves, long_run, rehab, net_debt) if x is not None]
+        paths = np.broadcast(*(np.atleast_1d(np.asarray(x, dtype=np.float64)) for x in per_path)).shape[0]
+
+    log_price = np.log(_per_path(spot, paths)).copy()
+    sigma = _per_path(sigma, paths)
+    production = _per_path(production, paths)
+    unit_cost = _per_path(cost, paths).copy()
+    remaining = np.full(paths, np.inf) if reserves is None else _per_path(reserves, paths).copy()
+    log_anchor = None if long_run is None else np.log(_per_path(long_run, paths))
+    rehab = _per_path(rehab, paths)
+
+    disc = discount_factors(rate, years)
+    nav = np.zeros(paths)
+    closed = np.zeros(paths, dtype=bool)
+    prices = np.empty((paths, years)) if keep_paths else None
+
+    for t in range(years):
+        # 1. PRICE STEP
+        shock = sigma * rng.normal(0.0, 1.0, paths)
+        if kappa:
+            log_price += kappa * (log_anchor - log_price) + shock
+        else:
+            log_price += drift - 0.5 * sigma ** 2 + shock
+        price = np.exp(log_price)
+        if keep_paths:
+            prices[:, t] = price
+
+        # 2. DEPLETION
+        volume = np.minimum(production, remaining)
+        remaining -= volume
+
+        # 3. CASH FLOW (taxed only when profitable)
+        margin = volume * (price - unit_cost)
+        cash_flow = margin - tax_rate * np.maximum(margin, 0.0)
+
+        # Closure: rehab is paid in the year the locker empties.
+        closing = ~closed & (remaining <= 0)
+        cash_flow -= rehab * closing
+        closed |= closing
+
+        nav += cash_flow * disc[t]
+        unit_cost *= 1.0 + cost_inflation
+
+    if rehab.any():
+        # Mines still open at the horizon pay rehab at the end.
+        nav -= rehab * ~closed * disc[-1]
+    nav -= _per_path(net_debt, paths)
+    return (nav, prices) if keep_paths else nav
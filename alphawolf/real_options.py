@@ -0,0 +1,119 @@
+"""
+🐺 ALPHAWOLF: REAL OPTIONS LATTICE ENGINE
+
+Multi-stage decision lattice (abandon / expand / continue) valued by backward
+induction on a binomial tree, for every Monte Carlo path at once.
+
+The outer Monte Carlo draws the story (payoff size, volatility, stage costs,
+probabilities of success). The inner lattice values the *management
+flexibility* on each path: kill the project at a failed gate, scale it up
+when the market is hot, or keep paying the burn to see the next gate.
+
+Memory is a single (paths x steps+1) node buffer that shrinks in place as we
+step back through time, so 50k paths x 100 steps stays well under 100MB.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+# A decision gate: at `year` the firm pays `cost` to continue, and the
+# technology survives with probability `p_success` (private, unpriced risk).
+Stage = namedtuple('Stage', ['year', 'cost', 'p_success'])
+
+
+def _as_column(x, paths):
+    """Broadcast a scalar or per-path input to a (paths, 1) column."""
+    return np.broadcast_to(np.asarray(x, dtype=np.float64), (paths,)).reshape(paths, 1)
+
+
+def lattice_option_value(v0, sigma, years, rate=0.045, steps=100, stages=(),
+                         launch_cost=0.0, salvage=0.0, expand_factor=None,
+                         expand_cost=0.0, abandon_anytime=False, yield_rate=0.0):
+    """
+    Value a staged real option on every path via binomial backward induction.
+
+    v0, sigma, launch_cost, salvage, expand_cost may be scalars or (paths,)
+    arrays. Stage costs and probabilities may also be per-path arrays.
+
+    At maturity each node takes the best of: abandon (salvage), launch
+    (V - launch_cost) or expand (expand_factor * V - launch_cost - expand_cost).
+    At each stage gate the node takes max(salvage, p_success * hold - cost).
+    With abandon_anytime, every node may also walk away for salvage.
+
+    Returns the (paths,) present value of the option.
+    """
+    per_path = [v0, sigma, launch_cost, salvage, expand_cost] + [x for s in stages for x in (s.cost, s.p_success)]
+    if expand_factor is not None:
+        per_path.append(expand_factor)
+    paths = np.broadcast(*(np.atleast_1d(np.asarray(x, dtype=np.float64)) for x in per_path)).shape[0]
+    v0 = _as_column(v0, paths)
+    sigma = _as_column(sigma, paths)
+    salvage = _as_column(salvage, paths)
+
+    # --- 1. LATTICE GEOMETRY (CRR) ---
+    dt = years / steps
+    up = np.exp(sigma * np.sqrt(dt))
+    down = 1.0 / up
+    growth = np.exp((rate - yield_rate) * dt)
+    q = (growth - down) / (up - down)
+    if np.any((q <= 0) | (q >= 1)):
+        raise ValueError("Lattice is not arbitrage-free: increase steps or sigma.")
+    disc = np.exp(-rate * dt)
+    q_up = disc * q
+    q_down = disc * (1.0 - q)
+
+    # Map each stage gate onto its lattice step.
+    gates = {}
+    for stage in stages:
+        step = int(round(stage.year / dt))
+        if not 0 <= step < steps:
+            raise ValueError(f"Stage at year {stage.year} falls outside the {years}y lattice.")
+        gates.setdefault(step, []).append(stage)
+
+    # --- 2. TERMINAL PAYOFF (ABANDON / LAUNCH / EXPAND) ---
+    log_u = np.log(up)
+    exponents = steps - 2.0 * np.arange(steps + 1)
+    underlying = v0 * np.exp(log_u * exponents)
+    values = np.maximum(underlying - _as_column(launch_cost, paths), salvage)
+    if expand_factor is not None:
+        expanded = (_as_column(expand_factor, paths) * underlying
+                    - _as_column(launch_cost, paths) - _as_column(expand_cost, paths))
+        np.maximum(values, expanded, out=values)
+    del underlying
+
+    # --- 3. BACKWARD INDUCTION ---
+    # values[:, :j+1] holds the j+1 live nodes at step j.
+    hold = np.empty_like(values)
+    for j in range(steps - 1, -1, -1):
+        live = hold[:, :j + 1]
+        np.multiply(values[:, :j + 1], q_up, out=live)
+        live += q_down * values[:, 1:j + 2]
+
+        for stage in gates.get(j, ()):
+            live *= _as_column(stage.p_success, paths)
+            live -= _as_column(stage.cost, paths)
+            np.maximum(live, salvage, out=live)
+
+        if abandon_anytime:
+            np.maximum(live, salvage, out=live)
+
+        values[:, :j + 1] = live
+
+    return values[:, 0].copy()
+
+
+def static_npv(v0, years, rate=0.045, stages=(), launch_cost=0.0):
+    """
+    The coin-flip benchmark: expected payoff with no flexibility.
+
+    Every stage is paid up front in its year and the launch always happens.
+    The gap between this and lattice_option_value() is the value of
+    management's right to walk away (or double down).
+    """
+    survival = 1.0
+    pv_costs = 0.0
+    for stage in sorted(stages, key=lambda s: s.year):
+        pv_costs = pv_costs + survival * np.asarray(stage.cost) * np.exp(-rate * stage.year)
+        survival = survival * np.asarray(stage.p_success)
+    pv_payoff = survival * (np.asarray(v0) - np.exp(-rate * years) * np.asarray(launch_cost))
+    return pv_payoff - pv_costs
@@ -0,0 +1,174 @@
+"""
+🐺 ALPHAWOLF: PRICE-ONLY REVALUATION (THE QUICK LOOK)
+
+A model's fair-value distribution does not depend on CURRENT_PRICE. Only
+the three signal numbers do:
+
+    prob_profit  = P(value > price)    = (n - searchsorted(sorted, price)) / n
+    upside_mean  = mean / price - 1
+    edge_p50     = P50 / price - 1
+
+So each model's distribution is stored once, sorted, and every new quote
+(or a whole vector of intraday quotes) is a binary search, not a rerun.
+
+Distributions live under CACHE_DIR/distributions (the FX cache's directory,
+anchored to the repo, so any working directory finds them) as
+<model>_<as_of>.npy (sorted float64) with a .json sidecar (currency, model
+price, paths). The dated snapshots double as the history the backtest
+replays.
+
+Quotes come from any QuoteSource; FileQuoteSource is the local stand-in
+(CSV of name,price[,timestamp]) until a live feed is wired in.
+"""
+import abc
+import datetime as dt
+import glob
+import json
+import os
+from collections import namedtuple
+
+import numpy as np
+
+from alphawolf.fx import CACHE_DIR
+
+STORE_DIR = os.path.join(CACHE_DIR, 'distributions')
+
+# sorted: ascending float64 values. model_price: the script's own CURRENT_PRICE.
+Distribution = namedtuple('Distribution', ['name', 'as_of', 'sorted', 'mean', 'p50', 'currency', 'model_price'])
+
+
+# --- 1. THE DISTRIBUTION STORE ---
+
+def _paths(name, as_of):
+    stem = os.path.join(STORE_DIR, f'{name.lower()}_{as_of}')
+    return f'{stem}.npy', f'{stem}.json'
+
+
+def save_distribution(name, values, currency, model_price, as_of=None):
+    """Store a run's distribution (sorted) as the snapshot for `as_of` (default today)."""
+    as_of = str(as_of or dt.date.today().isoformat())
+    values = np.sort(np.asarray(values, dtype=np.float64).ravel())
+    os.makedirs(STORE_DIR, exist_ok=True)
+    npy, meta = _paths(name, as_of)
+    tmp = f'{npy}.{os.getpid()}.tmp.npy'
+    np.save(tmp, values)
+    os.replace(tmp, npy)
+    with open(meta, 'w', encoding='utf-8') as fh:
+        json.dump({'currency': currency, 'model_price': float(model_price), 'paths': int(values.size)}, fh)
+    return _distribution(name, as_of, values, currency, model_price)
+
+
+def _distribution(name, as_of, values, currency, model_price):
+    n = values.size
+    p50 = float(values[n // 2]) if n % 2 else float(0.5 * (values[n // 2 - 1] + values[n // 2]))
+    return Distribution(name.lower(), as_of, values, float(values.mean()), p50, currency, float(model_price))
+
+
+def stored_dates(name):
+    """Snapshot dates on disk for a model, oldest first."""
+    prefix = f'{name.lower()}_'
+    files = glob.glob(os.path.join(STORE_DIR, f'{prefix}*.npy'))
+    return sorted(os.path.basename(f)[len(prefix):-4] for f in files)
+
+
+def load_distribution(name, as_of=None):
+    """A stored snapshot (latest when as_of is None), memory-mapped."""
+    dates = stored_dates(name)
+    if not dates:
+        raise FileNotFoundError(f"No stored distribution for {name} in {STORE_DIR}.")
+    as_of = dates[-1] if as_of is None else str(as_of)
+    npy, meta = _paths(name, as_of)
+    with open(meta, encoding='utf-8') as fh:
+        info = json.load(fh)
+    return _distribution(name, as_of, np.load(npy, mmap_mode='r'), info['currency'], info['model_price'])
+
+
+def cached_distribution(name, simulations=None, refresh=False):
+    """
+    Latest stored distribution, running (and storing) the model on a miss.
+
+    simulations: path count wanted (None = whatever is stored, or the
+    script's default). A stored snapshot of another size is a miss, so the
+    model is rerun and today's snapshot replaced.
+    """
+    if not refresh and stored_dates(name):
+        dist = load_distribution(name)
+        if simulations is None or dist.sorted.size == int(simulations):
+            return dist
+    from alphawolf.models import run_model
+
+    run = run_model(name, simulations=simulations, quiet=True)
+    return save_distribution(name, run.values, run.currency, run.price)
+
+
+# --- 2. REVALUATION ---
+
+def reprice(dist, prices):
+    """
+    Signal numbers for new price(s). Scalar in, floats out; array in,
+    arrays out (one entry per quote).
+    """
+    p = np.asarray(prices, dtype=np.float64)
+    n = dist.sorted.size
+    above = n - np.searchsorted(dist.sorted, p, side='right')
+    out = {
+        'price': p,
+        'prob_profit': above / n,
+        'upside_mean': dist.mean / p - 1.0,
+        'edge_p50': dist.p50 / p - 1.0,
+    }
+    if p.ndim == 0:
+        return {k: float(v) for k, v in out.items()}
+    return out
+
+
+# --- 3. QUOTE SOURCES ---
+
+class QuoteSource(abc.ABC):
+    """Where prices come from. Subclasses implement names() and history(name)."""
+
+    @abc.abstractmethod
+    def names(self):
+        """Every name the source has quotes for."""
+
+    @abc.abstractmethod
+    def history(self, name):
+        """All known quotes for `name`, oldest first (an intraday vector)."""
+
+    def quote(self, name):
+        """Latest quote."""
+        return float(self.history(name)[-1])
+
+
+class StaticQuoteSource(QuoteSource):
+    """Fixed quotes from a dict: {name: price or [prices]}."""
+
+    def __init__(self, quotes):
+        self._quotes = {k.lower(): np.atleast_1d(np.asarray(v, dtype=np.float64)) for k, v in quotes.items()}
+
+    def names(self):
+        return sorted(self._quotes)
+
+    def history(self, name):
+        try:
+            return self._quotes[name.lower()]
+        except KeyError:
+            raise KeyError(f"No quote for {name}.") from None
+
+
+class FileQuoteSource(StaticQuoteSource):
+    """
+    Local stand-in for a live feed: CSV with name,price[,timestamp] columns.
+    Rows for the same name form its intraday vector (ordered by timestamp
+    when present, otherwise file order). Re-read the file to refresh.
+    """
+
+    def __init__(self, path):
+        import pandas as pd
+
+        frame = pd.read_csv(path)
+        frame.columns = [c.lower() for c in frame.columns]
+        key = 'name' if 'name' in frame.columns else 'ticker'
+        if 'timestamp' in frame.columns:
+            frame = frame.sort_values('timestamp', kind='stable')
+        super().__init__({name: block['price'].to_numpy() for name, block in frame.groupby(key, sort=False)})
@@ -0,0 +1,125 @@
+"""
+🐺 ALPHAWOLF: REGIME SAMPLER
+
+Mixture sampling for "two universes" models (Success vs Delay, Moonshot vs
+Fail). Instead of drawing every branch's inputs for all paths and blending
+with a regime mask, each branch only draws for the paths that live in it.
+
+Optional stratification fixes the path count per regime to its probability
+(largest-remainder rounding), removing the noise in "how many paths landed
+in the 10% moonshot" from every downstream statistic.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+# inputs: {name: (n,) array}, regime: (n,) branch index, weights: (n,) path weights
+RegimeDraw = namedtuple('RegimeDraw', ['inputs', 'regime', 'weights'])
+
+
+# --- 1. DISTRIBUTION FACTORIES ---
+# Deferred draws: each returns a sampler(rng, size) so a branch can draw
+# exactly as many values as it has paths.
+
+def triangular(low, mode, high):
+    return lambda rng, size: rng.triangular(low, mode, high, size)
+
+
+def normal(mean, std):
+    return lambda rng, size: rng.normal(mean, std, size)
+
+
+def uniform(low, high):
+    return lambda rng, size: rng.uniform(low, high, size)
+
+
+def lognormal(mean, sigma):
+    return lambda rng, size: rng.lognormal(mean, sigma, size)
+
+
+def choice(values, p):
+    return lambda rng, size: rng.choice(values, size, p=p)
+
+
+# --- 2. REGIME ALLOCATION ---
+
+def stratified_counts(probs, n):
+    """Split n paths across regimes in proportion to probs (largest remainder)."""
+    probs = np.asarray(probs, dtype=np.float64)
+    probs = probs / probs.sum()
+    exact = probs * n
+    counts = np.floor(exact).astype(np.int64)
+    shortfall = n - counts.sum()
+    if shortfall:
+        counts[np.argsort(counts - exact)[:shortfall]] += 1
+    return counts
+
+
+def regime_labels(probs, n, rng=None, stratify=False, counts=None):
+    """
+    Assign each of n paths to a regime index.
+
+    Plain mode draws labels i.i.d. (the classic np.random.choice mask).
+    Stratified mode (or explicit counts) fixes how many paths each regime
+    gets, then shuffles so path order stays random.
+    """
+    rng = np.random if rng is None else rng
+    if counts is None and not stratify:
+        return rng.choice(len(probs), n, p=probs)
+    if counts is None:
+        counts = stratified_counts(probs, n)
+    labels = np.repeat(np.arange(len(counts)), counts)
+    rng.shuffle(labels)
+    return labels
+
+
+# --- 3. THE MIXTURE ---
+
+def sample_regimes(n, probs, branches, rng=None, stratify=False, min_paths=0, fill=0.0):
+    """
+    Draw branch-specific inputs only for the paths in each branch.
+
+    branches: one dict per regime, {input_name: sampler or constant}. An input
+    missing from a branch is set to `fill` on that branch's paths (e.g. the AI
+    option is worth 0 when it fails), and is never drawn there.
+
+    min_paths: guarantee at least this many paths to every regime (rare
+    branches get oversampled). Paths are then weighted by p_k / (n_k / n) so
+    weighted means stay unbiased; weights are all 1.0 otherwise.
+    """
+    rng = np.random if rng is None else rng
+    probs = np.asarray(probs, dtype=np.float64)
+    if len(probs) != len(branches):
+        raise ValueError("Need one branch spec per regime probability.")
+    if not np.isclose(probs.sum(), 1.0):
+        raise ValueError(f"Regime probabilities sum to {probs.sum():.4f}, not 1.")
+
+    counts = None
+    if min_paths:
+        if min_paths * len(probs) > n:
+            raise ValueError("min_paths is larger than the simulation budget allows.")
+        counts = stratified_counts(probs, n)
+        deficit = np.maximum(min_paths - counts, 0)
+        # Fund the rare branches from the largest one(s).
+        counts = counts + deficit
+        while counts.sum() > n:
+            counts[np.argmax(counts)] -= 1
+    regime = regime_labels(probs, n, rng, stratify=stratify, counts=counts)
+
+    weights = np.ones(n)
+    if counts is not None:
+        weights = (probs * n / np.maximum(counts, 1))[regime]
+
+    names = []
+    for branch in branches:
+        names.extend(name for name in branch if name not in names)
+    inputs = {name: np.full(n, fill, dtype=np.float64) for name in names}
+
+    for k, branch in enumerate(branches):
+        idx = np.flatnonzero(regime == k)
+        if idx.size == 0:
+            continue
+        for name, spec in branch.items():
+            inputs[name][idx] = spec(rng, idx.size) if callable(spec) else spec
+
+    return RegimeDraw(inputs, regime, weights)
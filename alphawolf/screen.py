@@ -0,0 +1,114 @@
+"""
+🐺 ALPHAWOLF: UNIVERSE SCREENER (THE WIDE NET)
+
+docs/template_valuation.py values one TICKER per run. The screener runs the
+same engine across a whole universe file, one row per ticker:
+
+    ticker, price, shares, base_revenue, net_debt            (required)
+    growth_low, growth_mode, growth_high                     (triangular)
+    margin_mean, margin_std                                  (normal)
+    multiple_low, multiple_high                              (uniform)
+    wacc_mean, wacc_std                                      (normal)
+    years                                                    (to target)
+
+Missing or blank distribution columns fall back to the template's own
+values. Every draw and every line of the DCF is a (tickers, simulations)
+array, evaluated in chunks of tickers so memory stays bounded:
+
+    future_ev  = base_revenue * (1 + g) ** years * margin * multiple
+    fair_value = (future_ev / (1 + wacc) ** years - net_debt) / shares
+
+Chunk i draws from its own seed, spawned from SeedSequence(seed) (as the
+sharded executor does), so a screen is reproducible from (seed, chunk) and
+the file's row order. Ranking: probability of profit, then P10 upside.
+"""
+import numpy as np
+import pandas as pd
+
+REQUIRED = ('ticker', 'price', 'shares', 'base_revenue', 'net_debt')
+
+# The template's narrative, used wherever the universe leaves a parameter blank.
+TEMPLATE = {
+    'growth_low': 0.05, 'growth_mode': 0.10, 'growth_high': 0.15,
+    'margin_mean': 0.20, 'margin_std': 0.02,
+    'multiple_low': 10.0, 'multiple_high': 14.0,
+    'wacc_mean': 0.10, 'wacc_std': 0.005,
+    'years': 5,
+}
+
+
+def load_universe(path):
+    """Universe CSV -> DataFrame with every template column filled."""
+    frame = pd.read_csv(path)
+    frame.columns = [c.strip().lower() for c in frame.columns]
+    missing = [c for c in REQUIRED if c not in frame.columns]
+    if missing:
+        raise ValueError(f"Universe file is missing columns: {', '.join(missing)}.")
+    for col, default in TEMPLATE.items():
+        frame[col] = frame[col].fillna(default) if col in frame.columns else default
+    if (frame['shares'] <= 0).any() or (frame['price'] <= 0).any():
+        raise ValueError("Every ticker needs positive shares and price.")
+    bad = frame[frame['growth_low'] >= frame['growth_high']]
+    if len(bad):
+        raise ValueError(f"growth_low < growth_high fails for: {', '.join(bad['ticker'].astype(str))}.")
+    bad = frame[(frame['growth_low'] > frame['growth_mode']) | (frame['growth_mode'] > frame['growth_high'])]
+    if len(bad):
+        raise ValueError(f"growth_low <= growth_mode <= growth_high fails for: {', '.join(bad['ticker'].astype(str))}.")
+    return frame.reset_index(drop=True)
+
+
+def _col(frame, name):
+    return frame[name].to_numpy(dtype=np.float64)[:, None]
+
+
+def _fair_values(rows, simulations, rng):
+    """(len(rows), simulations) fair value per share, template engine."""
+    k = len(rows)
+    growth = rng.triangular(_col(rows, 'growth_low'), _col(rows, 'growth_mode'), _col(rows, 'growth_high'),
+                            (k, simulations))
+    margin = rng.normal(_col(rows, 'margin_mean'), _col(rows, 'margin_std'), (k, simulations))
+    multiple = rng.uniform(_col(rows, 'multiple_low'), _col(rows, 'multiple_high'), (k, simulations))
+    wacc = rng.normal(_col(rows, 'wacc_mean'), _col(rows, 'wacc_std'), (k, simulations))
+
+    years = _col(rows, 'years')
+    future_ev = _col(rows, 'base_revenue') * (1 + growth) ** years * margin * multiple
+    pv_ev = future_ev / (1 + wacc) ** years
+    return (pv_ev - _col(rows, 'net_debt')) / _col(rows, 'shares')
+
+
+def screen(universe, simulations=50000, seed=42, chunk=32):
+    """
+    Value every ticker in the universe and rank them.
+
+    universe: DataFrame from load_universe (or a path to the CSV).
+    chunk:    tickers per (chunk, simulations) block; part of the result's
+              identity together with seed, like the shard count.
+    Returns one row per ticker: mean, p10, p50, p90, prob_profit,
+    upside_mean, p10_upside, sorted best first.
+    """
+    if isinstance(universe, str):
+        universe = load_universe(universe)
+    n = len(universe)
+    chunk = max(1, int(chunk))
+    starts = range(0, n, chunk)
+    seeds = np.random.SeedSequence(seed).spawn(len(starts))
+
+    price = universe['price'].to_numpy(dtype=np.float64)
+    stats = np.empty((n, 5))
+    for start, child in zip(starts, seeds):
+        stop = min(start + chunk, n)
+        rng = np.random.RandomState(child.generate_state(4))  # full 128-bit child state, as shards get
+        fv = _fair_values(universe.iloc[start:stop], simulations, rng)
+        stats[start:stop, 0] = fv.mean(axis=1)
+        stats[start:stop, 1:4] = np.percentile(fv, [10, 50, 90], axis=1).T
+        stats[start:stop, 4] = (fv > price[start:stop, None]).mean(axis=1)
+
+    out = pd.DataFrame({
+        'ticker': universe['ticker'].astype(str),
+        'price': price,
+        'mean': stats[:, 0], 'p10': stats[:, 1], 'p50': stats[:, 2], 'p90': stats[:, 3],
+        'prob_profit': stats[:, 4],
+        'upside_mean': stats[:, 0] / price - 1.0,
+        'p10_upside': stats[:, 1] / price - 1.0,
+    })
+    return out.sort_values(['prob_profit', 'p10_upside'], ascending=False, kind='stable').reset_index(drop=True)
@@ -0,0 +1,435 @@
+"""
+🐺 ALPHAWOLF: PATHWISE SENSITIVITIES (THE GREEKS, NO BUMPING)
+
+dFairValue/dWACC used to mean running the model twice and differencing.
+Here the derivative rides along with the simulation instead: each chosen
+input is replaced by a dual number
+
+    x  ->  Dual(value=x, tangent=e_i)        e_i: unit vector for input i
+
+and every +, -, *, /, **, exp, log, where, sum, ... in the script carries
+the tangent forward by the chain rule (forward-mode differentiation). One
+run of the script returns, for every path, the value AND the derivative of
+that path's fair value with respect to every input at once:
+
+    grads['wacc_dist'][j] = d fair_value[j] / d wacc_dist[j]
+
+Scripts run unchanged through models.run_model overrides, so the draws are
+the script's own. The mean of the pathwise derivatives is the derivative
+of the mean value (the "Greek"); its spread shows where the sensitivity
+lives. Quantiles (P10/P50/P90, prob_profit) are computed on values only.
+
+Limits: inputs that feed a random draw (np.random.normal(mu, ...)) are not
+differentiable pathwise, and a dual cannot pass through np.full or
+np.array([...]). Arrays the script fills in place (fcf_matrix in
+val_boxer.py) are promoted to duals with a zero tangent automatically.
+With the default inputs, the ones that cannot be differentiated are
+reported as skipped (val_cohr.py's wacc_dist); named inputs raise.
+
+An input whose only consumers are comparisons (is_success =
+rl_success_prob > 0.6 in val_meta.py) moves the fair value by jumps, not
+smoothly: its pathwise derivative is 0 on every path although the value
+depends on it. Such inputs are reported as skipped too, not as a Greek of 0.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from alphawolf.models import ROOT, get_spec, run_model
+
+# values: (paths,) fair value. grads: {input: (paths,) pathwise derivative}.
+# skipped: inputs left out because the script uses them in a way a dual
+# cannot pass through (np.full, np.array of a list, a draw parameter), or
+# only through comparisons/masks (pathwise derivative 0, jumps ignored).
+# seconds: the differentiated run. runs: model runs in total (base + skip search).
+Sensitivity = namedtuple('Sensitivity', ['model', 'values', 'grads', 'price', 'skipped', 'seconds', 'runs'])
+
+
+# --- 1. THE DUAL NUMBER ---
+
+# compared: (k,) bool, inputs whose tangent reached a comparison during the
+# current differentiated run (None outside one).
+_TRACE = {'compared': None}
+
+
+def _value(x):
+    return x.value if isinstance(x, Dual) else x
+
+
+def _note_compared(*xs):
+    """Record which inputs feed a comparison (their effect there is a jump)."""
+    compared = _TRACE['compared']
+    if compared is None:
+        return
+    for x in xs:
+        if isinstance(x, Dual):
+            compared |= x.tangent.reshape(x.tangent.shape[0], -1).any(axis=1)
+
+
+def _pad(tangent, ndim):
+    """(k,) + shape -> (k, 1, ..., 1) + shape so it broadcasts like a value of ndim dims."""
+    extra = ndim - (tangent.ndim - 1)
+    return tangent.reshape(tangent.shape[:1] + (1,) * extra + tangent.shape[1:]) if extra > 0 else tangent
+
+
+def _chain(value, *terms):
+    """Result Dual from (tangent, factor) pairs: tangent = sum(t_i * f_i)."""
+    value = np.asarray(value)
+    tangent = None
+    for t, f in terms:
+        if t is None:
+            continue
+        part = _pad(t, value.ndim) * f
+        tangent = part if tangent is None else tangent + part
+    k = next(t.shape[0] for t, _ in terms if t is not None)
+    shape = (k,) + value.shape
+    if tangent.shape != shape:
+        tangent = np.broadcast_to(tangent, shape)
+    return Dual(value, tangent)
+
+
+_UNARY = {
+    np.negative: lambda v, r: -1.0,
+    np.positive: lambda v, r: 1.0,
+    np.exp: lambda v, r: r,
+    np.expm1: lambda v, r: r + 1.0,
+    np.log: lambda v, r: 1.0 / v,
+    np.log1p: lambda v, r: 1.0 / (1.0 + v),
+    np.sqrt: lambda v, r: 0.5 / r,
+    np.square: lambda v, r: 2.0 * v,
+    np.absolute: lambda v, r: np.sign(v),
+}
+
+
+class Dual:
+    """
+    A value array and its tangents, shape (k,) + value.shape, one row per
+    input being differentiated. Behaves like the value under numpy
+    arithmetic; comparisons and statistics act on the value alone.
+    """
+
+    __array_priority__ = 1000
+
+    def __init__(self, value, tangent):
+        self.value = np.asarray(value, dtype=np.float64)
+        self.tangent = np.asarray(tangent, dtype=np.float64)
+
+    @classmethod
+    def seed(cls, value, index, k):
+        """Input `index` of k: tangent e_index on every path."""
+        value = np.asarray(value, dtype=np.float64)
+        tangent = np.zeros((k,) + value.shape)
+        tangent[index] = 1.0
+        return cls(value, tangent)
+
+    @classmethod
+    def constant(cls, value, k):
+        """Zero-tangent dual (an array the script fills in place); duals pass through."""
+        if isinstance(value, cls):
+            return value
+        value = np.array(value, dtype=np.float64)
+        return cls(value, np.zeros((k,) + value.shape))
+
+    # --- array protocol ---
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if kwargs.get('out') is not None:
+            return NotImplemented
+        if method == 'reduce' and ufunc is np.add:
+            return _sum(inputs[0], **kwargs)
+        if method != '__call__':
+            return NotImplemented
+        vals = [_value(x) for x in inputs]
+        tans = [x.tangent if isinstance(x, Dual) else None for x in inputs]
+        if ufunc in _UNARY:
+            r = ufunc(vals[0])
+            return _chain(r, (tans[0], _UNARY[ufunc](vals[0], r)))
+        if len(inputs) == 2:
+            a, b = vals
+            ta, tb = tans
+            if ufunc is np.add:
+                return _chain(a + b, (ta, 1.0), (tb, 1.0))
+            if ufunc is np.subtract:
+                return _chain(a - b, (ta, 1.0), (tb, -1.0))
+            if ufunc is np.multiply:
+                return _chain(a * b, (ta, b), (tb, a))
+            if ufunc in (np.true_divide, np.divide):
+                r = a / b
+                return _chain(r, (ta, 1.0 / b), (tb, -r / b))
+            if ufunc is np.power:
+                r = a ** b
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    return _chain(r, (ta, b * a ** (b - 1)), (tb, r * np.log(a) if tb is not None else 0.0))
+            if ufunc in (np.maximum, np.fmax, np.minimum, np.fmin):
+                first = (a >= b) if ufunc in (np.maximum, np.fmax) else (a <= b)
+                return _chain(ufunc(a, b), (ta, first), (tb, ~first))
+        if ufunc.nout == 1 and np.dtype(ufunc.types[0][-1]) == np.bool_:
+            _note_compared(*inputs)
+            return ufunc(*vals, **kwargs)  # comparisons, isnan, logical ops
+        raise TypeError(f"Dual: no derivative rule for np.{ufunc.__name__}.")
+
+    def __array_function__(self, func, types, args, kwargs):
+        handler = _FUNCTIONS.get(func)
+        if handler is not None:
+            return handler(*args, **kwargs)
+        if func in _VALUE_ONLY:
+            return func(*(_value(a) for a in args), **kwargs)
+        raise TypeError(f"Dual: np.{func.__name__} is not supported in a differentiated run.")
+
+    def __array__(self, dtype=None, copy=None):
+        raise TypeError("Dual: cannot convert to a plain array (a dual was stored into a float array or "
+                        "passed to a random draw). Leave that variable out of `variables`.")
+
+    # --- python protocol ---
+
+    shape = property(lambda self: self.value.shape)
+    ndim = property(lambda self: self.value.ndim)
+    size = property(lambda self: self.value.size)
+
+    def __len__(self):
+        return len(self.value)
+
+    def __getitem__(self, index):
+        index = index if isinstance(index, tuple) else (index,)
+        return Dual(self.value[index], self.tangent[(slice(None),) + index])
+
+    def __setitem__(self, index, other):
+        index = index if isinstance(index, tuple) else (index,)
+        self.value[index] = _value(other)
+        self.tangent[(slice(None),) + index] = other.tangent if isinstance(other, Dual) else 0.0
+
+    def __float__(self):
+        return float(self.value)
+
+    def __format__(self, spec):
+        return format(self.value.item() if self.value.size == 1 else self.value, spec)
+
+    def __repr__(self):
+        return f"Dual(value={self.value!r}, tangent shape={self.tangent.shape})"
+
+    def sum(self, axis=None):
+        return _sum(self, axis=axis)
+
+    def mean(self, axis=None):
+        return _mean(self, axis=axis)
+
+    __add__ = lambda self, o: np.add(self, o)  # noqa: E731
+    __radd__ = lambda self, o: np.add(o, self)  # noqa: E731
+    __sub__ = lambda self, o: np.subtract(self, o)  # noqa: E731
+    __rsub__ = lambda self, o: np.subtract(o, self)  # noqa: E731
+    __mul__ = lambda self, o: np.multiply(self, o)  # noqa: E731
+    __rmul__ = lambda self, o: np.multiply(o, self)  # noqa: E731
+    __truediv__ = lambda self, o: np.true_divide(self, o)  # noqa: E731
+    __rtruediv__ = lambda self, o: np.true_divide(o, self)  # noqa: E731
+    __pow__ = lambda self, o: np.power(self, o)  # noqa: E731
+    __rpow__ = lambda self, o: np.power(o, self)  # noqa: E731
+    __neg__ = lambda self: np.negative(self)  # noqa: E731
+    __pos__ = lambda self: self  # noqa: E731
+    __abs__ = lambda self: np.absolute(self)  # noqa: E731
+    __lt__ = lambda self, o: np.less(self, o)  # noqa: E731
+    __le__ = lambda self, o: np.less_equal(self, o)  # noqa: E731
+    __gt__ = lambda self, o: np.greater(self, o)  # noqa: E731
+    __ge__ = lambda self, o: np.greater_equal(self, o)  # noqa: E731
+
+
+def _axes(x, axis):
+    """Tangent axes for a value reduction over `axis`."""
+    if axis is None:
+        return tuple(range(1, x.tangent.ndim))
+    axis = axis if isinstance(axis, tuple) else (axis,)
+    return tuple((a % x.value.ndim) + 1 for a in axis)
+
+
+def _sum(x, axis=None, **kwargs):
+    if not isinstance(x, Dual):
+        return np.sum(x, axis=axis, **kwargs)
+    return Dual(x.value.sum(axis=axis), x.tangent.sum(axis=_axes(x, axis)))
+
+
+def _mean(x, axis=None, **kwargs):
+    if not isinstance(x, Dual):
+        return np.mean(x, axis=axis, **kwargs)
+    return Dual(x.value.mean(axis=axis), x.tangent.mean(axis=_axes(x, axis)))
+
+
+def _where(condition, a, b):
+    condition = np.asarray(_value(condition), dtype=bool)
+    r = np.where(condition, _value(a), _value(b))
+    ta = a.tangent if isinstance(a, Dual) else None
+    tb = b.tangent if isinstance(b, Dual) else None
+    return _chain(r, (ta, condition), (tb, ~condition))
+
+
+def _like(fill):
+    def make(x, *args, **kwargs):
+        value = fill(_value(x), *args, **kwargs)
+        return Dual.constant(value, x.tangent.shape[0]) if isinstance(x, Dual) else value
+    return make
+
+
+def _tile(x, reps):
+    if not isinstance(x, Dual):
+        return np.tile(x, reps)
+    reps = tuple(np.atleast_1d(reps))
+    extra = max(0, len(reps) - x.value.ndim)
+    t = x.tangent.reshape(x.tangent.shape[:1] + (1,) * extra + x.value.shape)
+    return Dual(np.tile(x.value, reps), np.tile(t, (1,) + (1,) * max(0, t.ndim - 1 - len(reps)) + reps))
+
+
+def _clip(x, lo, hi, **kwargs):
+    out = x
+    if lo is not None:
+        out = np.maximum(out, lo)
+    if hi is not None:
+        out = np.minimum(out, hi)
+    return out
+
+
+_FUNCTIONS = {
+    np.sum: _sum,
+    np.mean: _mean,
+    np.where: _where,
+    np.clip: _clip,
+    np.tile: _tile,
+    np.zeros_like: _like(np.zeros_like),
+    np.ones_like: _like(np.ones_like),
+    np.full_like: _like(np.full_like),
+    np.empty_like: _like(np.zeros_like),
+}
+_VALUE_ONLY = {np.percentile, np.median, np.quantile, np.corrcoef, np.std, np.var, np.sort, np.argsort,
+               np.histogram, np.isnan, np.isfinite, np.min, np.max, np.amin, np.amax, np.shape, np.size}
+
+
+# --- 2. CHOOSING INPUTS ---
+
+def default_inputs(name, namespace=None):
+    """
+    The model's top-level inputs: per-path draws that read nothing path-valued
+    themselves (so derived arrays like ev_gross are excluded) and float
+    literals (SHARES_OUT = 570.0) that do not feed a random draw.
+    """
+    import os
+
+    from alphawolf.graph import build_nodes
+
+    spec = get_spec(name)
+    if namespace is None:
+        namespace = run_model(name, quiet=True).namespace
+    paths = np.size(namespace[spec.output])
+    nodes = build_nodes(os.path.join(ROOT, spec.script))
+    writers = {}
+    for node in nodes:
+        for var in node.writes:
+            writers.setdefault(var, []).append(node)
+
+    def is_path_array(var, exact=True):
+        value = namespace.get(var)
+        if not (isinstance(value, np.ndarray) and value.dtype.kind == 'f' and value.ndim):
+            return False
+        return value.shape == (paths,) if exact else value.shape[0] == paths
+
+    inputs = []
+    for var, nodes_ in writers.items():
+        if len(nodes_) != 1 or var in (spec.output, spec.price, 'SIMULATIONS') or var.startswith('_'):
+            continue
+        if is_path_array(var):
+            if any(is_path_array(r, exact=False) for r in nodes_[0].reads):
+                continue
+        elif isinstance(namespace.get(var), float):
+            # Literal constants only (not stats like upside_mean), and not draw parameters.
+            if nodes_[0].reads or any(var in n.reads and n.draws for n in nodes):
+                continue
+        else:
+            continue
+        inputs.append(var)
+    return inputs
+
+
+def _accumulators(name, namespace):
+    """Float arrays written by more than one top-level statement (filled in place)."""
+    import os
+
+    from alphawolf.graph import build_nodes
+
+    counts = {}
+    for node in build_nodes(os.path.join(ROOT, get_spec(name).script)):
+        for var in node.writes:
+            counts[var] = counts.get(var, 0) + 1
+    return [v for v, c in counts.items()
+            if c > 1 and isinstance(namespace.get(v), np.ndarray) and namespace[v].dtype.kind == 'f']
+
+
+# --- 3. ONE DIFFERENTIATED RUN ---
+
+def _differentiate(name, variables, simulations, namespace):
+    """One run with every variable seeded; returns (ModelRun, (k,) fed-a-comparison flags)."""
+    k = len(variables)
+    overrides = {var: (lambda v, i=i: Dual.seed(v, i, k)) for i, var in enumerate(variables)}
+    for var in _accumulators(name, namespace):
+        overrides.setdefault(var, lambda v: Dual.constant(v, k))
+    _TRACE['compared'] = np.zeros(k, dtype=bool)
+    try:
+        run = run_model(name, simulations=simulations, quiet=True, overrides=overrides)
+        return run, _TRACE['compared']
+    finally:
+        _TRACE['compared'] = None
+
+
+def sensitivities(name, variables=None, simulations=None):
+    """
+    Pathwise derivatives of the model's fair value with respect to each input.
+
+    variables: script variable names (default: default_inputs). Function-
+               scoped scripts (val_ssw.py, val_FCEL.py) need them named.
+               With the default, inputs a dual cannot pass through are
+               found one by one and reported in `skipped`; named variables
+               raise instead.
+    Returns a Sensitivity; grads[v] is a (paths,) array.
+    """
+    base = run_model(name, simulations=simulations, quiet=True)
+    explicit = variables is not None
+    variables = list(variables) if explicit else default_inputs(name, base.namespace)
+    if not variables:
+        raise ValueError(f"{name}: no top-level inputs found; pass `variables` explicitly.")
+
+    skipped = []
+    runs = 2
+    try:
+        run, compared = _differentiate(name, variables, simulations, base.namespace)
+    except TypeError:
+        if explicit:
+            raise
+        for var in variables:
+            runs += 1
+            try:
+                _differentiate(name, [var], simulations, base.namespace)
+            except TypeError:
+                skipped.append(var)
+        variables = [v for v in variables if v not in skipped]
+        if not variables:
+            raise ValueError(f"{name}: no input can be differentiated pathwise.") from None
+        runs += 1
+        run, compared = _differentiate(name, variables, simulations, base.namespace)
+
+    out = run.namespace[get_spec(name).output]
+    values = np.asarray(_value(out), dtype=np.float64)
+    if isinstance(out, Dual):
+        tangent = np.broadcast_to(out.tangent, (len(variables),) + values.shape)
+        grads = {var: np.array(tangent[i]) for i, var in enumerate(variables)}
+    else:
+        grads = {var: np.zeros_like(values) for var in variables}
+    # Only reached the value through comparisons: a 0 here is not a Greek.
+    for i, var in enumerate(variables):
+        if compared[i] and not grads[var].any():
+            del grads[var]
+            skipped.append(var)
+    return Sensitivity(run.name, values, grads, run.price, skipped, run.seconds, runs)
+
+
+def summarize_grads(sens):
+    """Mean (the Greek) and P10/P50/P90 of each pathwise derivative."""
+    rows = {}
+    for var, g in sens.grads.items():
+        p10, p50, p90 = np.percentile(g, [10, 50, 90])
+        rows[var] = {'mean': float(np.mean(g)), 'p10': float(p10), 'p50': float(p50), 'p90': float(p90)}
+    return rows
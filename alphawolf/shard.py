@@ -0,0 +1,94 @@
+"""
+🐺 ALPHAWOLF: SHARDED EXECUTOR (THE PACK)
+
+One model, many cores. SIMULATIONS is cut into a FIXED number of shards;
+shard i runs the script with its own seed, spawned from one SeedSequence:
+
+    SeedSequence(seed).spawn(shards)[i]  ->  ALPHAWOLF_SEED for shard i
+
+Each shard gets its child's full 128-bit state (four 32-bit words packed
+into one integer), not a 32-bit truncation. The scripts seed the legacy
+np.random global with it as a word array (np.random.seed([w0, w1, w2, w3])),
+so shard streams differ in all 128 bits; plain seeds below 2**32, like the
+default 42, still seed exactly as before.
+
+The shard layout (sizes and seeds) depends only on (simulations, shards,
+seed), never on how many workers there are, so 1 worker or 32 produce the
+same distribution bit for bit; workers only decide which process runs
+which shard.
+
+Workers write their slice straight into a multiprocessing.shared_memory
+block sized for the whole distribution. The parent never receives the
+arrays through a pipe; it just reads the assembled buffer.
+"""
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from alphawolf.models import ModelRun, default_simulations, get_spec, run_model
+
+DEFAULT_SHARDS = 32
+
+# start/stop: slice of the full distribution. seed: ALPHAWOLF_SEED for the shard (128-bit int).
+Shard = namedtuple('Shard', ['index', 'start', 'stop', 'seed'])
+
+
+def plan_shards(simulations, shards=DEFAULT_SHARDS, seed=42):
+    """Fixed shard layout: near-equal slices, one spawned seed each."""
+    shards = max(1, min(int(shards), int(simulations)))
+    bounds = np.linspace(0, simulations, shards + 1).astype(np.int64)
+    children = np.random.SeedSequence(seed).spawn(shards)
+    return [Shard(i, int(bounds[i]), int(bounds[i + 1]), _pack(children[i].generate_state(4)))
+            for i in range(shards)]
+
+
+def _pack(words):
+    """uint32 words (least significant first) -> one int; the scripts unpack it the same way."""
+    return sum(int(w) << (32 * k) for k, w in enumerate(words))
+
+
+def _run_shard(name, shard, shm_name, total):
+    """Worker: run one shard of the script and write it into shared memory."""
+    run = run_model(name, simulations=shard.stop - shard.start, quiet=True, seed=shard.seed)
+    values = np.asarray(run.values, dtype=np.float64).ravel()
+    if values.size != shard.stop - shard.start:
+        raise ValueError(f"{name}: shard {shard.index} returned {values.size} values, "
+                         f"expected {shard.stop - shard.start}.")
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        np.ndarray((total,), dtype=np.float64, buffer=shm.buf)[shard.start:shard.stop] = values
+    finally:
+        shm.close()
+    return run.price, run.seconds
+
+
+def run_sharded(name, simulations=None, shards=DEFAULT_SHARDS, workers=None, seed=42):
+    """
+    Run a registered model across processes; returns a ModelRun.
+
+    simulations: total paths (default: the script's own SIMULATIONS).
+    shards:      fixed shard count (part of the result's identity).
+    workers:     process count (None = os.cpu_count()); does not change results.
+    namespace is None: each shard's namespace lives in its own process.
+    """
+    spec = get_spec(name)
+    total = int(simulations or default_simulations(name))
+    plan = plan_shards(total, shards, seed)
+    workers = min(workers or os.cpu_count() or 1, len(plan))
+
+    start = time.perf_counter()
+    shm = shared_memory.SharedMemory(create=True, size=total * 8)
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_run_shard, [name] * len(plan), plan,
+                                    [shm.name] * len(plan), [total] * len(plan)))
+        values = np.ndarray((total,), dtype=np.float64, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return ModelRun(name.lower(), values, results[0][0], spec.currency, None, time.perf_counter() - start)
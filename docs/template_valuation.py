@@ -1,7 +1,5 @@
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import os
 import sys
 import io
 
@@ -17,8 +15,10 @@ import io
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
-np.random.seed(42)
-SIMULATIONS = 50000
+SEED = int(os.environ.get('ALPHAWOLF_SEED', 42))
+np.random.seed(SEED if SEED < 2 ** 32 else [SEED >> k & 0xFFFFFFFF for k in (0, 32, 64, 96)])
+SIMULATIONS = int(os.environ.get('ALPHAWOLF_SIMULATIONS', 50000))
+PLOT = os.environ.get('ALPHAWOLF_PLOT', '1') == '1'
 
 # --- 1. THE HUNT PARAMETERS (USER INPUTS) ---
 # [USER: UPDATE THESE BEFORE RUNNING]
@@ -80,27 +80,31 @@ prob_profit = np.mean(fair_value_dist > CURRENT_PRICE)
 upside_mean = (mean_val - CURRENT_PRICE) / CURRENT_PRICE
 
 # --- 5. VISUALIZATION (THE MAP) ---
-plt.figure(figsize=(12, 6))
-sns.set_style("whitegrid")
-
-# Main Histogram
-sns.histplot(fair_value_dist, bins=100, kde=True, 
-             color='#2c3e50', stat='density', alpha=0.6, edgecolor=None)
-
-# The Key Levels
-plt.axvline(CURRENT_PRICE, color='red', linestyle='--', linewidth=2.5, label=f'Price: {CURRENT_PRICE:,.2f}')
-plt.axvline(p50, color='gold', linestyle='-', linewidth=2.5, label=f'Median (P50): {p50:,.2f}')
-plt.axvline(p10, color='maroon', linestyle=':', linewidth=2, label=f'Bear (P10): {p10:,.2f}')
-plt.axvline(p90, color='green', linestyle=':', linewidth=2, label=f'Bull (P90): {p90:,.2f}')
-
-plt.title(f'🐺 ALPHAWOLF v12: {TICKER} Valuation Distribution', fontsize=14, fontweight='bold', color='#1a1a1a')
-plt.xlabel('Intrinsic Value Per Share', fontsize=11)
-plt.ylabel('Probability Density', fontsize=11)
-plt.legend(loc='upper right')
-plt.grid(axis='y', alpha=0.3)
-
-# Save high-res
-plt.savefig(f'{TICKER}_wolf_valuation.png', dpi=150)
+if PLOT:
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    plt.figure(figsize=(12, 6))
+    sns.set_style("whitegrid")
+
+    # Main Histogram
+    sns.histplot(fair_value_dist, bins=100, kde=True, 
+                 color='#2c3e50', stat='density', alpha=0.6, edgecolor=None)
+
+    # The Key Levels
+    plt.axvline(CURRENT_PRICE, color='red', linestyle='--', linewidth=2.5, label=f'Price: {CURRENT_PRICE:,.2f}')
+    plt.axvline(p50, color='gold', linestyle='-', linewidth=2.5, label=f'Median (P50): {p50:,.2f}')
+    plt.axvline(p10, color='maroon', linestyle=':', linewidth=2, label=f'Bear (P10): {p10:,.2f}')
+    plt.axvline(p90, color='green', linestyle=':', linewidth=2, label=f'Bull (P90): {p90:,.2f}')
+
+    plt.title(f'🐺 ALPHAWOLF v12: {TICKER} Valuation Distribution', fontsize=14, fontweight='bold', color='#1a1a1a')
+    plt.xlabel('Intrinsic Value Per Share', fontsize=11)
+    plt.ylabel('Probability Density', fontsize=11)
+    plt.legend(loc='upper right')
+    plt.grid(axis='y', alpha=0.3)
+
+    # Save high-res
+    plt.savefig(f'{TICKER}_wolf_valuation.png', dpi=150)
 
 # --- 6. THE REPORT (REGEX FRIENDLY OUTPUT) ---
 # This block is parsed by the Chatbot to generate the Final Alpha Call
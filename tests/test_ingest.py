@@ -0,0 +1,27 @@
+from alphawolf.ledger.ingest import load_exports
+
+HEADER = 'Timestamp (UTC),Currency,Balance delta,Value amount,Description\n'
+FILL = '2024-03-01 10:00:00,XBT,0.01,12000,Bought 0.01 BTC\n'
+SELL = '2024-03-02 09:30:00,XBT,-0.005,6100,Sold 0.005 BTC for R\n'
+
+
+def _write(path, *rows):
+    path.write_text(HEADER + ''.join(rows), encoding='utf-8')
+    return path
+
+
+def test_repeated_row_inside_one_export_is_kept(tmp_path):
+    _write(tmp_path / 'march.csv', FILL, FILL, SELL)
+    merged = load_exports(str(tmp_path), workers=1)
+    assert len(merged) == 3
+    assert (merged['Balance delta'] == 0.01).sum() == 2
+
+
+def test_overlapping_redownload_counts_once(tmp_path):
+    _write(tmp_path / 'a_march.csv', FILL, FILL, SELL)
+    _write(tmp_path / 'b_march_again.csv', FILL, FILL, SELL)
+    _write(tmp_path / 'c_partial.csv', FILL)
+    merged = load_exports(str(tmp_path), workers=1)
+    assert len(merged) == 3
+    assert list(merged['source']) == ['a_march.csv'] * 3
+    assert merged['Timestamp (UTC)'].is_monotonic_increasing
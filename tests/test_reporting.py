@@ -0,0 +1,13 @@
+import pandas as pd
+
+from alphawolf.ledger.reporting import tax_year
+
+
+def test_late_february_utc_is_march_in_sa():
+    stamps = ['2025-02-28 21:59:59', '2025-02-28 22:00:00', '2025-03-01 08:00:00']
+    assert list(tax_year(stamps)) == [2025, 2026, 2026]
+
+
+def test_aware_timestamps_are_converted_not_relabelled():
+    stamps = pd.DatetimeIndex(['2025-02-28 23:30:00']).tz_localize('UTC')
+    assert list(tax_year(stamps)) == [2026]
@@ -1,11 +1,13 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+import os
+
+CURRENT_PRICE = 6.71 # Assumed Spot Price
 
 def alphawolf_sotp_valuation():
     # 1. SETUP
-    np.random.seed(42)
-    SIMULATIONS = 50000
+    SEED = int(os.environ.get('ALPHAWOLF_SEED', 42))
+    np.random.seed(SEED if SEED < 2 ** 32 else [SEED >> k & 0xFFFFFFFF for k in (0, 32, 64, 96)])
+    SIMULATIONS = int(os.environ.get('ALPHAWOLF_SIMULATIONS', 50000))
     SHARES_OUTSTANDING = 24.44e6  # 24.44 Million shares (Dec 2025)
     
     # 2. ASSET A: THE UTILITY (Backlog Discounting)
@@ -61,10 +63,10 @@ def alphawolf_sotp_valuation():
     p10 = np.percentile(fair_value_per_share, 10)
     p50 = np.percentile(fair_value_per_share, 50)
     p90 = np.percentile(fair_value_per_share, 90)
-    prob_profit = np.mean(fair_value_per_share > 6.71) # Assumed Spot Price
+    prob_profit = np.mean(fair_value_per_share > CURRENT_PRICE)
 
     print(f"--- ALPHAWOLF VALUATION OUTPUT ---")
-    print(f"Spot Price Reference: $6.71")
+    print(f"Spot Price Reference: ${CURRENT_PRICE}")
     print(f"P10 (The 'Trap'):     ${p10:.2f}")
     print(f"P50 (Fair Value):     ${p50:.2f}")
     print(f"P90 (The 'Alpha'):    ${p90:.2f}")
@@ -75,4 +77,6 @@ def alphawolf_sotp_valuation():
     print(f"Correlation (Value vs Product Sales): {np.corrcoef(fair_value_per_share, prod_sales_26)[0,1]:.2f}")
     print(f"Correlation (Value vs Moonshot):      {np.corrcoef(fair_value_per_share, val_moonshot)[0,1]:.2f}")
 
-alphawolf_sotp_valuation()
\ No newline at end of file
+    return fair_value_per_share
+
+fair_value_per_share = alphawolf_sotp_valuation()
\ No newline at end of file
@@ -1,6 +1,5 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+import os
 import sys
 import io
 
@@ -12,8 +11,10 @@ import io
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
-np.random.seed(42)
-SIMULATIONS = 50000
+SEED = int(os.environ.get('ALPHAWOLF_SEED', 42))
+np.random.seed(SEED if SEED < 2 ** 32 else [SEED >> k & 0xFFFFFFFF for k in (0, 32, 64, 96)])
+SIMULATIONS = int(os.environ.get('ALPHAWOLF_SIMULATIONS', 50000))
+PLOT = os.environ.get('ALPHAWOLF_PLOT', '1') == '1'
 
 # --- 1. SETTING THE SCENE (PARAMETERS) ---
 CURRENT_PRICE = 5.97 # Reference Price USD
@@ -105,21 +106,25 @@ print(f"PROBABILITY OF PROFIT: {prob_profit:.1%}")
 print(f"Expected Upside (Mean): {upside_mean:.1%}")
 
 # --- 8. VISUALIZATION ---
-plt.figure(figsize=(12, 6))
-sns.histplot(fair_value_per_share, bins=100, kde=True, color='#2c3e50', stat='density', alpha=0.6)
-
-# Annotations
-plt.axvline(CURRENT_PRICE, color='red', linestyle='--', linewidth=2, label=f'Price (${CURRENT_PRICE})')
-plt.axvline(p50, color='gold', linestyle='-', linewidth=2, label=f'Median (${p50:.2f})')
-plt.axvline(p10, color='maroon', linestyle=':', linewidth=2, label=f'P10 Bear (${p10:.2f})')
-plt.axvline(p90, color='green', linestyle=':', linewidth=2, label=f'P90 Bull (${p90:.2f})')
-
-plt.title('ASPI: Real Options Valuation Distribution', fontsize=16, fontweight='bold', color='#1a1a1a')
-plt.xlabel('Fair Value Per Share ($)', fontsize=12)
-plt.ylabel('Probability Density', fontsize=12)
-plt.legend()
-plt.grid(axis='y', alpha=0.3)
-plt.xlim(0, 18)
-
-# Save
-plt.savefig('val_aspi_dist.png')
+if PLOT:
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    plt.figure(figsize=(12, 6))
+    sns.histplot(fair_value_per_share, bins=100, kde=True, color='#2c3e50', stat='density', alpha=0.6)
+
+    # Annotations
+    plt.axvline(CURRENT_PRICE, color='red', linestyle='--', linewidth=2, label=f'Price (${CURRENT_PRICE})')
+    plt.axvline(p50, color='gold', linestyle='-', linewidth=2, label=f'Median (${p50:.2f})')
+    plt.axvline(p10, color='maroon', linestyle=':', linewidth=2, label=f'P10 Bear (${p10:.2f})')
+    plt.axvline(p90, color='green', linestyle=':', linewidth=2, label=f'P90 Bull (${p90:.2f})')
+
+    plt.title('ASPI: Real Options Valuation Distribution', fontsize=16, fontweight='bold', color='#1a1a1a')
+    plt.xlabel('Fair Value Per Share ($)', fontsize=12)
+    plt.ylabel('Probability Density', fontsize=12)
+    plt.legend()
+    plt.grid(axis='y', alpha=0.3)
+    plt.xlim(0, 18)
+
+    # Save
+    plt.savefig('val_aspi_dist.png')
@@ -1,7 +1,5 @@
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import os
 import sys
 import io
 
@@ -15,8 +13,10 @@ if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 # The Wolf's Code: Reproducibility
-np.random.seed(42)
-SIMULATIONS = 50000
+SEED = int(os.environ.get('ALPHAWOLF_SEED', 42))
+np.random.seed(SEED if SEED < 2 ** 32 else [SEED >> k & 0xFFFFFFFF for k in (0, 32, 64, 96)])
+SIMULATIONS = int(os.environ.get('ALPHAWOLF_SIMULATIONS', 50000))
+PLOT = os.environ.get('ALPHAWOLF_PLOT', '1') == '1'
 
 # --- 1. SETTING THE SCENE (CONSTANTS) ---
 # All figures in ZAR Millions unless per share
@@ -116,20 +116,24 @@ print(f"PROBABILITY OF PROFIT: {prob_profit:.1%}")
 print(f"Expected Upside (Mean): {upside_mean:.1%}")
 
 # --- 8. VISUALIZATION ---
-plt.figure(figsize=(12, 6))
-sns.histplot(fair_value_per_share, bins=100, kde=True, color='#2c3e50', stat='density', alpha=0.6)
-
-# Annotations
-plt.axvline(CURRENT_PRICE, color='red', linestyle='--', linewidth=2, label=f'Price (R{CURRENT_PRICE})')
-plt.axvline(p50, color='gold', linestyle='-', linewidth=2, label=f'Median (R{p50:.2f})')
-plt.axvline(p10, color='maroon', linestyle=':', linewidth=2, label=f'P10 Bear (R{p10:.2f})')
-plt.axvline(p90, color='green', linestyle=':', linewidth=2, label=f'P90 Bull (R{p90:.2f})')
-
-plt.title('Boxer Retail: Valuation Distribution', fontsize=16, fontweight='bold', color='#1a1a1a')
-plt.xlabel('Fair Value Per Share (ZAR)', fontsize=12)
-plt.ylabel('Probability Density', fontsize=12)
-plt.legend()
-plt.grid(axis='y', alpha=0.3)
-
-# Save
-plt.savefig('val_boxer_dist.png')
+if PLOT:
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    plt.figure(figsize=(12, 6))
+    sns.histplot(fair_value_per_share, bins=100, kde=True, color='#2c3e50', stat='density', alpha=0.6)
+
+    # Annotations
+    plt.axvline(CURRENT_PRICE, color='red', linestyle='--', linewidth=2, label=f'Price (R{CURRENT_PRICE})')
+    plt.axvline(p50, color='gold', linestyle='-', linewidth=2, label=f'Median (R{p50:.2f})')
+    plt.axvline(p10, color='maroon', linestyle=':', linewidth=2, label=f'P10 Bear (R{p10:.2f})')
+    plt.axvline(p90, color='green', linestyle=':', linewidth=2, label=f'P90 Bull (R{p90:.2f})')
+
+    plt.title('Boxer Retail: Valuation Distribution', fontsize=16, fontweight='bold', color='#1a1a1a')
+    plt.xlabel('Fair Value Per Share (ZAR)', fontsize=12)
+    plt.ylabel('Probability Density', fontsize=12)
+    plt.legend()
+    plt.grid(axis='y', alpha=0.3)
+
+    # Save
+    plt.savefig('val_boxer_dist.png')
@@ -1,10 +1,11 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+import os
 
 # SYSTEM IDENTITY: ALPHAWOLF CORE ENGINE
-np.random.seed(42)
-SIMULATIONS = 10000
+SEED = int(os.environ.get('ALPHAWOLF_SEED', 42))
+np.random.seed(SEED if SEED < 2 ** 32 else [SEED >> k & 0xFFFFFFFF for k in (0, 32, 64, 96)])
+SIMULATIONS = int(os.environ.get('ALPHAWOLF_SIMULATIONS', 10000))
+PLOT = os.environ.get('ALPHAWOLF_PLOT', '1') == '1'
 
 # --- INPUTS ---
 # Shares Outstanding (Millions)
@@ -13,6 +14,8 @@ SHARES_OUT = 157.0
 NET_DEBT = 2800.0 
 # Tax Rate
 TAX_RATE = 0.21
+# Current Market Price ($)
+CURRENT_PRICE = 164.26
 # WACC Distribution (Triangular: Min, Mode, Max)
 wacc_dist = np.random.triangular(0.085, 0.098, 0.110, SIMULATIONS)
 
@@ -86,18 +89,22 @@ p50 = np.percentile(price_per_share, 50)
 p90 = np.percentile(price_per_share, 90)
 
 print(f"ALPHAWOLF VALUATION // COHR")
-print(f"Current Market Price: ~$164.26")
+print(f"Current Market Price: ~${CURRENT_PRICE}")
 print(f"---")
 print(f"P10 (Bear): ${p10:.2f}")
 print(f"P50 (Base): ${p50:.2f}")
 print(f"P90 (Bull): ${p90:.2f}")
-print(f"Probability of Upside: {np.mean(price_per_share > 164.26) * 100:.1f}%")
+print(f"Probability of Upside: {np.mean(price_per_share > CURRENT_PRICE) * 100:.1f}%")
 
 # Plotting (Simulated for visual context in text response)
-plt.figure(figsize=(12, 6))
-sns.histplot(price_per_share, color='#2c3e50', kde=True)
-plt.title('COHR: Valuation Distribution', fontsize=16, fontweight='bold', color='#1a1a1a')
-plt.xlabel('Fair Value Per Share', fontsize=12)
-plt.ylabel('Probability Density', fontsize=12)
-plt.grid(axis='y', alpha=0.3)
-plt.savefig('val_cohr_dist.png')
\ No newline at end of file
+if PLOT:
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    plt.figure(figsize=(12, 6))
+    sns.histplot(price_per_share, color='#2c3e50', kde=True)
+    plt.title('COHR: Valuation Distribution', fontsize=16, fontweight='bold', color='#1a1a1a')
+    plt.xlabel('Fair Value Per Share', fontsize=12)
+    plt.ylabel('Probability Density', fontsize=12)
+    plt.grid(axis='y', alpha=0.3)
+    plt.savefig('val_cohr_dist.png')
\ No newline at end of file
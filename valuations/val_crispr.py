@@ -1,10 +1,10 @@
 import numpy as np
-import seaborn as sns
-import matplotlib.pyplot as plt
+import os
 
 # 1. Setup
-np.random.seed(42)
-SIMULATIONS = 50000
+SEED = int(os.environ.get('ALPHAWOLF_SEED', 42))
+np.random.seed(SEED if SEED < 2 ** 32 else [SEED >> k & 0xFFFFFFFF for k in (0, 32, 64, 96)])
+SIMULATIONS = int(os.environ.get('ALPHAWOLF_SIMULATIONS', 50000))
 
 # --- INPUTS BASED ON CONFIRMED FACTS (Q3 2025) ---
 shares_outstanding = 91.0e6  # 91 Million Shares
@@ -1,9 +1,11 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+import os
 import sys
 import io
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from alphawolf.fx import fx_scenarios
+
 # 🐺 ALPHA WOLF: GLENCORE (SOTP/Resource)
 # Target: LSE/JSE: GLN
 # Objective: Value Marketing (Annuity) vs Industrial (Cyclical)
@@ -12,8 +14,10 @@ import io
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
-np.random.seed(42)
-SIMULATIONS = 50000
+SEED = int(os.environ.get('ALPHAWOLF_SEED', 42))
+np.random.seed(SEED if SEED < 2 ** 32 else [SEED >> k & 0xFFFFFFFF for k in (0, 32, 64, 96)])
+SIMULATIONS = int(os.environ.get('ALPHAWOLF_SIMULATIONS', 50000))
+PLOT = os.environ.get('ALPHAWOLF_PLOT', '1') == '1'
 
 # --- 1. SETTING THE SCENE (CONSTANTS) ---
 SHARES_OUT = 12.15  # Billions
@@ -34,7 +38,7 @@ industrial_ebitda = np.random.triangular(10.0, 13.0, 17.5, SIMULATIONS)
 valuation_multiple = np.random.triangular(3.2, 4.5, 6.0, SIMULATIONS)
 
 # D. USD/ZAR Exchange Rate - The Currency Risk
-usd_zar = np.random.normal(17.25, 0.75, SIMULATIONS)
+usd_zar = fx_scenarios(SIMULATIONS, seed=SEED)['USDZAR']  # Shared, correlated FX world (alphawolf/fx.py)
 
 # E. Net Debt ($ Billions)
 net_debt = np.random.normal(14.5, 0.5, SIMULATIONS)
@@ -77,20 +81,24 @@ print(f"PROBABILITY OF PROFIT: {prob_profit:.1%}")
 print(f"Expected Upside (Mean): {upside_mean:.1%}")
 
 # --- 6. VISUALIZATION ---
-plt.figure(figsize=(12, 6))
-sns.histplot(fair_value_zar, bins=100, kde=True, color='#2c3e50', stat='density', alpha=0.6)
-
-# Annotations
-plt.axvline(CURRENT_PRICE, color='red', linestyle='--', linewidth=2, label=f'Price (R{CURRENT_PRICE})')
-plt.axvline(p50, color='gold', linestyle='-', linewidth=2, label=f'Median (R{p50:.2f})')
-plt.axvline(p10, color='maroon', linestyle=':', linewidth=2, label=f'P10 Bear (R{p10:.2f})')
-plt.axvline(p90, color='green', linestyle=':', linewidth=2, label=f'P90 Bull (R{p90:.2f})')
-
-plt.title('Glencore: SOTP/NAV Valuation Distribution (ZAR)', fontsize=16, fontweight='bold', color='#1a1a1a')
-plt.xlabel('Fair Value Per Share (ZAR)', fontsize=12)
-plt.ylabel('Probability Density', fontsize=12)
-plt.legend()
-plt.grid(axis='y', alpha=0.3)
-
-# Save
-plt.savefig('val_glencore_dist.png')
+if PLOT:
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    plt.figure(figsize=(12, 6))
+    sns.histplot(fair_value_zar, bins=100, kde=True, color='#2c3e50', stat='density', alpha=0.6)
+
+    # Annotations
+    plt.axvline(CURRENT_PRICE, color='red', linestyle='--', linewidth=2, label=f'Price (R{CURRENT_PRICE})')
+    plt.axvline(p50, color='gold', linestyle='-', linewidth=2, label=f'Median (R{p50:.2f})')
+    plt.axvline(p10, color='maroon', linestyle=':', linewidth=2, label=f'P10 Bear (R{p10:.2f})')
+    plt.axvline(p90, color='green', linestyle=':', linewidth=2, label=f'P90 Bull (R{p90:.2f})')
+
+    plt.title('Glencore: SOTP/NAV Valuation Distribution (ZAR)', fontsize=16, fontweight='bold', color='#1a1a1a')
+    plt.xlabel('Fair Value Per Share (ZAR)', fontsize=12)
+    plt.ylabel('Probability Density', fontsize=12)
+    plt.legend()
+    plt.grid(axis='y', alpha=0.3)
+
+    # Save
+    plt.savefig('val_glencore_dist.png')
@@ -1,8 +1,10 @@
 import numpy as np
+import os
 
 # ALPHAWOLF v12 CORE ENGINE // GOOGL SOTP SIMULATION
-np.random.seed(42)
-SIMULATIONS = 50000
+SEED = int(os.environ.get('ALPHAWOLF_SEED', 42))
+np.random.seed(SEED if SEED < 2 ** 32 else [SEED >> k & 0xFFFFFFFF for k in (0, 32, 64, 96)])
+SIMULATIONS = int(os.environ.get('ALPHAWOLF_SIMULATIONS', 50000))
 
 # 1. SETUP VARIABLES (The Distributions)
 # Search EBIT (Mature, Stable-ish)
@@ -1,10 +1,11 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+import os
 
 # 1. SETUP
-np.random.seed(42)
-SIMULATIONS = 10000
+SEED = int(os.environ.get('ALPHAWOLF_SEED', 42))
+np.random.seed(SEED if SEED < 2 ** 32 else [SEED >> k & 0xFFFFFFFF for k in (0, 32, 64, 96)])
+SIMULATIONS = int(os.environ.get('ALPHAWOLF_SIMULATIONS', 10000))
+PLOT = os.environ.get('ALPHAWOLF_PLOT', '1') == '1'
 CURRENT_PRICE = 648.00 # As of Dec 1, 2025
 
 # --- SEGMENT 1: FAMILY OF APPS (THE CASH COW) ---
@@ -95,11 +96,15 @@ print(f"Bull Case (P90):         ${p90:.2f}")
 print(f"Edge:                    {((p50 - CURRENT_PRICE)/CURRENT_PRICE)*100:.2f}%")
 
 # Visualization
-plt.figure(figsize=(12, 6))
-sns.histplot(fair_value_per_share, bins=100, kde=True, color='#00A884', element="step")
-plt.axvline(CURRENT_PRICE, color='red', linestyle='--', label=f'Spot: ${CURRENT_PRICE}')
-plt.axvline(p50, color='gold', linestyle='-', label=f'Fair Value: ${p50:.0f}')
-plt.title('Meta Platforms: Sum-of-the-Parts Simulation (FOA + RL)')
-plt.xlabel('Fair Value per Share (USD)')
-plt.legend()
-plt.show()
\ No newline at end of file
+if PLOT:
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    plt.figure(figsize=(12, 6))
+    sns.histplot(fair_value_per_share, bins=100, kde=True, color='#00A884', element="step")
+    plt.axvline(CURRENT_PRICE, color='red', linestyle='--', label=f'Spot: ${CURRENT_PRICE}')
+    plt.axvline(p50, color='gold', linestyle='-', label=f'Fair Value: ${p50:.0f}')
+    plt.title('Meta Platforms: Sum-of-the-Parts Simulation (FOA + RL)')
+    plt.xlabel('Fair Value per Share (USD)')
+    plt.legend()
+    plt.show()
\ No newline at end of file
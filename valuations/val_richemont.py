@@ -1,10 +1,11 @@
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import os
 import sys
 import io
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from alphawolf.fx import fx_scenarios
+
 # 🐺 ALPHA WOLF: RICHEMONT (Holding Co Discount)
 # Target: JSE: CFR
 # Objective: SOTP with specific Holding Discount logic
@@ -13,8 +14,10 @@ import io
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
-np.random.seed(42)
-SIMULATIONS = 50000
+SEED = int(os.environ.get('ALPHAWOLF_SEED', 42))
+np.random.seed(SEED if SEED < 2 ** 32 else [SEED >> k & 0xFFFFFFFF for k in (0, 32, 64, 96)])
+SIMULATIONS = int(os.environ.get('ALPHAWOLF_SIMULATIONS', 50000))
+PLOT = os.environ.get('ALPHAWOLF_PLOT', '1') == '1'
 
 # --- 1. SETTING THE SCENE (CONSTANTS) ---
 SHARES_OUT = 570.0 # Million
@@ -46,7 +49,7 @@ net_cash = 6500 # €6.5bn
 holding_discount = np.random.uniform(0.05, 0.15, SIMULATIONS)
 
 # E. The Currency (The Rand Hedge)
-eur_zar = np.random.normal(20.50, 1.5, SIMULATIONS)
+eur_zar = fx_scenarios(SIMULATIONS, seed=SEED)['EURZAR']  # Shared, correlated FX world (alphawolf/fx.py)
 
 # --- 3. THE ENGINE (CALCULATIONS) ---
 # Gross Enterprise Value
@@ -80,20 +83,24 @@ print(f"PROBABILITY OF PROFIT: {prob_profit:.1%}")
 print(f"Expected Upside (Mean): {upside_mean:.1%}")
 
 # --- 6. VISUALIZATION ---
-plt.figure(figsize=(12, 6))
-sns.histplot(fair_value_zar, bins=100, kde=True, color='#2c3e50', stat='density', alpha=0.6)
-
-# Annotations
-plt.axvline(CURRENT_PRICE, color='red', linestyle='--', linewidth=2, label=f'Price (R{CURRENT_PRICE:,.0f})')
-plt.axvline(p50, color='gold', linestyle='-', linewidth=2, label=f'Median (R{p50:,.0f})')
-plt.axvline(p10, color='maroon', linestyle=':', linewidth=2, label=f'P10 Bear (R{p10:,.0f})')
-plt.axvline(p90, color='green', linestyle=':', linewidth=2, label=f'P90 Bull (R{p90:,.0f})')
-
-plt.title('Richemont: SOTP Valuation Distribution (ZAR)', fontsize=16, fontweight='bold', color='#1a1a1a')
-plt.xlabel('Fair Value Per Share (ZAR)', fontsize=12)
-plt.ylabel('Probability Density', fontsize=12)
-plt.legend()
-plt.grid(axis='y', alpha=0.3)
-
-# Save
-plt.savefig('val_richemont_dist.png')
+if PLOT:
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    plt.figure(figsize=(12, 6))
+    sns.histplot(fair_value_zar, bins=100, kde=True, color='#2c3e50', stat='density', alpha=0.6)
+
+    # Annotations
+    plt.axvline(CURRENT_PRICE, color='red', linestyle='--', linewidth=2, label=f'Price (R{CURRENT_PRICE:,.0f})')
+    plt.axvline(p50, color='gold', linestyle='-', linewidth=2, label=f'Median (R{p50:,.0f})')
+    plt.axvline(p10, color='maroon', linestyle=':', linewidth=2, label=f'P10 Bear (R{p10:,.0f})')
+    plt.axvline(p90, color='green', linestyle=':', linewidth=2, label=f'P90 Bull (R{p90:,.0f})')
+
+    plt.title('Richemont: SOTP Valuation Distribution (ZAR)', fontsize=16, fontweight='bold', color='#1a1a1a')
+    plt.xlabel('Fair Value Per Share (ZAR)', fontsize=12)
+    plt.ylabel('Probability Density', fontsize=12)
+    plt.legend()
+    plt.grid(axis='y', alpha=0.3)
+
+    # Save
+    plt.savefig('val_richemont_dist.png')
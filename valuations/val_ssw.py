@@ -1,14 +1,16 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+import os
 
 # SYSTEM: ALPHAWOLF CORE ENGINE
 # TARGET: SIBANYE-STILLWATER (JSE: SSW)
 # DATE: DEC 3, 2025
 
+CURRENT_PRICE = 56.82
+
 def run_simulation():
-    np.random.seed(42)
-    SIMULATIONS = 10000
+    SEED = int(os.environ.get('ALPHAWOLF_SEED', 42))
+    np.random.seed(SEED if SEED < 2 ** 32 else [SEED >> k & 0xFFFFFFFF for k in (0, 32, 64, 96)])
+    SIMULATIONS = int(os.environ.get('ALPHAWOLF_SIMULATIONS', 10000))
     
     # --- VARIABLES (The Drivers) ---
     # 1. Commodity Prices (ZAR Basket normalization factor)
@@ -55,7 +57,7 @@ def run_simulation():
     p50 = np.percentile(fair_value_per_share, 50)
     p90 = np.percentile(fair_value_per_share, 90)
     
-    current_price = 56.82
+    current_price = CURRENT_PRICE
     prob_profit = np.mean(fair_value_per_share > current_price) * 100
     
     print(f"--- ALPHAWOLF MONTE CARLO RESULTS (n={SIMULATIONS}) ---")
@@ -66,4 +68,6 @@ def run_simulation():
     print(f"Probability of Profit: {prob_profit:.1f}%")
     print(f"Estimated Edge:       {((p50 - current_price)/current_price)*100:.1f}%")
 
-run_simulation()
\ No newline at end of file
+    return fair_value_per_share
+
+fair_value_per_share = run_simulation()
\ No newline at end of file
@@ -1,11 +1,11 @@
 import numpy as np
-import seaborn as sns
-import matplotlib.pyplot as plt
-import pandas as pd
+import os
 
 # 1. Setup
-np.random.seed(42)
-SIMULATIONS = 10000
+SEED = int(os.environ.get('ALPHAWOLF_SEED', 42))
+np.random.seed(SEED if SEED < 2 ** 32 else [SEED >> k & 0xFFFFFFFF for k in (0, 32, 64, 96)])
+SIMULATIONS = int(os.environ.get('ALPHAWOLF_SIMULATIONS', 10000))
+PLOT = os.environ.get('ALPHAWOLF_PLOT', '1') == '1'
 SHARES_OUTSTANDING = 3.35  # Billion
 
 # 2. Distributions (The Drivers)
@@ -79,14 +79,18 @@ print(f"P90: {p90}")
 print(f"Prob Alpha: {prob_alpha}")
 
 # 4. Visualization
-plt.figure(figsize=(10, 6))
-sns.histplot(fair_value_dist, bins=100, kde=True, color='#2c3e50', stat='density', alpha=0.6, edgecolor=None)
-plt.axvline(x=p50, color='blue', linestyle='--', label=f'Fair Value (P50): ${p50:.2f}')
-plt.axvline(x=current_price, color='red', linestyle='-', label=f'Current Price: ${current_price:.2f}')
-plt.title(f'TSLA: AlphaWolf SOTP Monte Carlo (10,000 Paths)', fontsize=14)
-plt.xlabel('Fair Value per Share ($)')
-plt.ylabel('Density')
-plt.legend()
-plt.grid(True, alpha=0.3)
-plt.xlim(0, 1000) # Cap display to keep chart readable
-plt.savefig('tsla_monte_carlo.png')
\ No newline at end of file
+if PLOT:
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    plt.figure(figsize=(10, 6))
+    sns.histplot(fair_value_dist, bins=100, kde=True, color='#2c3e50', stat='density', alpha=0.6, edgecolor=None)
+    plt.axvline(x=p50, color='blue', linestyle='--', label=f'Fair Value (P50): ${p50:.2f}')
+    plt.axvline(x=current_price, color='red', linestyle='-', label=f'Current Price: ${current_price:.2f}')
+    plt.title(f'TSLA: AlphaWolf SOTP Monte Carlo (10,000 Paths)', fontsize=14)
+    plt.xlabel('Fair Value per Share ($)')
+    plt.ylabel('Density')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+    plt.xlim(0, 1000) # Cap display to keep chart readable
+    plt.savefig('tsla_monte_carlo.png')
\ No newline at end of file